@@ -2,20 +2,29 @@ import tkinter as tk
 from tkinter import ttk
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
-import random
+
+from rr_engine import derive_seed, make_engine, variant_workload
+from rr_gui import LodGanttView, PlaybackRows, Player, PlayerControls, VirtualTree
 
 class RoundRobinSimulator:
     def __init__(self, root):
         self.root = root
         self.root.title("Simulador Round Robin")
         self.root.config(bg="gray")  # Cambia el color de fondo de la ventana principal a gris
-        self.quantum = 5
-        self.time = 0
-        self.processes = []
-        self.gantt_chart_data = []
-        self.semaphore = 1
+        # El motor guarda los procesos, el tiempo global y el diagrama de Gantt
+        # Prioridad estricta sobre un montículo; cada 10 unidades de espera un
+        # proceso sube un nivel para que los de baja prioridad no se mueran de hambre
+        self.engine = make_engine("prioridad", quantum=5, priority_queue="heap", aging=10)
+        # El motor calcula por adelantado y el reproductor muestra, cuadro a
+        # cuadro con after(), el instante que corresponde a la velocidad elegida
+        self.player = Player(self.root, self.engine, self.on_frame)
+        # Procesos que ya llegaron en el instante mostrado, en orden de llegada
+        self.rows = PlaybackRows(self.player)
+        # Procesos del botón "Agregar Proceso" y de "Generar Carga" (llegadas
+        # de Poisson, ráfagas cortas y largas), con flujos de la semilla del motor
+        self.workload = variant_workload("prioridad", seed=self.engine.streams)
+        self.generator = variant_workload("prioridad", seed=derive_seed(self.engine.streams.seed, "carga"),
+                                          arrivals="poisson", rate=0.2, bursts="bimodal")
 
         # Configurar interfaz
         self.setup_ui()
@@ -60,7 +69,12 @@ class RoundRobinSimulator:
         self.tree.tag_configure('oddrow', background="lightgray")  # Fondo gris para filas impares
         self.tree.tag_configure('evenrow', background="lightgray")  # Fondo gris para filas pares
 
+        # Barra de desplazamiento manejada por la tabla virtual
+        scrollbar = ttk.Scrollbar(left_frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.tree.pack(fill=tk.BOTH, expand=True)
+        # Sólo existen como ítems las filas visibles; el resto se actualiza al desplazarse
+        self.table = VirtualTree(self.tree, scrollbar)
 
         # Marco para controles y gráfico de Gantt (debajo de la tabla)
         bottom_frame = tk.Frame(main_frame, bg="lightgray")  # Cambia el color de fondo del marco inferior a gris
@@ -79,6 +93,9 @@ class RoundRobinSimulator:
         self.ax.set_facecolor('lightgray')  # Fondo gris para el gráfico de Gantt
         self.canvas = FigureCanvasTkAgg(self.figure, right_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Zoom con la rueda, arrastre para desplazar y doble clic para ver todo;
+        # alejado se dibuja la ocupación agregada en lugar de cada segmento
+        self.gantt = LodGanttView(self.ax, self.canvas, grid_color="lightgray")
 
         # Marco para controles y semáforo
         control_frame = tk.Frame(bottom_frame, bg="lightgray")  # Cambia el color de fondo del marco de controles a gris
@@ -92,137 +109,77 @@ class RoundRobinSimulator:
         button_frame = tk.Frame(control_frame, bg="lightgray")  # Cambia el color de fondo del marco de botones a gris
         button_frame.pack(fill=tk.X, pady=5)
         tk.Button(button_frame, text="Agregar Proceso", command=self.add_process).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Generar Carga", command=self.generate_load).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Iniciar", command=self.start_simulation).pack(side=tk.LEFT, padx=5)
+        # Cantidad de CPUs simuladas (se fija al iniciar)
+        tk.Label(button_frame, text="CPUs:", bg="lightgray").pack(side=tk.LEFT)
+        self.cores_spinbox = tk.Spinbox(button_frame, from_=1, to=16, width=3)
+        self.cores_spinbox.pack(side=tk.LEFT, padx=5)
+        # Costo de cada cambio de contexto (se dibuja en gris en el Gantt)
+        tk.Label(button_frame, text="Cambio de contexto:", bg="lightgray").pack(side=tk.LEFT)
+        self.switch_spinbox = tk.Spinbox(button_frame, from_=0, to=5, width=3)
+        self.switch_spinbox.pack(side=tk.LEFT, padx=5)
+        # Pausa, paso a paso, velocidad (1x a 10000x o máxima) y posición
+        self.controls = PlayerControls(control_frame, self.player)
+        self.controls.pack(fill=tk.X, pady=5)
 
     def add_process(self):
-        process_id = len(self.processes) + 1
-        arrival_time = self.time
-        burst_time = random.randint(5, 15)  # Duración aleatoria
-        priority = random.randint(1, 5)  # Prioridad aleatoria (1 = más alta)
-        self.processes.append({
-            "id": process_id,
-            "arrival": arrival_time,
-            "burst": burst_time,
-            "priority": priority,  # Asegúrate de agregar esta clave
-            "start": None,
-            "end": None,
-            "turnaround": None,
-            "waiting": None,
-            "remaining": burst_time,
-            "state": "Listo",
-            "executions": []  # Añadir la clave "executions" como lista vacía
-        })
+        # El proceso llega en el instante actual de la simulación, con una
+        # ráfaga aleatoria entre 5 y 15 y una prioridad entre 1 (más alta) y 5
+        self.player.add_columns(**self.workload.batch(1, start=self.engine.time))
+        self.update_table()
+
+    def generate_load(self):
+        # Veinte procesos que empiezan a llegar desde el instante actual
+        self.player.add_columns(**self.generator.batch(20, start=self.engine.time))
         self.update_table()
 
     def update_table(self):
-        # Usamos after() para asegurar que la actualización de la tabla se ejecute en el hilo principal
-        self.root.after(0, self._update_table)
+        self.player.refresh()
 
     def _update_table(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        for i, p in enumerate(self.processes):
-            execution_str = ", ".join(p["executions"]) if p["executions"] else "-"
-            row_tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.tree.insert(
-                "",
-                "end",
-                values=(p["id"], p["arrival"], p["burst"], p["priority"], p["start"] if p["start"] is not None else "-",
-                        p["end"] if p["end"] is not None else "-", p["turnaround"] if p["turnaround"] is not None else "-",
-                        p["waiting"] if p["waiting"] is not None else "-", p["state"], execution_str),
-                tags=(row_tag,)
-            )
-
-
-    def update_gantt_chart(self):
-        self.ax.clear()
-        self.ax.set_title("Diagrama de Gantt")
-        self.ax.set_xlabel("Tiempo")
-        self.ax.set_ylabel("Procesos")
-
-        self.ax.grid(axis="both", linestyle="--", linewidth=0.5, color="lightgray", alpha=0.7)
-
-        process_ids = sorted(set(data["id"] for data in self.gantt_chart_data))
-        self.ax.set_yticks(process_ids)
-        self.ax.set_yticklabels([f"Proceso {pid}" for pid in process_ids])
-
-        for process in self.gantt_chart_data:
-            self.ax.broken_barh(
-                [(process["start"], process["duration"])],
-                (process["id"] - 0.4, 0.8),
-                facecolors="tab:purple"
-            )
-
-        self.canvas.draw()
+        # Una fila por cada proceso que ya llegó en el instante mostrado,
+        # identificada por su índice en la tabla del motor
+        self.table.refresh_count(self.rows.update(), self.rows.key, self._row_values)
+
+    def _row_values(self, index):
+        p = self.engine.processes[index]
+        # Valores en el instante que muestra el reproductor
+        start, end, turnaround, waiting, state = self.player.process_at(index)
+        executions = [self.engine.timeline[s].interval for s in self.player.segments_of(index)]
+        execution_str = ", ".join(executions) if executions else "-"
+        row_tag = 'evenrow' if index % 2 == 0 else 'oddrow'
+        return (p.id, p.arrival, p.burst, p.priority, start if start is not None else "-",
+                end if end is not None else "-", turnaround if turnaround is not None else "-",
+                waiting if waiting is not None else "-", state, execution_str), (row_tag,)
+
+    def update_gantt_chart(self, t=None):
+        self.gantt.update(self.engine.timeline, self.engine.overhead, until=t)
 
     def start_simulation(self):
-        threading.Thread(target=self.run_round_robin).start()
-            
-    def run_round_robin(self):
-        while any(p["remaining"] > 0 for p in self.processes):
-            self.processes.sort(key=lambda x: (x["priority"], x["arrival"]))
-
-            for process in self.processes:
-                if process["remaining"] > 0:
-                    # Manejo de bloqueos
-                    if process["state"] == "Bloqueado":
-                        process["block_time"] -= 1
-                        if process["block_time"] <= 0:
-                            process["state"] = "Listo"
-                        continue
-
-                    # Control de semáforo
-                    if self.semaphore == 1:
-                        self.semaphore = 0
-                        self.semaphore_label.config(text="Semáforo: Ocupado", bg="red")
-                        self.root.update_idletasks()
-
-                        if process["start"] is None:
-                            process["start"] = max(self.time, process["arrival"])
-
-                        executed_time = 0
-                        execution_start = self.time  # Marcar inicio de la ejecución parcial
-
-                        for _ in range(self.quantum):
-                            if process["remaining"] <= 0:
-                                break  # Si terminó, salir
-
-                            time.sleep(1)  # Simula la ejecución en tiempo real
-                            process["remaining"] -= 1
-                            executed_time += 1
-                            self.time += 1
-
-                            # **Simular bloqueo aleatorio**
-                            if random.random() < 0.1:  # 10% de probabilidad de bloqueo
-                                process["state"] = "Bloqueado"
-                                process["block_time"] = 0
-                                break
-                            
-
-                        execution_end = self.time  # Marcar fin de la ejecución parcial
-
-                        # **Actualizar el diagrama de Gantt**
-                        self.gantt_chart_data.append({"id": process["id"], "start": execution_start, "duration": executed_time})
-
-                        # **Registrar ejecución parcial en la columna "Ejecución"**
-                        process["executions"].append(f" ({execution_start}-{execution_end})")
-
-                        # Si terminó, actualizar tiempos
-                        if process["remaining"] == 0:
-                            process["end"] = self.time
-                            process["turnaround"] = process["end"] - process["arrival"]
-                            process["waiting"] = process["turnaround"] - process["burst"]
-                            process["state"] = "Terminado"
-                        elif process["state"] != "Bloqueado":  # Si no terminó ni se bloqueó, sigue en "Listo"
-                            process["state"] = "Listo"
-
-                        # Liberar semáforo
-                        self.semaphore = 1
-                        self.semaphore_label.config(text="Semáforo: Libre", bg="green")
-
-                        # **Actualizar la tabla y el gráfico**
-                        self.update_table()
-                        self.update_gantt_chart()
+        if not self.player.playing:
+            # Con más de una CPU el Gantt muestra un carril por CPU
+            if not len(self.engine.timeline) and not self.engine.busy_cores:
+                cores = int(self.cores_spinbox.get())
+                self.engine.set_cores(cores)
+                self.gantt.set_by_core(cores > 1)
+            self.engine.switch_cost = int(self.switch_spinbox.get())
+        self.player.play()
+        self.controls.update_controls()
+
+    def on_frame(self, t):
+        # Una vez por cuadro: semáforo, tabla y Gantt en el instante t
+        running = self.player.running()
+        if self.engine.cores > 1:
+            self.semaphore_label.config(text=f"CPUs ocupadas: {len(running)}/{self.engine.cores}",
+                                        bg="red" if running else "green")
+        elif running:
+            self.semaphore_label.config(text="Semáforo: Ocupado", bg="red")
+        else:
+            self.semaphore_label.config(text="Semáforo: Libre", bg="green")
+        self._update_table()
+        self.update_gantt_chart(t)
+        self.controls.update_controls()
 
 
 # Ejecutar la aplicación
@@ -2,19 +2,30 @@ import tkinter as tk
 from tkinter import ttk
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import random
-import time
+
+from rr_engine import SegmentProgress, derive_seed, make_engine, variant_workload
+from rr_gui import LodGanttView, PlaybackRows, Player, PlayerControls, VirtualTree
 
 class RoundRobinSimulator:
     def __init__(self, root):
         # Inicializa la ventana principal y los parámetros de la simulación
         self.root = root
         self.root.title("Simulador Round Robin")
-        self.quantum = 5         # Tiempo máximo que se le asigna a cada proceso en cada ciclo
-        self.time = 0            # Tiempo global de la simulación
-        self.processes = []      # Lista que almacenará los procesos
-        self.gantt_chart_data = []  # Datos para el diagrama de Gantt
-        self.semaphore = 1       # Semáforo: 1=Libre, 0=Ocupado (simula exclusión mutua)
+        # El motor guarda los procesos, el tiempo global y el diagrama de Gantt;
+        # la ventana sólo muestra su estado
+        self.engine = make_engine("rr2", quantum=5)
+        # Procesos del botón "Agregar Proceso" (llegadas escalonadas, ráfagas
+        # de 5 a 15) y de "Generar Carga" (llegadas de Poisson, ráfagas cortas
+        # y largas), con flujos de la semilla del motor
+        self.workload = variant_workload("rr2", seed=self.engine.streams)
+        self.generator = variant_workload("rr2", seed=derive_seed(self.engine.streams.seed, "carga"),
+                                          arrivals="poisson", rate=0.2, bursts="bimodal")
+        self.progress = SegmentProgress()  # Retorno y espera parciales por segmento
+        # El motor calcula por adelantado y el reproductor muestra, cuadro a
+        # cuadro con after(), el instante que corresponde a la velocidad elegida
+        self.player = Player(self.root, self.engine, self.on_frame)
+        # Filas de la tabla en el instante mostrado: proceso y sus turnos terminados
+        self.rows = PlaybackRows(self.player, segments=True)
         self.setup_ui()          # Configura la interfaz gráfica
     def setup_ui(self):
         # Marco principal
@@ -50,7 +61,12 @@ class RoundRobinSimulator:
         self.tree.heading("Ejecución", text="Ejecución")
         self.tree.column("Ejecución", width=250)
 
+        # Barra de desplazamiento manejada por la tabla virtual
+        scrollbar = ttk.Scrollbar(left_frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.tree.pack(fill=tk.BOTH, expand=True)
+        # Sólo existen como ítems las filas visibles; el resto se actualiza al desplazarse
+        self.table = VirtualTree(self.tree, scrollbar)
 
         # Marco para gráfico de Gantt
         right_frame = tk.Frame(main_frame, bg="lightgray")
@@ -65,6 +81,9 @@ class RoundRobinSimulator:
         self.ax.set_facecolor('lightgray')
         self.canvas = FigureCanvasTkAgg(self.figure, right_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Zoom con la rueda, arrastre para desplazar y doble clic para ver todo;
+        # alejado se dibuja la ocupación agregada en lugar de cada segmento
+        self.gantt = LodGanttView(self.ax, self.canvas, grid_color="gray")
 
         # Marco para controles
         control_frame = tk.Frame(right_frame, bg="lightgray")
@@ -78,200 +97,111 @@ class RoundRobinSimulator:
         button_frame = tk.Frame(control_frame, bg="lightgray")
         button_frame.pack(fill=tk.X, pady=5)
         tk.Button(button_frame, text="Agregar Proceso", command=self.add_process).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Generar Carga", command=self.generate_load).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Iniciar", command=self.start_simulation).pack(side=tk.LEFT, padx=5)
+        # Cantidad de CPUs simuladas (se fija al iniciar)
+        tk.Label(button_frame, text="CPUs:", bg="lightgray").pack(side=tk.LEFT)
+        self.cores_spinbox = tk.Spinbox(button_frame, from_=1, to=16, width=3)
+        self.cores_spinbox.pack(side=tk.LEFT, padx=5)
+        # Costo de cada cambio de contexto (se dibuja en gris en el Gantt)
+        tk.Label(button_frame, text="Cambio de contexto:", bg="lightgray").pack(side=tk.LEFT)
+        self.switch_spinbox = tk.Spinbox(button_frame, from_=0, to=5, width=3)
+        self.switch_spinbox.pack(side=tk.LEFT, padx=5)
+        # Pausa, paso a paso, velocidad (1x a 10000x o máxima) y posición
+        self.controls = PlayerControls(control_frame, self.player)
+        self.controls.pack(fill=tk.X, pady=5)
         
         
     def add_process(self):
-        # Asigna un ID secuencial a cada proceso
-        process_id = len(self.processes) + 1
-        # Define el tiempo de llegada de cada proceso
-        arrival_time = process_id - 1
-        # Define el tiempo de ráfaga (burst) de manera aleatoria entre 5 y 15
-        burst_time = random.randint(5, 15)
-        # Se añade el proceso a la lista con sus parámetros iniciales
-        self.processes.append({
-            "id": process_id,
-            "arrival": arrival_time,
-            "burst": burst_time,
-            "start": None,            # Tiempo en que el proceso inicia su ejecución
-            "end": None,              # Tiempo en que finaliza la ejecución
-            "turnaround": None,       # Tiempo total desde la llegada hasta el fin
-            "waiting": None,          # Tiempo de espera en cola
-            "remaining": burst_time,  # Tiempo restante de ejecución
-            "state": "Listo",         # Estado inicial del proceso
-            "executions": [],         # Lista para almacenar los intervalos de ejecución
-            "block_time": 0,          # Tiempo que estará bloqueado (en caso de bloqueo)
-            "total_executed": 0       # Tiempo ejecutado acumulado (opcional para cálculos)
-        })
+        # Cada proceso llega una unidad de tiempo después del anterior, con
+        # una ráfaga aleatoria entre 5 y 15
+        self.player.add_columns(**self.workload.batch(1))
         # Se actualiza la tabla con la nueva información
         self.update_table()
 
-    def update_table(self):
-        # Elimina todos los elementos existentes en el Treeview
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        # Recorre cada proceso para mostrar su información
-        for p in self.processes:
-            # Valores principales de cada proceso
-            main_values = (
-                p["id"],
-                p["arrival"],
-                p["burst"],
-                p["start"] or "-",  # Muestra "-" si aún no tiene valor
-                p["end"] or "-",
-                p["turnaround"] or "-",
-                p["waiting"] or "-",
-                p["state"],
-                "Llegada" if not p["executions"] else "-"  # Muestra "Llegada" si no se ha ejecutado nada
-            )
-            self.tree.insert("", "end", values=main_values)
-            
-            # Se agregan sub-filas para cada intervalo de ejecución registrado
-            for i, exec_data in enumerate(p["executions"]):
-                # Calcula el tiempo de turnaround parcial para este segmento
-                partial_turnaround = exec_data["end"] - p["arrival"]
-                # Suma el tiempo ejecutado acumulado hasta el segmento actual
-                executed_so_far = sum(
-                    e["end"] - e["start"] 
-                    for e in p["executions"][:i+1]
-                )
-                # Calcula el tiempo de espera parcial restando el tiempo ejecutado del turnaround
-                partial_waiting = partial_turnaround - executed_so_far
-                self.tree.insert("", "end", values=(
-                    p["id"],
-                    p["arrival"],
-                    p["burst"],
-                    exec_data["start"],
-                    exec_data["end"],
-                    partial_turnaround,
-                    partial_waiting,
-                    exec_data["state"],
-                    exec_data["interval"]
-                ))
-        # Forzamos la actualización de la interfaz
-        self.root.update_idletasks()
-
-    def update_gantt_chart(self):
-        # Limpia el eje para redibujar el diagrama de Gantt
-        self.ax.clear()
-        self.ax.set_title("Diagrama de Gantt")
-        self.ax.set_xlabel("Tiempo")
-        self.ax.set_ylabel("Procesos")
-        self.ax.grid(axis="both", linestyle="--", linewidth=0.5, color="gray", alpha=0.7)
-
-        # Se obtienen los IDs de los procesos para configurar el eje Y
-        process_ids = sorted(set(data["id"] for data in self.gantt_chart_data))
-        self.ax.set_yticks(process_ids)
-        self.ax.set_yticklabels([f"Proceso {pid}" for pid in process_ids])
+    def generate_load(self):
+        # Veinte procesos que empiezan a llegar desde el instante actual
+        self.player.add_columns(**self.generator.batch(20, start=self.engine.time))
+        self.update_table()
 
-        # Se dibuja cada segmento de ejecución en el diagrama
-        for process in self.gantt_chart_data:
-            self.ax.broken_barh(
-                [(process["start"], process["duration"])],
-                (process["id"] - 0.4, 0.8),
-                facecolors="tab:purple"
-            )
-        # Se actualiza el canvas para mostrar los cambios
-        self.canvas.draw()
+    def update_table(self):
+        # El reproductor vuelve a mostrar el instante actual con los procesos nuevos
+        self.player.refresh()
+
+    def _update_table(self):
+        # Ejecutado acumulado de los segmentos nuevos (el registro sólo crece)
+        self.progress.update(self.engine.timeline)
+        # Una fila por cada proceso que ya llegó en el instante mostrado,
+        # seguida de una sub-fila por cada intervalo de ejecución ya terminado;
+        # sólo se arman las claves de las filas visibles
+        self.table.refresh_count(self.rows.update(), self.rows.key, self._row_values)
+
+    def _row_values(self, key):
+        table = self.engine.processes
+        if key[0] == "p":
+            index = int(key[1:]) - 1
+            p = table[index]
+            # Valores principales de cada proceso en el instante mostrado
+            start, end, turnaround, waiting, state = self.player.process_at(index)
+            return (
+                p.id,
+                p.arrival,
+                p.burst,
+                start if start is not None else "-",  # Muestra "-" si aún no tiene valor
+                end if end is not None else "-",
+                turnaround if turnaround is not None else "-",
+                waiting if waiting is not None else "-",
+                state,
+                "Llegada" if start is None else "-"  # Muestra "Llegada" si no se ha ejecutado nada
+            ), ()
+
+        # Sub-fila de un intervalo de ejecución
+        exec_data = self.engine.timeline[int(key[1:])]
+        p = table[exec_data.id - 1]
+        # Retorno parcial hasta el fin del segmento y espera parcial (retorno menos lo ejecutado)
+        partial_turnaround = exec_data.end - p.arrival
+        partial_waiting = partial_turnaround - self.progress.executed[exec_data.index]
+        return (
+            p.id,
+            p.arrival,
+            p.burst,
+            exec_data.start,
+            exec_data.end,
+            partial_turnaround,
+            partial_waiting,
+            exec_data.state,
+            exec_data.interval
+        ), ()
+
+    def update_gantt_chart(self, t=None):
+        self.gantt.update(self.engine.timeline, self.engine.overhead, until=t)
 
     def start_simulation(self):
-        # Inicia la simulación llamando al método run_round_robin
-        self.run_round_robin()
-
-    def run_round_robin(self):
-        # Verifica si todos los procesos han terminado (remaining <= 0)
-        if all(p["remaining"] <= 0 for p in self.processes):
-            return
-
-        # Recorre cada proceso en la lista
-        for process in self.processes:
-            # Si el proceso aún tiene tiempo de ejecución pendiente
-            if process["remaining"] > 0:
-                # Si el proceso está bloqueado, decrementa su tiempo de bloqueo
-                if process["state"] == "Bloqueado":
-                    process["block_time"] -= 1
-                    # Una vez finalizado el tiempo de bloqueo, el proceso pasa a estado "Listo"
-                    if process["block_time"] <= 0:
-                        process["state"] = "Listo"
-                    self.update_table()
-                    continue
-
-                # Si es la primera vez que el proceso se ejecuta, se define el tiempo de inicio
-                if process["start"] is None:
-                    process["start"] = max(self.time, process["arrival"])
-
-                # Se verifica si el semáforo está libre (valor 1)
-                if self.semaphore == 1:
-                    # Se toma el semáforo, indicándolo como ocupado (valor 0)
-                    self.semaphore = 0
-                    # Se actualiza la etiqueta del semáforo para mostrar el proceso que se está ejecutando
-                    self.semaphore_label.config(text=f"Semáforo: Ocupado (Proceso {process['id']})", bg="red")
-                    self.root.update_idletasks()
-
-                    executed_time = 0  # Tiempo acumulado de ejecución en este quantum
-                    execution_start = self.time  # Marca de tiempo de inicio de este ciclo de ejecución
-
-                    # Se ejecuta el quantum para el proceso actual
-                    for _ in range(self.quantum):
-                        # Si el proceso ya terminó su ejecución, se sale del ciclo
-                        if process["remaining"] <= 0:
-                            break
-
-                        # Se incrementa el tiempo ejecutado y global
-                        executed_time += 1
-                        self.time += 1
-                        process["remaining"] -= 1  # Se decrementa el tiempo restante del proceso
-                        
-                        # Se actualizan la tabla y el diagrama de Gantt para visualizar el cambio
-                        self.update_table()
-                        self.update_gantt_chart()
-                        self.root.update()  # Forzamos la actualización de la ventana
-                        time.sleep(1)  # Se espera 1 segundo para visualizar la ejecución
-
-                        # Se simula la posibilidad de que el proceso se bloquee (10% de probabilidad)
-                        if random.random() < 0.1 and process["remaining"] > 0:
-                            process["state"] = "Bloqueado"
-                            # Se asigna un tiempo de bloqueo aleatorio entre 1 y 3 segundos
-                            process["block_time"] = 1
-                            break
-
-                    # Se marca el final del quantum
-                    execution_end = self.time
-                    execution_state = process["state"]
-
-                    # Si el proceso terminó de ejecutarse, se actualizan los tiempos finales y métricas
-                    if process["remaining"] == 0:
-                        execution_state = "Terminado"
-                        process["end"] = self.time
-                        process["turnaround"] = process["end"] - process["arrival"]
-                        process["waiting"] = process["turnaround"] - process["burst"]
-
-                    # Se registra el intervalo de ejecución en el proceso
-                    process["executions"].append({
-                        "interval": f"({execution_start}-{execution_end})",
-                        "state": execution_state,
-                        "start": execution_start,
-                        "end": execution_end
-                    })
-                    
-                    # Se almacena la información para el diagrama de Gantt
-                    self.gantt_chart_data.append({
-                        "id": process["id"], 
-                        "start": execution_start, 
-                        "duration": executed_time
-                    })
-
-                    # Se libera el semáforo, permitiendo que otro proceso se ejecute
-                    self.semaphore = 1
-                    self.semaphore_label.config(text="Semáforo: Libre", bg="green")
-                    self.root.update_idletasks()
-
-                    # Se actualizan nuevamente la tabla y el diagrama para reflejar los cambios finales
-                    self.update_table()
-                    self.update_gantt_chart()
-
-        # Se programa la siguiente iteración de la simulación después de 1 segundo
-        self.root.after(1000, self.run_round_robin)
+        if not self.player.playing:
+            # Con más de una CPU el Gantt muestra un carril por CPU
+            if not len(self.engine.timeline) and not self.engine.busy_cores:
+                cores = int(self.cores_spinbox.get())
+                self.engine.set_cores(cores)
+                self.gantt.set_by_core(cores > 1)
+            self.engine.switch_cost = int(self.switch_spinbox.get())
+        # El reproductor calcula y muestra la simulación sin bloquear la ventana
+        self.player.play()
+        self.controls.update_controls()
+
+    def on_frame(self, t):
+        # Se muestra el proceso que tiene la CPU en el instante t y el estado resultante
+        running = self.player.running()
+        if self.engine.cores > 1:
+            self.semaphore_label.config(text=f"CPUs ocupadas: {len(running)}/{self.engine.cores}",
+                                        bg="red" if running else "green")
+        elif running:
+            pid = self.engine.timeline.pid[running[-1]]
+            self.semaphore_label.config(text=f"Semáforo: Ocupado (Proceso {pid})", bg="red")
+        else:
+            self.semaphore_label.config(text="Semáforo: Libre", bg="green")
+        self._update_table()
+        self.update_gantt_chart(t)
+        self.controls.update_controls()
 
 if __name__ == "__main__":
     # Se crea la ventana principal de Tkinter y se inicia la simulación
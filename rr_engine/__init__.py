@@ -0,0 +1,80 @@
+"""Motor de simulación Round Robin compartido por los simuladores gráficos."""
+from .checkpoint import Checkpoints, fork, load_snapshot, restore, save_snapshot, snapshot
+from .devices import IoDevice, IoModel
+from .engine import VARIANTS, RoundRobinEngine, build_workload, make_engine
+from .metrics import (
+    LogHistogram,
+    RunningStats,
+    SegmentProgress,
+    StreamSummary,
+    context_switches,
+    device_report,
+    quantum_report,
+    segment_progress,
+    starvation,
+    summarize,
+)
+from .queues import FifoReadyQueue, PriorityHeapQueue, PriorityRoundQueue
+from .streaming import CsvSink, JsonlSink, open_sink, run_stream
+from .streams import RandomStreams, derive_seed
+from .tiles import OccupancyTiles
+from .traces import export_trace, iter_trace, load_trace
+from .table import (
+    BLOQUEADO,
+    LISTO,
+    TERMINADO,
+    Process,
+    ProcessTable,
+    Segment,
+    SegmentLog,
+)
+from .workload import Workload, generate_workload, load_workload, variant_workload
+
+__all__ = [
+    "BLOQUEADO",
+    "Checkpoints",
+    "CsvSink",
+    "FifoReadyQueue",
+    "IoDevice",
+    "IoModel",
+    "JsonlSink",
+    "LogHistogram",
+    "OccupancyTiles",
+    "LISTO",
+    "PriorityHeapQueue",
+    "PriorityRoundQueue",
+    "RandomStreams",
+    "Process",
+    "ProcessTable",
+    "RoundRobinEngine",
+    "RunningStats",
+    "Segment",
+    "SegmentProgress",
+    "SegmentLog",
+    "StreamSummary",
+    "TERMINADO",
+    "VARIANTS",
+    "Workload",
+    "build_workload",
+    "context_switches",
+    "derive_seed",
+    "device_report",
+    "export_trace",
+    "fork",
+    "generate_workload",
+    "iter_trace",
+    "load_snapshot",
+    "load_trace",
+    "load_workload",
+    "make_engine",
+    "open_sink",
+    "quantum_report",
+    "restore",
+    "run_stream",
+    "save_snapshot",
+    "segment_progress",
+    "snapshot",
+    "starvation",
+    "summarize",
+    "variant_workload",
+]
@@ -0,0 +1,203 @@
+"""Ejecución por lotes sin ventana: python -m rr_engine --procesos 100"""
+import argparse
+import csv
+import os
+
+from .checkpoint import Checkpoints, load_snapshot
+from .devices import IoModel
+from .engine import POLICIES, VARIANTS, make_engine
+from .metrics import quantum_report, summarize
+from .streaming import open_sink, run_stream
+from .traces import export_trace, iter_trace, load_trace
+from .workload import load_workload, variant_workload
+
+
+ARRIVAL_NAMES = {"simultaneas": "simultaneous", "escalonadas": "staggered",
+                 "poisson": "poisson", "rafagas": "bursty"}
+BURST_NAMES = {"uniforme": "uniform", "exponencial": "exponential",
+               "lognormal": "lognormal", "bimodal": "bimodal"}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación Round Robin sin interfaz gráfica")
+    parser.add_argument("--procesos", type=int, default=10, help="Cantidad de procesos")
+    parser.add_argument("--llegadas", choices=sorted(ARRIVAL_NAMES),
+                        help="Proceso de llegadas (por defecto, el de la variante)")
+    parser.add_argument("--tasa", type=float, default=0.1,
+                        help="Procesos por unidad de tiempo con llegadas poisson o rafagas")
+    parser.add_argument("--distribucion", choices=sorted(BURST_NAMES),
+                        help="Distribución de las ráfagas (por defecto, uniforme entre 5 y 15)")
+    parser.add_argument("--rafaga-media", type=float, default=10,
+                        help="Media de las ráfagas exponenciales o lognormales")
+    parser.add_argument("--quantum", type=int, default=5)
+    parser.add_argument("--variante", choices=sorted(VARIANTS), default="llegada")
+    parser.add_argument("--semilla", type=int, default=None,
+                        help="Repite una corrida anterior (por defecto, una semilla nueva)")
+    parser.add_argument("--cpus", type=int, default=1, help="Cantidad de núcleos")
+    parser.add_argument("--colas", choices=("global", "percore"), default="global",
+                        help="Una cola de listos compartida o una por núcleo con robo de trabajo")
+    parser.add_argument("--cambio-contexto", type=int, default=0, metavar="U",
+                        help="Costo de pasar la CPU de un proceso a otro")
+    parser.add_argument("--latencia", type=int, default=0, metavar="U",
+                        help="Costo de cada despacho del planificador")
+    parser.add_argument("--dispositivos", type=int, default=0, metavar="N",
+                        help="Bloquearse es pedir E/S a uno de N dispositivos con cola FIFO")
+    parser.add_argument("--rafaga-es", type=int, default=5, metavar="U",
+                        help="Ráfaga media de E/S con --dispositivos")
+    parser.add_argument("--quantum-adaptativo", choices=("media", "mediana"),
+                        help="Recalcula el quantum con la ráfaga restante de los listos")
+    parser.add_argument("--historial-quantum", metavar="CSV",
+                        help="Guarda los cambios del quantum (tiempo, quantum)")
+    parser.add_argument("--politica", choices=POLICIES,
+                        help="Planifica la carga de la variante con otra política")
+    parser.add_argument("--niveles", type=int, default=3, help="MLFQ: cantidad de niveles")
+    parser.add_argument("--reinicio", type=int, default=100, metavar="U",
+                        help="MLFQ: cada U unidades todos vuelven al nivel más alto (0: nunca)")
+    parser.add_argument("--cola-prioridad", choices=("rondas", "heap"), default="rondas",
+                        help="Variante prioridad: rondas como el original o prioridad estricta")
+    parser.add_argument("--envejecimiento", type=int, default=0, metavar="U",
+                        help="Con --cola-prioridad heap, cada U unidades de espera suben un nivel")
+    parser.add_argument("--detalle", action="store_true", help="Muestra la tabla por proceso")
+    parser.add_argument("--cargar", metavar="TRAZA", help="Lee los procesos de una traza (.csv, .jsonl, .rrt, .npy)")
+    parser.add_argument("--exportar", metavar="TRAZA", help="Guarda la carga de trabajo usada en una traza")
+    parser.add_argument("--compactar", action="store_true",
+                        help="Une los turnos seguidos del mismo proceso en un solo segmento")
+    parser.add_argument("--compilado", action="store_true",
+                        help="Usa el núcleo compilado con Numba si está instalado (mismos resultados)")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Memoria acotada: reutiliza filas y calcula las métricas en línea")
+    parser.add_argument("--terminados", metavar="ARCHIVO",
+                        help="Con --streaming, guarda cada proceso terminado (.csv o .jsonl)")
+    parser.add_argument("--puntos-control", metavar="DIR",
+                        help="Guarda un punto de control del motor (.rrs) en DIR cada --cada unidades")
+    parser.add_argument("--cada", type=int, default=1000, metavar="U",
+                        help="Unidades de tiempo simulado entre puntos de control")
+    parser.add_argument("--reanudar", metavar="RUTA",
+                        help="Sigue una corrida desde un snapshot .rrs o un directorio de puntos de control")
+    parser.add_argument("--desde", type=int, metavar="T",
+                        help="Con --reanudar, sigue desde el instante T en lugar del último punto")
+    parser.add_argument("--nuevo-quantum", type=int, metavar="Q",
+                        help="Con --reanudar, cambia el quantum desde ese instante (rama hipotética)")
+    args = parser.parse_args(argv)
+
+    options = {"policy": args.politica} if args.politica else {}
+    engine = make_engine(args.variante, quantum=args.quantum, seed=args.semilla,
+                         cores=args.cpus, queueing=args.colas, aging=args.envejecimiento,
+                         priority_queue="heap" if args.cola_prioridad == "heap" else "rounds",
+                         levels=args.niveles, boost=args.reinicio, **options,
+                         switch_cost=args.cambio_contexto, dispatch_latency=args.latencia,
+                         io=IoModel(args.dispositivos, args.rafaga_es) if args.dispositivos else None,
+                         adaptive={"media": "mean", "mediana": "median"}.get(args.quantum_adaptativo),
+                         coalesce=args.compactar)
+    options = {"rate": args.tasa, "burst_mean": args.rafaga_media}
+    if args.llegadas:
+        options["arrivals"] = ARRIVAL_NAMES[args.llegadas]
+    if args.distribucion:
+        options["bursts"] = BURST_NAMES[args.distribucion]
+    if args.streaming:
+        stream(engine, args, options)
+        return
+    if args.reanudar:
+        # La configuración y la carga salen del punto de control
+        engine = resume(args)
+    elif args.cargar:
+        load_trace(engine, args.cargar)
+    else:
+        load_workload(engine, args.procesos, args.variante, **options)
+    if args.exportar:
+        export_trace(engine.processes, args.exportar)
+    checkpoints = Checkpoints(args.cada, args.puntos_control) if args.puntos_control else None
+    engine.run(compiled=args.compilado, checkpoints=checkpoints)
+
+    results = engine.results()
+    if args.detalle:
+        print("ID\tLlegada\tRáfaga\tComienzo\tFinal\tRetorno\tEspera")
+        for r in results:
+            print(f"{r['id']}\t{r['arrival']}\t{r['burst']}\t{r['start']}\t{r['end']}\t{r['turnaround']}\t{r['waiting']}")
+    summary = summarize(engine)
+    print(f"Semilla: {engine.streams.seed}")
+    print(f"Procesos: {summary['processes']}  Tiempo total: {engine.time}  Segmentos: {len(engine.timeline)}  "
+          f"Cambios de contexto: {summary['context_switches']}")
+    print(f"Uso de CPU: {summary['cpu_utilization']:.1%}  Rendimiento: {summary['throughput']:.4f} procesos/u.t.")
+    if summary["overhead"]:
+        print(f"Tiempo perdido en despachos y cambios de contexto: {summary['overhead']} "
+              f"({summary['overhead_fraction']:.1%} de la CPU)")
+    if summary["cores"] > 1:
+        per_core = "  ".join(f"CPU {i}: {u:.1%}" for i, u in enumerate(summary["core_utilization"]))
+        print(f"{per_core}  Migraciones: {summary['migrations']}  Robos: {summary['steals']}")
+    for key, label in (("turnaround", "Retorno"), ("waiting", "Espera"), ("response", "Respuesta")):
+        stats = summary[key]
+        if stats["mean"] is None:
+            continue
+        print(f"{label}: media {stats['mean']:.2f}  p50 {stats['p50']:.1f}  "
+              f"p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f}  máx {stats['max']}")
+    for device in summary["devices"]:
+        print(f"{device['name']}: uso {device['utilization']:.1%}  operaciones {device['served']}  "
+              f"espera media en cola {device['queue_wait_mean']:.2f}  cola máx {device['max_queue']}")
+    if engine.adaptive:
+        quantum = summary["quantum"]
+        print(f"Quantum: inicial {quantum['initial']}  final {quantum['final']}  "
+              f"medio {quantum['mean']:.2f}  mín {quantum['min']}  máx {quantum['max']}  "
+              f"cambios {quantum['changes']}")
+    if args.historial_quantum:
+        with open(args.historial_quantum, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("time", "quantum"))
+            writer.writerows(quantum_report(engine)["history"])
+    if engine.by_priority:
+        for priority, level in summary["by_priority"].items():
+            mean = "-" if level["waiting_mean"] is None else f"{level['waiting_mean']:.2f}"
+            print(f"Prioridad {priority}: procesos {level['processes']}  espera media {mean}  "
+                  f"espera continua máx {level['max_wait']}")
+
+
+def resume(args):
+    # Motor restaurado de --reanudar, llevado hasta --desde y con el quantum
+    # de --nuevo-quantum
+    if os.path.isdir(args.reanudar):
+        checkpoints = Checkpoints(directory=args.reanudar)
+        engine = checkpoints.resume() if args.desde is None else checkpoints.seek(args.desde)
+    else:
+        engine = load_snapshot(args.reanudar)
+        if args.desde is not None:
+            engine.run(until=args.desde)
+    if args.nuevo_quantum is not None:
+        engine.set_quantum(args.nuevo_quantum)
+    return engine
+
+
+def stream(engine, args, options):
+    # Corrida en modo streaming: sólo métricas en línea y, si se pide, el
+    # archivo de terminados
+    if args.cargar:
+        jobs = iter_trace(args.cargar)
+    else:
+        jobs = variant_workload(args.variante, engine.streams, **options).rows(args.procesos)
+    sink = open_sink(args.terminados) if args.terminados else None
+    try:
+        summary = run_stream(engine, jobs, sink).summary()
+    finally:
+        if sink is not None:
+            sink.close()
+    print(f"Semilla: {engine.streams.seed}")
+    print(f"Procesos: {summary['finished']}  Tiempo total: {engine.time}  Segmentos: {summary['segments']}  "
+          f"Cambios de contexto: {summary['context_switches']}  Filas en la tabla: {len(engine.processes)}")
+    print(f"Uso de CPU: {summary['cpu_utilization']:.1%}  Rendimiento: {summary['throughput']:.4f} procesos/u.t.")
+    if summary["overhead"]:
+        print(f"Tiempo perdido en despachos y cambios de contexto: {summary['overhead']} "
+              f"({summary['overhead_fraction']:.1%} de la CPU)")
+    for key, label in (("turnaround", "Retorno"), ("waiting", "Espera"), ("response", "Respuesta")):
+        stats = summary[key]
+        if stats["mean"] is None:
+            continue
+        print(f"{label}: media {stats['mean']:.2f}  desvío {stats['std']:.2f}  p50 {stats['p50']:.1f}  "
+              f"p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f}  máx {stats['max']}")
+    if engine.adaptive:
+        quantum = summary["quantum"]
+        print(f"Quantum: inicial {quantum['initial']}  final {quantum['final']}  "
+              f"medio {quantum['mean']:.2f}  mín {quantum['min']}  máx {quantum['max']}  "
+              f"cambios {quantum['changes']}")
+
+
+if __name__ == "__main__":
+    main()
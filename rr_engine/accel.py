@@ -0,0 +1,313 @@
+"""Motor compilado opcional para el caso común: Round Robin en una CPU.
+
+El bucle de eventos de RoundRobinEngine cuesta varias llamadas de Python
+por turno (montículo, colas, vistas). Aquí el mismo bucle está escrito como
+una función sobre las columnas de la tabla (vistas NumPy de los arrays, sin
+copiarlos) que Numba compila a código nativo: las llegadas salen de un
+índice ordenado, los desbloqueos de una cola circular (con block_time fijo
+llegan en orden) y hay a lo sumo un fin de turno pendiente.
+
+Los resultados son idénticos a los del motor en Python con la misma
+semilla: los números de la moneda de bloqueo se sacan del mismo
+random.Random, copiando su estado a un MT19937 de NumPy (random_sample usa
+la misma fórmula que random.random) y devolviéndole el estado exacto después
+de los números usados. La simulación corre por tramos de ``chunk`` despachos
+y los segmentos de cada tramo se agregan al registro de una vez.
+
+Sin Numba (o con una configuración que el núcleo no cubre: varias CPUs,
+prioridades, MLFQ, quantum adaptativo, E/S, streaming o segmentos unidos)
+run() usa el motor normal. force=True corre el núcleo sin compilar, para
+verificarlo.
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba es opcional
+    njit = None
+
+from .engine import ARRIVAL
+from .queues import FifoReadyQueue
+from .table import BLOCK, BLOCKED, DISPATCH, DONE, FINISH, NONE, QUANTUM, READY, SWITCH
+
+CHUNK = 65536       # Despachos por tramo del núcleo
+
+# Posiciones del estado escalar del núcleo, que persiste entre tramos
+TIME, READY_HEAD, READY_TAIL, UNBLOCK_HEAD, UNBLOCK_TAIL, NEXT_ARRIVAL = range(6)
+RUNNING, EXEC_START, BLOCKS, SLICE_END, LAST_ON_CORE, UNFINISHED = range(6, 12)
+SEGMENTS, SCHEDULED, USED, CHUNK_SEGMENTS, CHUNK_COSTS = range(12, 17)
+STATE_SIZE = 17
+
+FINISHED = 0
+PAUSED = 1
+
+
+def _simulate(pid, arrival, remaining, start, end, state, last_segment, last_core,
+              ready_since, max_wait, ready, unblock_time, unblock_index, arrival_order,
+              uniforms, seg_pid, seg_start, seg_end, seg_state, seg_prev, seg_cause,
+              cost_pid, cost_start, cost_end, cost_cause, s,
+              quantum, block_prob, block_time, switch_cost, dispatch_latency):
+    # Mismo bucle que RoundRobinEngine.step() para una CPU y una cola FIFO;
+    # corre hasta terminar o hasta haber despachado len(seg_pid) turnos
+    time = s[TIME]
+    ready_head, ready_tail = s[READY_HEAD], s[READY_TAIL]
+    unblock_head, unblock_tail = s[UNBLOCK_HEAD], s[UNBLOCK_TAIL]
+    next_arrival = s[NEXT_ARRIVAL]
+    running, exec_start, blocks, slice_end = s[RUNNING], s[EXEC_START], s[BLOCKS], s[SLICE_END]
+    last_on_core, unfinished = s[LAST_ON_CORE], s[UNFINISHED]
+    scheduled = s[SCHEDULED]
+    capacity = len(ready)
+    budget = len(seg_pid)
+    arrivals = len(arrival_order)
+    log_stay = math.log(1.0 - block_prob) if 0.0 < block_prob < 1.0 else 0.0
+    dispatched = 0
+    segments = 0
+    costs = 0
+    used = 0
+    status = FINISHED
+    while True:
+        if running == NONE and ready_head != ready_tail:
+            if dispatched == budget:
+                status = PAUSED
+                break
+            index = ready[ready_head]
+            ready_head = (ready_head + 1) % capacity
+            # Despacho: costo, primer comienzo y espera continua
+            cost = dispatch_latency
+            cause = DISPATCH
+            if last_on_core != NONE and last_on_core != index:
+                cost += switch_cost
+                cause = SWITCH
+            last_on_core = index
+            begin = time + cost
+            if cost:
+                cost_pid[costs] = pid[index]
+                cost_start[costs] = time
+                cost_end[costs] = begin
+                cost_cause[costs] = cause
+                costs += 1
+            if start[index] == NONE:
+                start[index] = begin
+            last_core[index] = 0
+            waited = time - ready_since[index]
+            if waited > max_wait[index]:
+                max_wait[index] = waited
+            left = remaining[index]
+            length = min(quantum, left)
+            blocks = 0
+            if block_prob >= 1.0:
+                if 1 < left:
+                    blocks = 1
+                    length = 1
+            elif block_prob > 0.0:
+                # ticks = int(ratio) + 1 <= length equivale a ratio < length
+                ratio = math.log(1.0 - uniforms[used]) / log_stay
+                used += 1
+                if ratio < length:
+                    ticks = int(ratio) + 1
+                    if ticks < left:
+                        blocks = 1
+                        length = ticks
+            running = index
+            exec_start = begin
+            slice_end = begin + length
+            scheduled += 1
+            dispatched += 1
+
+        # Próximo evento: a igual tiempo, llegada, desbloqueo y fin de turno
+        kind = -1
+        when = 0
+        if next_arrival < arrivals:
+            kind = ARRIVAL
+            when = arrival[arrival_order[next_arrival]]
+        if unblock_head != unblock_tail and (kind == -1 or unblock_time[unblock_head] < when):
+            kind = 1
+            when = unblock_time[unblock_head]
+        if running != NONE and (kind == -1 or slice_end < when):
+            kind = 2
+            when = slice_end
+        if kind == -1:
+            break
+        time = when
+        if kind == ARRIVAL:
+            index = arrival_order[next_arrival]
+            next_arrival += 1
+            ready_since[index] = time
+            ready[ready_tail] = index
+            ready_tail = (ready_tail + 1) % capacity
+        elif kind == 1:
+            index = unblock_index[unblock_head]
+            unblock_head = (unblock_head + 1) % capacity
+            state[index] = READY
+            ready_since[index] = time
+            ready[ready_tail] = index
+            ready_tail = (ready_tail + 1) % capacity
+        else:
+            index = running
+            running = NONE
+            remaining[index] -= time - exec_start
+            cause = QUANTUM
+            if remaining[index] == 0:
+                state[index] = DONE
+                end[index] = time
+                unfinished -= 1
+                cause = FINISH
+            elif blocks:
+                state[index] = BLOCKED
+                cause = BLOCK
+                unblock_time[unblock_tail] = time + block_time
+                unblock_index[unblock_tail] = index
+                unblock_tail = (unblock_tail + 1) % capacity
+                scheduled += 1
+            else:
+                ready_since[index] = time
+                ready[ready_tail] = index
+                ready_tail = (ready_tail + 1) % capacity
+            seg_pid[segments] = pid[index]
+            seg_start[segments] = exec_start
+            seg_end[segments] = time
+            seg_state[segments] = state[index]
+            seg_prev[segments] = last_segment[index]
+            seg_cause[segments] = cause
+            last_segment[index] = s[SEGMENTS] + segments
+            segments += 1
+
+    s[TIME] = time
+    s[READY_HEAD], s[READY_TAIL] = ready_head, ready_tail
+    s[UNBLOCK_HEAD], s[UNBLOCK_TAIL] = unblock_head, unblock_tail
+    s[NEXT_ARRIVAL] = next_arrival
+    s[RUNNING], s[EXEC_START], s[BLOCKS], s[SLICE_END] = running, exec_start, blocks, slice_end
+    s[LAST_ON_CORE], s[UNFINISHED] = last_on_core, unfinished
+    s[SEGMENTS] += segments
+    s[SCHEDULED] = scheduled
+    s[USED], s[CHUNK_SEGMENTS], s[CHUNK_COSTS] = used, segments, costs
+    return status
+
+
+_compiled = njit(cache=True, nogil=True)(_simulate) if njit is not None else None
+compiled = _compiled is not None
+
+
+def unsupported(engine):
+    # Motivo por el que el núcleo no puede correr este motor, o None
+    if np is None:
+        return "requiere NumPy"
+    if engine.cores != 1 or engine.policy != "rr" or not isinstance(engine.ready, FifoReadyQueue):
+        return "sólo Round Robin con una CPU"
+    if engine.adaptive or engine.io is not None or engine.streaming or engine._source is not None:
+        return "sin quantum adaptativo, modelo de E/S ni streaming"
+    if engine.timeline.coalesce:
+        return "sin unir segmentos contiguos"
+    if engine.block_time < 0 or not hasattr(engine.rng, "getstate"):
+        return "bloqueos con block_time fijo y un generador random.Random"
+    if engine.blocked or engine._running[0] is not None:
+        return "sin turnos en curso ni procesos bloqueados"
+    if any(event[1] != ARRIVAL for event in engine._events):
+        return "sólo llegadas pendientes"
+    return None
+
+
+def run(engine, chunk=CHUNK, force=False):
+    # Simula hasta el final como engine.run(), con el núcleo compilado si
+    # está disponible y cubre la configuración
+    kernel = _compiled if _compiled is not None else (_simulate if force else None)
+    if kernel is None or unsupported(engine) is not None:
+        return engine.run()
+
+    table = engine.processes
+    log = engine.timeline
+    columns = {name: np.frombuffer(getattr(table, name), dtype=getattr(table, name).typecode)
+               for name in ("pid", "arrival", "remaining", "start", "end", "state",
+                            "last_segment", "last_core", "ready_since", "max_wait")}
+    count = len(table)
+    capacity = count + 1
+    ready = np.empty(capacity, dtype=np.int64)
+    waiting = np.fromiter(engine.ready._queue, dtype=np.int64, count=len(engine.ready))
+    ready[:len(waiting)] = waiting
+    # Llegadas en el orden del montículo: por tiempo y luego por secuencia
+    events = np.array(engine._events, dtype=np.int64).reshape(-1, 4)
+    arrival_order = events[np.lexsort((events[:, 2], events[:, 0])), 3].copy()
+
+    s = np.zeros(STATE_SIZE, dtype=np.int64)
+    s[TIME] = engine.time
+    s[READY_TAIL] = len(waiting)
+    s[RUNNING] = NONE
+    s[LAST_ON_CORE] = engine._last_on_core[0]
+    s[UNFINISHED] = engine._unfinished
+    s[SEGMENTS] = len(log)
+
+    buffers = {
+        "unblock_time": np.empty(capacity, dtype=np.int64),
+        "unblock_index": np.empty(capacity, dtype=np.int64),
+        "seg_pid": np.empty(chunk, dtype=np.int64),
+        "seg_start": np.empty(chunk, dtype=np.int64),
+        "seg_end": np.empty(chunk, dtype=np.int64),
+        "seg_state": np.empty(chunk, dtype=np.int8),
+        "seg_prev": np.empty(chunk, dtype=np.int64),
+        "seg_cause": np.empty(chunk, dtype=np.int8),
+        "cost_pid": np.empty(chunk, dtype=np.int64),
+        "cost_start": np.empty(chunk, dtype=np.int64),
+        "cost_end": np.empty(chunk, dtype=np.int64),
+        "cost_cause": np.empty(chunk, dtype=np.int8),
+    }
+    draws = 0.0 < engine.block_prob < 1.0
+    mt = np.random.RandomState() if draws else None
+    core = np.zeros(chunk, dtype=np.int32)
+    status = PAUSED
+    while status == PAUSED:
+        if draws:
+            saved = _to_numpy_state(engine.rng.getstate())
+            mt.set_state(saved)
+            uniforms = mt.random_sample(chunk)
+        else:
+            uniforms = np.empty(0)
+        status = kernel(columns["pid"], columns["arrival"], columns["remaining"], columns["start"],
+                        columns["end"], columns["state"], columns["last_segment"],
+                        columns["last_core"], columns["ready_since"], columns["max_wait"],
+                        ready, buffers["unblock_time"], buffers["unblock_index"], arrival_order,
+                        uniforms, buffers["seg_pid"], buffers["seg_start"], buffers["seg_end"],
+                        buffers["seg_state"], buffers["seg_prev"], buffers["seg_cause"],
+                        buffers["cost_pid"], buffers["cost_start"], buffers["cost_end"],
+                        buffers["cost_cause"], s, engine.quantum,
+                        float(engine.block_prob), engine.block_time, engine.switch_cost,
+                        engine.dispatch_latency)
+        if draws:
+            # El generador queda justo después de los números usados
+            mt.set_state(saved)
+            mt.random_sample(s[USED])
+            engine.rng.setstate(_to_python_state(mt.get_state(), engine.rng.getstate()))
+        n = s[CHUNK_SEGMENTS]
+        log.extend(buffers["seg_pid"][:n], buffers["seg_start"][:n], buffers["seg_end"][:n],
+                   buffers["seg_state"][:n], buffers["seg_prev"][:n], core[:n],
+                   buffers["seg_cause"][:n])
+        n = s[CHUNK_COSTS]
+        engine.overhead.extend(buffers["cost_pid"][:n], buffers["cost_start"][:n],
+                               buffers["cost_end"][:n], np.full(n, READY, dtype=np.int8),
+                               np.full(n, NONE, dtype=np.int64), core[:n],
+                               buffers["cost_cause"][:n])
+
+    # El motor queda como si hubiera corrido run()
+    engine.time = int(s[TIME])
+    engine._last_on_core[0] = int(s[LAST_ON_CORE])
+    engine._unfinished = int(s[UNFINISHED])
+    engine._seq += int(s[SCHEDULED])
+    engine._events.clear()
+    engine.ready._queue.clear()
+    return engine
+
+
+def _to_numpy_state(state):
+    # (versión, 624 palabras + posición, gauss) de random -> estado de RandomState
+    _, internal, _ = state
+    return ("MT19937", np.array(internal[:-1], dtype=np.uint32), internal[-1])
+
+
+def _to_python_state(mt_state, previous):
+    version, _, gauss = previous
+    _, key, position = mt_state[:3]
+    return version, tuple(int(word) for word in key) + (int(position),), gauss
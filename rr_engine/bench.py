@@ -0,0 +1,311 @@
+"""Benchmarks del planificador y del costo de dibujar la interfaz.
+
+Mide, para cada variante (Round Robin simple, por prioridad y la de bloqueos
+de RR2.py) y cada cantidad de procesos, cuántas unidades de CPU simuladas
+(ticks) y cuántos segmentos (turnos en CPU) registra el motor por segundo. Con
+matplotlib instalado mide además la vista del Gantt que usan los simuladores
+(LodGanttView): dibujar un registro de N segmentos desde cero, la vista
+alejada con la ocupación agregada, agregar un segmento más y cortar el
+dibujo en un instante anterior (until, como al reproducir). Con una pantalla
+disponible mide también un cuadro de la tabla virtual de procesos durante
+la reproducción (PlaybackRows y refresh_count, como on_frame).
+
+Cada corrida se agrega como una línea JSON al archivo de resultados, con el
+commit, la versión de Python y si había NumPy; --comparar muestra la
+diferencia contra la corrida guardada anterior para ver las regresiones:
+
+    python -m rr_engine.bench --procesos 10 1000 100000 --comparar
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+from .engine import make_engine
+from .table import SegmentLog
+from .workload import load_workload
+
+VARIANTS = ("llegada", "prioridad", "rr2")
+SIZES = (10, 100, 1000, 10000, 100000)
+HISTORY = (100, 1000, 10000)
+RESULTS = os.path.join("benchmarks", "results.jsonl")
+
+
+def _best(function, repeat):
+    # Mejor tiempo de repeat ejecuciones (el menos afectado por el ruido)
+    best = None
+    for _ in range(repeat):
+        began = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - began
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_engine(variant, count, repeat=3, seed=0, compiled=False):
+    # Ticks y segmentos (turnos) por segundo de una corrida completa; la
+    # carga se genera fuera de la medición
+    stats = {}
+
+    def run():
+        engine = make_engine(variant, seed=seed)
+        load_workload(engine, count, variant)
+        began = time.perf_counter()
+        engine.run(compiled=compiled)
+        stats["elapsed"] = time.perf_counter() - began
+        stats["ticks"] = sum(engine.processes.burst)
+        stats["segments"] = len(engine.timeline)
+
+    best = None
+    for _ in range(repeat):
+        run()
+        best = stats["elapsed"] if best is None else min(best, stats["elapsed"])
+    return {
+        "name": f"engine.{variant}{'.compiled' if compiled else ''}",
+        "size": count,
+        "seconds": best,
+        "ticks_per_second": stats["ticks"] / best if best else None,
+        "segments_per_second": stats["segments"] / best if best else None,
+    }
+
+
+def _history(size, seed=0):
+    # Un motor con al menos size segmentos ya simulados
+    engine = make_engine("llegada", seed=seed)
+    load_workload(engine, max(1, size // 3), "llegada")
+    while len(engine.timeline) < size and engine.step() is not None:
+        pass
+    return engine
+
+
+def bench_gantt(size, repeat=3):
+    # Dibujo completo de size segmentos, vista alejada (ocupación agregada),
+    # agregado de un segmento más y corte en un instante anterior
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from rr_gui.lod import LodGanttView
+
+    engine = _history(size + 1)
+    figure = Figure(figsize=(8, 7))
+    canvas = FigureCanvasAgg(figure)
+    view = LodGanttView(figure.add_subplot(111), canvas)
+    timeline, overhead = engine.timeline, engine.overhead
+    last = len(timeline) - 1
+    end = timeline.end[-1]
+
+    def full():
+        view.reset()
+        view.update(timeline, overhead)
+        canvas.draw()
+
+    def tiles():
+        # Todos los carriles y todo el tiempo con la ocupación agregada,
+        # incluido armar las tablas de OccupancyTiles (reset las descarta)
+        view.reset()
+        view.update(timeline, overhead)
+        view._draw_tiles(1, max(view._lanes, 1), 0, end)
+        canvas.draw()
+
+    def incremental():
+        # Sólo update: el redibujado de la figura ya lo mide full
+        prefix = _prefix(timeline, last)
+        view.update(prefix, overhead)
+        canvas.draw()
+        prefix.append(*(column[last] for column in timeline._columns()))
+        began = time.perf_counter()
+        view.update(prefix, overhead)
+        return time.perf_counter() - began
+
+    def until():
+        view.reset()
+        view.update(timeline, overhead)
+        canvas.draw()
+        began = time.perf_counter()
+        view.update(timeline, overhead, until=end / 2)
+        return time.perf_counter() - began
+
+    return [
+        {"name": "gui.update_gantt_chart.full", "size": size, "seconds": _best(full, repeat)},
+        {"name": "gui.update_gantt_chart.tiles", "size": size, "seconds": _best(tiles, repeat)},
+        {"name": "gui.update_gantt_chart.append", "size": size,
+         "seconds": min(incremental() for _ in range(repeat))},
+        {"name": "gui.update_gantt_chart.until", "size": size,
+         "seconds": min(until() for _ in range(repeat))},
+    ]
+
+
+def _prefix(log, count):
+    # SegmentLog nuevo con los primeros count segmentos del registro
+    prefix = SegmentLog()
+    prefix.extend(*(column[:count] for column in log._columns()))
+    return prefix
+
+
+def bench_table(size, repeat=3, frames=60):
+    # Un cuadro de la tabla durante la reproducción, como on_frame de RR2.py:
+    # PlaybackRows.update y refresh_count con las filas visibles, avanzando
+    # el instante mostrado a lo largo de una historia de size segmentos
+    import tkinter as tk
+    from tkinter import ttk
+
+    from rr_gui.player import PlaybackRows, Player
+    from rr_gui.table import VirtualTree
+
+    engine = _history(size)
+    table = engine.processes
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        tree = ttk.Treeview(root, columns=("ID", "Inicio", "Fin", "Estado"), show="headings")
+        view = VirtualTree(tree)
+        player = Player(root, engine, lambda t: None)
+
+        def row(key):
+            if key[0] == "p":
+                p = table[int(key[1:]) - 1]
+                return (p.id, p.start, p.end, p.state), ()
+            segment = engine.timeline[int(key[1:])]
+            return (segment.id, segment.start, segment.end, segment.state), ()
+
+        def playback():
+            # Tiempo medio por cuadro; ordenar los procesos (sólo cuando se
+            # agregan) queda fuera de la medición
+            player.position = 0
+            rows = PlaybackRows(player, segments=True)
+            rows.update()
+            elapsed = 0.0
+            for frame in range(1, frames + 1):
+                player.position = engine.time * frame // frames
+                began = time.perf_counter()
+                view.refresh_count(rows.update(), rows.key, row)
+                root.update_idletasks()
+                elapsed += time.perf_counter() - began
+            return elapsed / frames
+
+        return [{"name": "gui.update_table.frame", "size": size,
+                 "seconds": min(playback() for _ in range(repeat))}]
+    finally:
+        root.destroy()
+
+
+def run_benchmarks(sizes=SIZES, variants=VARIANTS, history=HISTORY, repeat=3, gui=True,
+                   compiled=False):
+    results = []
+    for variant in variants:
+        for count in sizes:
+            results.append(bench_engine(variant, count, repeat, compiled=compiled))
+            _report(results[-1])
+    if not gui:
+        return results
+    for benchmark in (bench_gantt, bench_table):
+        for size in history:
+            try:
+                measured = benchmark(size, repeat)
+            except Exception as error:  # Sin matplotlib o sin pantalla
+                print(f"{benchmark.__name__}: omitido ({error})", file=sys.stderr)
+                break
+            for result in measured:
+                results.append(result)
+                _report(result)
+    return results
+
+
+def _report(result):
+    line = f"{result['name']:<32} {result['size']:>9}  {result['seconds'] * 1000:10.2f} ms"
+    if "ticks_per_second" in result:
+        line += (f"  {result['ticks_per_second']:>12,.0f} ticks/s"
+                 f"  {result['segments_per_second']:>12,.0f} segmentos/s")
+    print(line)
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save(results, path=RESULTS):
+    # Agrega la corrida al historial de resultados
+    record = {
+        "commit": _commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np is not None,
+        "results": results,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    return record
+
+
+def load(path=RESULTS):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(previous, current, threshold=0.1):
+    # Variación de tiempo de cada benchmark presente en las dos corridas;
+    # marca como regresión lo que tardó más de threshold de más
+    before = {(r["name"], r["size"]): r["seconds"] for r in previous["results"]}
+    changes = []
+    for result in current["results"]:
+        old = before.get((result["name"], result["size"]))
+        if old:
+            ratio = result["seconds"] / old - 1
+            changes.append((result["name"], result["size"], ratio, ratio > threshold))
+    return changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del motor y de la interfaz")
+    parser.add_argument("--procesos", type=int, nargs="+", default=list(SIZES),
+                        help="Cantidades de procesos por corrida (hasta 1000000)")
+    parser.add_argument("--variante", nargs="+", choices=VARIANTS, default=list(VARIANTS))
+    parser.add_argument("--historia", type=int, nargs="+", default=list(HISTORY),
+                        help="Segmentos en la historia para medir el dibujo")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--compilado", action="store_true",
+                        help="Mide el núcleo compilado (ver accel.py) en lugar del motor en Python")
+    parser.add_argument("--sin-interfaz", action="store_true", help="Sólo mide el motor")
+    parser.add_argument("--salida", default=RESULTS, help="Historial de resultados (JSON Lines)")
+    parser.add_argument("--comparar", action="store_true",
+                        help="Compara contra la corrida anterior del historial")
+    parser.add_argument("--umbral", type=float, default=0.1,
+                        help="Fracción de tiempo de más que cuenta como regresión")
+    args = parser.parse_args(argv)
+
+    history = load(args.salida)
+    results = run_benchmarks(args.procesos, args.variante, args.historia, args.repeticiones,
+                             gui=not args.sin_interfaz, compiled=args.compilado)
+    record = save(results, args.salida)
+    if args.comparar and history:
+        previous = history[-1]
+        print(f"Contra {previous['commit'] or '?'} ({previous['date']}):")
+        regressions = 0
+        for name, size, ratio, regression in compare(previous, record, args.umbral):
+            regressions += regression
+            print(f"{name:<32} {size:>9}  {ratio:+8.1%}{'  REGRESIÓN' if regression else ''}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
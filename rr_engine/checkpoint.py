@@ -0,0 +1,206 @@
+"""Puntos de control: guardar el estado del motor, reanudar y bifurcar.
+
+Una simulación larga ya no tiene que correr entera en una sola sesión. El
+estado completo del motor (RoundRobinEngine.getstate: tabla de procesos,
+registros de segmentos, montículo de eventos, colas, CPUs, dispositivos y
+generadores aleatorios) se guarda como un snapshot binario compacto:
+
+* cabecera de 8 bytes ``RRSNAP01``;
+* el estado serializado con pickle y comprimido con zlib. Las columnas
+  viajan como arrays (bloques de bytes), no como un objeto por valor.
+
+restore devuelve un motor nuevo que sigue exactamente como habría seguido
+el original (los generadores continúan donde estaban). fork copia un motor
+y le cambia opciones, por ejemplo el quantum a partir de t = 10000, sin
+recalcular lo anterior. Sólo se pueden cambiar las opciones que el motor lee
+en cada despacho (LIVE_OPTIONS); la política, las colas de prioridad, los
+niveles, el envejecimiento y el quantum adaptativo quedan fijos en las colas
+y estadísticas armadas al crear el motor.
+
+Checkpoints guarda un snapshot cada ``every`` unidades de tiempo simulado,
+en memoria o en archivos ``.rrs`` de un directorio, y reanuda o bifurca
+desde el último punto anterior a cualquier instante. Un directorio es de una
+sola corrida: ``run.json`` guarda su semilla, su configuración fija y un
+resumen de la carga, y no se agregan puntos de otra corrida:
+
+    checkpoints = Checkpoints(every=1000)
+    engine.run(checkpoints=checkpoints)
+    branch = checkpoints.fork(10000, quantum=8).run()
+
+Como todo pickle, un snapshot sólo debe cargarse si es de confianza. El modo
+streaming no se puede guardar.
+"""
+import bisect
+import glob
+import hashlib
+import json
+import os
+import pickle
+import zlib
+from array import array
+
+from .engine import OPTIONS, RoundRobinEngine
+
+MAGIC = b"RRSNAP01"
+EXTENSION = ".rrs"
+RUN_FILE = "run.json"   # Identidad de la corrida de un directorio de puntos
+# Opciones que se pueden cambiar en una rama: el motor las lee en cada turno
+LIVE_OPTIONS = ("quantum", "block_prob", "block_time", "switch_cost", "dispatch_latency",
+                "boost", "min_quantum", "max_quantum")
+
+
+def snapshot(engine, level=1):
+    # Snapshot binario del motor; level es el nivel de compresión de zlib
+    return MAGIC + zlib.compress(pickle.dumps(engine.getstate(), pickle.HIGHEST_PROTOCOL), level)
+
+
+def restore(data):
+    # Motor nuevo a partir de un snapshot
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("No es un snapshot del motor")
+    return RoundRobinEngine.from_state(pickle.loads(zlib.decompress(data[len(MAGIC):])))
+
+
+def save_snapshot(engine, path, level=1):
+    with open(path, "wb") as f:
+        f.write(snapshot(engine, level))
+
+
+def load_snapshot(path):
+    with open(path, "rb") as f:
+        return restore(f.read())
+
+
+def fork(engine, **changes):
+    # Copia independiente del motor con otras opciones (de LIVE_OPTIONS)
+    # desde el instante actual; el cambio de quantum queda en el historial
+    # del quantum
+    return _change(restore(snapshot(engine, level=0)), changes)
+
+
+def fingerprint(engine, processes=None):
+    # Identidad de una corrida: la semilla, las opciones que no cambian
+    # durante la simulación y las primeras processes filas de la carga (las
+    # filas no se modifican, sólo se agregan)
+    table = engine.processes
+    count = len(table) if processes is None else min(processes, len(table))
+    digest = hashlib.sha256()
+    for column in (table.arrival, table.burst, table.priority, table.io_burst):
+        digest.update(column[:count].tobytes())
+    return {
+        "seed": engine.streams.seed,
+        "options": {name: getattr(engine, name) for name in OPTIONS if name not in LIVE_OPTIONS},
+        "cores": engine.cores,
+        "queueing": engine.queueing,
+        "processes": count,
+        "workload": digest.hexdigest(),
+    }
+
+
+def _change(engine, changes):
+    for name in changes:
+        if name not in LIVE_OPTIONS:
+            raise ValueError(f"La opción {name!r} no se puede cambiar en una simulación iniciada; "
+                             f"se admiten {', '.join(LIVE_OPTIONS)}")
+    for name, value in changes.items():
+        if name == "quantum":
+            engine.set_quantum(value)
+        else:
+            setattr(engine, name, value)
+    return engine
+
+
+class Checkpoints:
+    def __init__(self, every=1000, directory=None, level=1):
+        if every <= 0:
+            raise ValueError("El intervalo entre puntos de control debe ser positivo")
+        self.every = every          # Unidades de tiempo simulado entre puntos
+        self.directory = directory  # None: los snapshots quedan en memoria
+        self.level = level
+        self.times = array("q")     # Tiempo del motor en cada punto, en orden
+        self._snapshots = []        # Bytes de cada punto (sin directorio)
+        self._next = 0
+        self.run = None             # fingerprint de la corrida del directorio
+        self._checked = False       # Si ya se comparó el motor con self.run
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            # Puntos de una corrida anterior guardados en el mismo directorio
+            for path in sorted(glob.glob(os.path.join(directory, "*" + EXTENSION))):
+                self.times.append(int(os.path.basename(path)[:-len(EXTENSION)]))
+            if os.path.exists(os.path.join(directory, RUN_FILE)):
+                with open(os.path.join(directory, RUN_FILE)) as f:
+                    self.run = json.load(f)
+            elif self.times:
+                raise ValueError(f"{directory} tiene puntos de control sin {RUN_FILE}: "
+                                 "no se sabe de qué corrida son")
+            if self.times:
+                self._next = self._following(self.times[-1])
+
+    def __len__(self):
+        return len(self.times)
+
+    def _following(self, time):
+        # Instante del próximo punto después de uno tomado en time
+        return (time // self.every + 1) * self.every
+
+    def _path(self, time):
+        return os.path.join(self.directory, f"{time:012d}{EXTENSION}")
+
+    def maybe(self, engine):
+        # Guarda un punto si desde el anterior pasaron every unidades o más
+        if self.directory is not None and not self._checked:
+            self._check(engine)
+        if engine.time >= self._next:
+            self.add(engine)
+
+    def add(self, engine):
+        if self.times and engine.time <= self.times[-1]:
+            raise ValueError("Los puntos de control deben agregarse en orden de tiempo")
+        if self.directory is not None and not self._checked:
+            self._check(engine)
+        data = snapshot(engine, self.level)
+        if self.directory is None:
+            self._snapshots.append(data)
+        else:
+            with open(self._path(engine.time), "wb") as f:
+                f.write(data)
+        self.times.append(engine.time)
+        self._next = self._following(engine.time)
+
+    def _check(self, engine):
+        # El directorio es de la corrida de engine (o está vacío y pasa a serlo)
+        if self.run is None:
+            self.run = fingerprint(engine)
+            with open(os.path.join(self.directory, RUN_FILE), "w") as f:
+                json.dump(self.run, f)
+        elif fingerprint(engine, self.run["processes"]) != self.run:
+            raise ValueError(f"{self.directory} tiene puntos de control de otra corrida")
+        self._checked = True
+
+    def latest(self, t=None):
+        # Posición del último punto en o antes de t (del último si t es None);
+        # None si no hay ninguno
+        position = len(self.times) if t is None else bisect.bisect_right(self.times, t)
+        return position - 1 if position else None
+
+    def _data(self, position):
+        if self.directory is None:
+            return self._snapshots[position]
+        with open(self._path(self.times[position]), "rb") as f:
+            return f.read()
+
+    def resume(self, t=None):
+        # Motor restaurado desde el último punto en o antes de t
+        position = self.latest(t)
+        if position is None:
+            raise LookupError(f"No hay puntos de control antes de t = {t}")
+        return restore(self._data(position))
+
+    def seek(self, t):
+        # Motor en el primer fin de turno en o después de t, simulando sólo
+        # desde el último punto anterior
+        return self.resume(t).run(until=t)
+
+    def fork(self, t, **changes):
+        # Rama desde el instante t con otras opciones (ver fork)
+        return _change(self.seek(t), changes)
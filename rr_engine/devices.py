@@ -0,0 +1,104 @@
+"""Modelo de entrada/salida con dispositivos y colas FIFO.
+
+Sin este modelo un proceso bloqueado sólo espera block_time unidades fijas.
+Con un IoModel, bloquearse es pedir una operación a un dispositivo: cada
+dispositivo atiende una solicitud a la vez, en orden de llegada, y el resto
+espera en su cola. La duración de cada operación es exponencial con la
+ráfaga media de E/S del proceso (o la del modelo si el proceso no tiene una),
+dividida por la velocidad del dispositivo y redondeada hacia arriba. Cuando
+la operación termina el motor devuelve el proceso a la cola de listos, así la
+CPU y los dispositivos trabajan en paralelo.
+
+getstate/setstate guardan y reponen los dispositivos con sus colas y
+contadores, para los puntos de control (checkpoint.py).
+"""
+import math
+from collections import deque
+
+
+class IoDevice:
+    def __init__(self, name, speed=1.0):
+        self.name = name
+        self.speed = speed          # Mayor velocidad, operaciones más cortas
+        self.queue = deque()        # Procesos esperando el dispositivo
+        self.current = None         # Proceso atendido en este momento
+        self.busy = 0               # Tiempo total ocupado
+        self.served = 0             # Operaciones completadas
+        self.queued_time = 0        # Espera total en la cola del dispositivo
+        self.max_queue = 0          # Cola más larga observada
+        self._since = {}            # proceso -> desde cuándo espera en la cola
+
+    def __len__(self):
+        # Solicitudes pendientes, incluida la que está en servicio
+        return len(self.queue) + (self.current is not None)
+
+
+class IoModel:
+    def __init__(self, devices=1, io_burst=5):
+        # devices: cantidad de dispositivos iguales o lista de IoDevice
+        if isinstance(devices, int):
+            devices = [IoDevice(f"Disp. {i}") for i in range(devices)]
+        if not devices:
+            raise ValueError("Se necesita al menos un dispositivo")
+        self.devices = list(devices)
+        self.io_burst = io_burst    # Ráfaga media de E/S por defecto
+
+    def device_for(self, index):
+        # Cada proceso usa siempre el mismo dispositivo
+        return self.devices[index % len(self.devices)]
+
+    def service_time(self, device, mean, rng):
+        mean = mean or self.io_burst
+        return max(1, math.ceil(rng.expovariate(1.0 / mean) / device.speed))
+
+    def request(self, index, mean, now, rng):
+        # Devuelve cuándo termina la operación si el dispositivo estaba libre;
+        # None si el proceso quedó en la cola
+        device = self.device_for(index)
+        if device.current is None:
+            return self._serve(device, index, mean, now, rng)
+        device.queue.append((index, mean))
+        device._since[index] = now
+        device.max_queue = max(device.max_queue, len(device.queue))
+        return None
+
+    def complete(self, index, now, rng):
+        # Libera el dispositivo del proceso; si había cola, empieza el
+        # siguiente y devuelve (índice, fin de su operación)
+        device = self.device_for(index)
+        device.current = None
+        device.served += 1
+        if not device.queue:
+            return None
+        following, mean = device.queue.popleft()
+        device.queued_time += now - device._since.pop(following)
+        return following, self._serve(device, following, mean, now, rng)
+
+    def _serve(self, device, index, mean, now, rng):
+        duration = self.service_time(device, mean, rng)
+        device.current = index
+        device.busy += duration
+        return now + duration
+
+    def getstate(self):
+        return {
+            "io_burst": self.io_burst,
+            "devices": [(d.name, d.speed, list(d.queue), d.current, d.busy, d.served,
+                         d.queued_time, d.max_queue, dict(d._since)) for d in self.devices],
+        }
+
+    def setstate(self, state):
+        # Reemplaza los dispositivos por los guardados
+        self.io_burst = state["io_burst"]
+        self.devices = []
+        for (name, speed, waiting, current, busy, served, queued_time, max_queue,
+             since) in state["devices"]:
+            device = IoDevice(name, speed)
+            device.queue.extend(tuple(request) for request in waiting)
+            device.current = current
+            device.busy = busy
+            device.served = served
+            device.queued_time = queued_time
+            device.max_queue = max_queue
+            device._since = dict(since)
+            self.devices.append(device)
@@ -0,0 +1,660 @@
+"""Motor de planificación Round Robin sin interfaz gráfica.
+
+Los tres simuladores (RR2.py, RR Tllegada.py y RR prioridad.py) delegan aquí
+toda la lógica de planificación; la ventana de Tkinter sólo muestra el estado.
+El motor no duerme ni dibuja, así que corre tan rápido como permita la CPU.
+
+El tiempo avanza por eventos discretos (llegada, desbloqueo y fin de turno)
+guardados en un montículo: el costo de simular depende de la cantidad de
+cambios de contexto y no de la duración total de las ráfagas. Los procesos
+viven en las columnas de una ProcessTable y se manejan por índice.
+
+La política de planificación se elige al crear el motor, así la misma carga
+de trabajo puede correr con cualquiera de ellas:
+
+* ``"rr"``: Round Robin clásico con una cola FIFO.
+* ``"priority"``: Round Robin por prioridad (rondas o montículo con envejecimiento).
+* ``"mlfq"``: colas multinivel con realimentación. Un proceso que agota su
+  quantum baja a un nivel con el doble de quantum; uno que se bloquea antes
+  (interactivo) se queda donde está. Cada ``boost`` unidades de tiempo todos
+  vuelven al nivel más alto para que los largos no se mueran de hambre.
+
+Con ``adaptive`` el quantum deja de ser fijo: en cada despacho se recalcula
+como la media (``"mean"``) o la mediana (``"median"``) de la ráfaga restante
+de los procesos listos. Las estadísticas se mantienen al encolar y despachar,
+sin recorrer la cola, y cada cambio queda en quantum_times/quantum_values.
+
+Cambiar de proceso no es gratis: cada despacho cuesta ``dispatch_latency`` y,
+si la CPU venía de correr otro proceso, además ``switch_cost``. Ese tiempo
+ocupa la CPU antes del turno y se anota aparte, en el registro ``overhead``.
+
+Con un modelo de E/S (``io``, ver devices.py) bloquearse es pedir una
+operación a un dispositivo con cola FIFO; el proceso vuelve a la cola de
+listos cuando la operación termina y block_time no se usa.
+
+Los números aleatorios salen de los flujos con semilla de ``streams`` (ver
+streams.py): con la misma ``seed`` la corrida se repite exactamente. Pasar
+``rng`` usa ese único generador para todo, como antes.
+
+En modo streaming (``stream``) las llegadas salen de un iterador que se lee
+por bloques a medida que avanza el tiempo, cada proceso terminado se entrega
+a un sink y su fila se reutiliza: la memoria no crece con la corrida (ver
+streaming.py para el registro de segmentos, el historial del quantum y las
+métricas en línea).
+
+getstate/setstate capturan y reponen el estado completo del motor (tabla,
+registros, eventos, colas, CPUs, dispositivos y generadores): es la base de
+los puntos de control de checkpoint.py para reanudar o bifurcar una corrida.
+"""
+import bisect
+import heapq
+import itertools
+import math
+import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+from .devices import IoModel
+from .queues import FifoReadyQueue, MlfqQueue, PriorityHeapQueue, PriorityRoundQueue
+from .streams import RandomStreams
+from .table import (BLOCK, BLOCKED, DISPATCH, DONE, FINISH, IO, NONE, QUANTUM, READY, SWITCH,
+                    ProcessTable, SegmentLog)
+
+# Tipos de evento, en el orden en que se atienden si coinciden en el tiempo
+ARRIVAL = 0      # Llega un proceso
+UNBLOCK = 1      # Un proceso bloqueado vuelve a estar listo (o termina su E/S)
+SLICE_END = 2    # El proceso en CPU termina su turno (quantum, fin o bloqueo)
+BOOST = 3        # MLFQ: todos los procesos vuelven al nivel más alto
+
+POLICIES = ("rr", "priority", "mlfq")
+# Campos de cada proceso terminado que recibe el sink en modo streaming
+FINISHED_FIELDS = ("id", "arrival", "burst", "priority", "start", "end", "max_wait")
+# Opciones del constructor que son atributos simples (las que guarda getstate)
+OPTIONS = ("quantum", "block_prob", "block_time", "policy", "priority_queue", "aging", "levels",
+           "boost", "adaptive", "min_quantum", "max_quantum", "switch_cost", "dispatch_latency")
+
+
+class RoundRobinEngine:
+    def __init__(self, quantum=5, block_prob=0.1, block_time=0, policy="rr", rng=None, seed=None,
+                 cores=1, queueing="global", priority_queue="rounds", aging=0,
+                 levels=3, boost=100, adaptive=None, min_quantum=1, max_quantum=None,
+                 switch_cost=0, dispatch_latency=0, io=None, coalesce=False):
+        self.quantum = quantum          # Tiempo máximo de CPU por turno (nivel 0 en MLFQ)
+        self.block_prob = block_prob    # Probabilidad de bloqueo en cada unidad de tiempo
+        self.block_time = block_time    # Tiempo que pasa bloqueado un proceso (sin modelo de E/S)
+        self.io = io                    # IoModel con los dispositivos de E/S, o None
+        if policy not in POLICIES:
+            raise ValueError(f"Política desconocida: {policy!r}")
+        self.policy = policy
+        # "rounds": rondas ordenadas por (prioridad, llegada), como el original;
+        # "heap": prioridad estricta, con envejecimiento si aging > 0
+        if priority_queue not in ("rounds", "heap"):
+            raise ValueError(f"Cola de prioridad desconocida: {priority_queue!r}")
+        self.priority_queue = priority_queue
+        self.aging = aging              # Unidades de espera por nivel de prioridad ganado
+        self.levels = levels            # MLFQ: cantidad de niveles
+        self.boost = boost              # MLFQ: período del reinicio de niveles (0: nunca)
+        self._boost_pending = False
+        self._demoted = set()           # MLFQ: índices con nivel > 0 (los que reinicia el boost)
+        if adaptive not in (None, "mean", "median"):
+            raise ValueError(f"Quantum adaptativo desconocido: {adaptive!r}")
+        self.adaptive = adaptive        # Estadística que fija el quantum (None: fijo)
+        self.min_quantum = min_quantum
+        self.max_quantum = max_quantum
+        self._ready_sum = 0             # Suma de la ráfaga restante de los listos
+        self._ready_count = 0
+        self._ready_sorted = []         # Ráfagas restantes ordenadas (sólo para la mediana)
+        self.quantum_times = array("q", [0])          # Historial del quantum: desde cuándo
+        self.quantum_values = array("q", [quantum])   # ... y qué valor tuvo
+        self.switch_cost = switch_cost            # Costo de cambiar de un proceso a otro
+        self.dispatch_latency = dispatch_latency  # Costo de cada despacho del planificador
+        self.streams = RandomStreams(seed)  # Semilla en streams.seed para repetir la corrida
+        self.rng = rng or self.streams.blocking     # Bloqueos
+        self.io_rng = rng or self.streams.io        # Duración de las operaciones de E/S
+        self.time = 0
+        self.processes = ProcessTable()
+        self.timeline = self.processes.segments  # Segmentos en orden cronológico (Gantt)
+        self.timeline.coalesce = coalesce  # Une turnos seguidos del mismo proceso en la misma CPU
+        self.overhead = SegmentLog()    # Tiempo de CPU perdido en despachos y cambios de contexto
+        self._events = []               # Montículo de (tiempo, tipo, secuencia, índice)
+        self._seq = 0                   # Desempate estable entre eventos simultáneos
+        self.ready = self._new_queue()  # Cola global de listos
+        self.blocked = set()            # Índices de procesos esperando su desbloqueo
+        self._unfinished = 0            # Procesos con ráfaga pendiente
+        self.streaming = False          # Filas de terminados reutilizadas, sin cadena de segmentos
+        self.sink = None                # Recibe cada proceso terminado en modo streaming
+        self._source = None             # Iterador de llegadas pendientes de cargar
+        self._source_time = -math.inf   # Llegada más tardía ya cargada
+        self._source_batch = 1024
+        self.set_cores(cores, queueing)
+
+    @property
+    def by_priority(self):
+        return self.policy == "priority"
+
+    def _new_queue(self):
+        if self.policy == "mlfq":
+            return MlfqQueue(self.processes.level, self.levels)
+        if self.by_priority and self.priority_queue == "heap":
+            return PriorityHeapQueue(self.processes.priority, lambda: self.time, self.aging)
+        if self.by_priority:
+            return PriorityRoundQueue(self.processes.priority)
+        return FifoReadyQueue()
+
+    def set_cores(self, cores, queueing=None):
+        # Cantidad de CPUs y cómo se reparten los procesos listos:
+        # "global": una sola cola compartida; cada CPU libre toma el primero.
+        # "percore": una cola por CPU; las llegadas van a la más corta, cada
+        #   proceso vuelve a la cola de la CPU donde corrió y una CPU sin
+        #   trabajo roba de la cola más larga.
+        if len(self.timeline) or any(getattr(self, "_running", ())):
+            raise RuntimeError("No se pueden cambiar las CPUs con la simulación iniciada")
+        if cores < 1:
+            raise ValueError("Se necesita al menos una CPU")
+        queueing = queueing or getattr(self, "queueing", "global")
+        if queueing not in ("global", "percore"):
+            raise ValueError(f"Modo de colas desconocido: {queueing!r}")
+        self.cores = cores
+        self.queueing = queueing
+        self._running = [None] * cores  # Por CPU: (índice, inicio del turno, si se bloquea al final)
+        self._last_on_core = [NONE] * cores  # Último proceso que corrió en cada CPU
+        self.local = [self._new_queue() for _ in range(cores)] if queueing == "percore" else []
+        self.migrations = 0             # Despachos en una CPU distinta de la anterior
+        self.steals = 0                 # Procesos robados de la cola de otra CPU
+        if self.local:
+            # Lo que ya estaba listo se reparte entre las colas de cada CPU
+            while len(self.ready):
+                min(self.local, key=len).push(self.ready.pop())
+
+    @property
+    def busy_cores(self):
+        return sum(1 for running in self._running if running is not None)
+
+    def _enqueue_new(self, index):
+        # Llegada de un proceso
+        self.processes.ready_since[index] = self.time
+        self._track_ready(index)
+        if self.local:
+            min(self.local, key=len).push(index)
+        else:
+            self.ready.push(index)
+
+    def _enqueue_again(self, index):
+        # Agotó su quantum o se desbloqueó: espera a la ronda siguiente,
+        # en la cola de la CPU donde corrió si hay colas por CPU
+        self.processes.ready_since[index] = self.time
+        self._track_ready(index)
+        if self.local:
+            self.local[self.processes.last_core[index]].requeue(index)
+        else:
+            self.ready.requeue(index)
+
+    def _track_ready(self, index):
+        if self.adaptive:
+            remaining = self.processes.remaining[index]
+            self._ready_sum += remaining
+            self._ready_count += 1
+            if self.adaptive == "median":
+                bisect.insort(self._ready_sorted, remaining)
+
+    def _untrack_ready(self, index):
+        if self.adaptive:
+            remaining = self.processes.remaining[index]
+            self._ready_sum -= remaining
+            self._ready_count -= 1
+            if self.adaptive == "median":
+                del self._ready_sorted[bisect.bisect_left(self._ready_sorted, remaining)]
+
+    def _adapt_quantum(self):
+        # Quantum = estadística de la ráfaga restante de los listos (incluido
+        # el que se está por despachar), acotada a [min_quantum, max_quantum]
+        if self.adaptive == "median":
+            quantum = self._ready_sorted[(self._ready_count - 1) // 2]
+        else:
+            quantum = round(self._ready_sum / self._ready_count)
+        quantum = max(self.min_quantum, quantum)
+        if self.max_quantum is not None:
+            quantum = min(self.max_quantum, quantum)
+        self.set_quantum(quantum)
+
+    def set_quantum(self, quantum):
+        # Cambia el quantum desde el instante actual y lo anota en el historial
+        if quantum != self.quantum:
+            self.quantum = quantum
+            if self.quantum_times[-1] == self.time:
+                self.quantum_values[-1] = quantum
+            else:
+                self.quantum_times.append(self.time)
+                self.quantum_values.append(quantum)
+
+    def _next_for(self, core):
+        if not self.local:
+            return self.ready.pop()
+        index = self.local[core].pop()
+        if index is None:
+            # Robo de trabajo: de la CPU con más procesos esperando
+            victim = max(self.local, key=len)
+            index = victim.steal()
+            if index is not None:
+                self.steals += 1
+        return index
+
+    def add_process(self, burst, arrival=None, priority=0, io_burst=0):
+        # El ID es secuencial (índice + 1); por defecto el proceso llega "ahora"
+        if arrival is None:
+            arrival = self.time
+        index = self.processes.append(arrival, burst, priority, io_burst)
+        self._unfinished += 1
+        self._schedule_boost()
+        if arrival > self.time:
+            self._schedule(arrival, ARRIVAL, index)
+        else:
+            self._enqueue_new(index)
+        return self.processes[index]
+
+    def add_processes(self, rows):
+        # Carga en lote filas (arrival, burst, priority); devuelve cuántas agregó
+        table = self.processes
+        added = 0
+        events = []
+        for arrival, burst, priority in rows:
+            index = table.append(arrival, burst, priority)
+            added += 1
+            if arrival > self.time:
+                self._seq += 1
+                events.append((arrival, ARRIVAL, self._seq, index))
+            else:
+                self._enqueue_new(index)
+        self._push_events(events)
+        self._unfinished += added
+        self._schedule_boost()
+        return added
+
+    def _push_events(self, events):
+        if len(events) * 4 >= len(self._events):
+            # Lote grande respecto del montículo: se reconstruye una sola vez
+            self._events.extend(events)
+            heapq.heapify(self._events)
+        else:
+            # Lote chico (carga por lotes o desde la interfaz): inserción normal
+            for event in events:
+                heapq.heappush(self._events, event)
+
+    def stream(self, jobs, sink=None, batch=1024):
+        # Pasa a modo streaming: las llegadas (arrival, burst, priority), en
+        # orden de llegada, se leen de jobs a medida que hacen falta; cada
+        # proceso terminado se entrega a sink como tupla de FINISHED_FIELDS y
+        # su fila se reutiliza. Los segmentos siguen yendo a timeline, que el
+        # que consume la corrida debe vaciar (streaming.run_stream lo hace).
+        self.streaming = True
+        self.sink = sink
+        self._source = iter(jobs)
+        self._source_batch = batch
+        return self
+
+    def _refill(self):
+        # Carga llegadas hasta pasar el próximo evento (o el tiempo actual si no
+        # hay eventos): ninguna llegada anterior a lo que se simula queda sin cargar
+        while self._source is not None:
+            horizon = self._events[0][0] if self._events else self.time
+            if self._source_time > horizon:
+                return
+            chunk = list(itertools.islice(self._source, self._source_batch))
+            if not chunk:
+                self._source = None
+                return
+            self.add_processes(chunk)
+            self._source_time = chunk[-1][0]
+
+    def add_columns(self, arrival, burst, priority=None, io_burst=None):
+        # Carga en lote una carga de trabajo por columnas (listas, array o
+        # arreglos NumPy, ver workload.py); devuelve cuántos procesos agregó
+        table = self.processes
+        first = table.extend(arrival, burst, priority, io_burst)
+        time = self.time
+        if np is not None:
+            arrivals = np.frombuffer(table.arrival, dtype=np.int64)[first:]
+            pending = arrivals > time
+            now = (np.flatnonzero(~pending) + first).tolist()
+            later = (np.flatnonzero(pending) + first).tolist()
+        else:
+            now, later = [], []
+            for index, when in enumerate(table.arrival[first:], first):
+                (later if when > time else now).append(index)
+        if self.local or self.adaptive or not isinstance(self.ready, FifoReadyQueue):
+            for index in now:
+                self._enqueue_new(index)
+        else:
+            # Caso común: una sola cola FIFO, se encolan todos de una vez
+            for index in now:
+                table.ready_since[index] = time
+            self.ready.extend(now)
+        seq = self._seq
+        arrival = table.arrival
+        self._push_events([(arrival[index], ARRIVAL, seq + n, index)
+                           for n, index in enumerate(later, 1)])
+        self._seq += len(later)
+        self._unfinished += len(table) - first
+        self._schedule_boost()
+        return len(table) - first
+
+    @property
+    def finished(self):
+        return self._unfinished == 0
+
+    def _schedule(self, when, kind, index):
+        self._seq += 1
+        heapq.heappush(self._events, (when, kind, self._seq, index))
+
+    def _schedule_boost(self):
+        # El reinicio periódico sólo se programa mientras haya procesos sin
+        # terminar; si no, el montículo nunca quedaría vacío
+        if self.policy == "mlfq" and self.boost > 0 and self._unfinished and not self._boost_pending:
+            self._boost_pending = True
+            self._schedule(self.time + self.boost, BOOST, NONE)
+
+    def _boost(self):
+        self._boost_pending = False
+        # Sólo se recorren los procesos que bajaron de nivel, no toda la tabla
+        level = self.processes.level
+        for index in self._demoted:
+            level[index] = 0
+        self._demoted.clear()
+        for queue in self.local or (self.ready,):
+            queue.boost()
+        self._schedule_boost()
+
+    def quantum_for(self, index):
+        # En MLFQ cada nivel duplica el quantum del anterior
+        if self.policy == "mlfq":
+            return self.quantum << self.processes.level[index]
+        return self.quantum
+
+    def _ticks_until_block(self):
+        # Cantidad de unidades que corre el proceso antes de bloquearse:
+        # equivale a tirar la moneda de block_prob en cada unidad, pero con
+        # un solo número aleatorio (distribución geométrica)
+        if self.block_prob <= 0:
+            return math.inf
+        if self.block_prob >= 1:
+            return 1
+        u = self.rng.random()
+        return int(math.log(1.0 - u) / math.log(1.0 - self.block_prob)) + 1
+
+    def _dispatch(self, index, core):
+        table = self.processes
+        # El turno empieza después del costo del despacho y del cambio de contexto
+        cost = self.dispatch_latency
+        cause = DISPATCH
+        if self._last_on_core[core] not in (NONE, index):
+            cost += self.switch_cost
+            cause = SWITCH
+        self._last_on_core[core] = index
+        start = self.time + cost
+        if cost:
+            self.overhead.append(table.pid[index], self.time, start, READY, NONE, core, cause)
+        if table.start[index] == NONE:
+            table.start[index] = start
+        elif table.last_core[index] != core:
+            self.migrations += 1
+        table.last_core[index] = core
+        if self.adaptive:
+            self._adapt_quantum()
+            self._untrack_ready(index)
+        waited = self.time - table.ready_since[index]
+        if waited > table.max_wait[index]:
+            table.max_wait[index] = waited
+        # El turno dura lo que llegue primero: quantum, fin de ráfaga o bloqueo
+        remaining = table.remaining[index]
+        slice_length = min(self.quantum_for(index), remaining)
+        ticks = self._ticks_until_block()
+        # Sólo se bloquea si todavía le queda ráfaga después de esa unidad
+        blocks = ticks <= slice_length and ticks < remaining
+        if blocks:
+            slice_length = ticks
+        self._running[core] = (index, start, blocks)
+        self._schedule(start + slice_length, SLICE_END, index)
+
+    def _end_slice(self, index):
+        table = self.processes
+        core = table.last_core[index]
+        _, execution_start, blocks = self._running[core]
+        self._running[core] = None
+        table.remaining[index] -= self.time - execution_start
+        cause = QUANTUM
+        if table.remaining[index] == 0:
+            table.state[index] = DONE
+            table.end[index] = self.time
+            self._unfinished -= 1
+            cause = FINISH
+        elif blocks:
+            table.state[index] = BLOCKED
+            self.blocked.add(index)
+            if self.io is None:
+                cause = BLOCK
+                self._schedule(self.time + self.block_time, UNBLOCK, index)
+            else:
+                cause = IO
+                done = self.io.request(index, table.io_burst[index], self.time, self.io_rng)
+                if done is not None:
+                    self._schedule(done, UNBLOCK, index)
+        else:
+            if self.policy == "mlfq" and table.level[index] < self.levels - 1:
+                # Agotó su quantum: baja a la cola siguiente (quantum más largo)
+                table.level[index] += 1
+                self._demoted.add(index)
+            self._enqueue_again(index)
+
+        if self.streaming:
+            # Sin cadena de segmentos por proceso: el registro se vacía seguido
+            segment = self.timeline.append(table.pid[index], execution_start, self.time,
+                                           table.state[index], NONE, core, cause)
+            if table.state[index] == DONE:
+                if self.sink is not None:
+                    self.sink((table.pid[index], table.arrival[index], table.burst[index],
+                               table.priority[index], table.start[index], self.time,
+                               table.max_wait[index]))
+                table.release(index)
+            return self.timeline[segment]
+
+        segment = self.timeline.append(table.pid[index], execution_start, self.time,
+                                       table.state[index], table.last_segment[index], core, cause)
+        table.last_segment[index] = segment
+        return self.timeline[segment]
+
+    def step(self):
+        # Avanza hasta el próximo fin de turno (en cualquier CPU) y devuelve
+        # su segmento; None cuando ya no quedan eventos ni procesos listos
+        while True:
+            if self._source is not None:
+                self._refill()
+            for core, running in enumerate(self._running):
+                if running is None:
+                    index = self._next_for(core)
+                    if index is not None:
+                        self._dispatch(index, core)
+            if self._source is not None:
+                self._refill()
+            if not self._events:
+                return None
+            self.time, kind, _, index = heapq.heappop(self._events)
+            if kind == ARRIVAL:
+                self._enqueue_new(index)
+            elif kind == UNBLOCK:
+                # Vuelve a la cola como si ya hubiera tenido su turno en la ronda
+                self.processes.state[index] = READY
+                self.blocked.discard(index)
+                if self.io is not None:
+                    # El dispositivo queda libre: atiende al siguiente de su cola
+                    following = self.io.complete(index, self.time, self.io_rng)
+                    if following is not None:
+                        self._schedule(following[1], UNBLOCK, following[0])
+                self._enqueue_again(index)
+            elif kind == SLICE_END:
+                return self._end_slice(index)
+            elif kind == BOOST:
+                self._boost()
+
+    def run(self, compiled=False, until=None, checkpoints=None):
+        # Simula hasta que todos los procesos terminen; compiled usa el núcleo
+        # compilado con Numba si está instalado y cubre la configuración (ver
+        # accel.py), con resultados idénticos. Con until se detiene en el
+        # primer fin de turno en o después de ese instante; con checkpoints
+        # (un Checkpoints de checkpoint.py) guarda un punto de control cada
+        # tanto. Estas dos opciones usan siempre el bucle en Python
+        if compiled and until is None and checkpoints is None:
+            from .accel import run
+            return run(self)
+        while until is None or self.time < until:
+            if checkpoints is not None:
+                checkpoints.maybe(self)
+            if self.step() is None:
+                break
+        return self
+
+    def getstate(self):
+        # Estado completo del motor, configuración incluida, en tipos simples
+        # y columnas array. El modo streaming no se puede guardar: sus
+        # llegadas salen de un iterador
+        if self.streaming:
+            raise RuntimeError("No se puede guardar el estado de un motor en modo streaming")
+        shared = self.rng is not self.streams.blocking
+        return {
+            "options": {name: getattr(self, name) for name in OPTIONS},
+            "cores": self.cores,
+            "queueing": self.queueing,
+            "io": None if self.io is None else self.io.getstate(),
+            "seed": self.streams.seed,
+            "streams": self.streams.getstate(),
+            "rng": self.rng.getstate() if shared else None,  # Generador único pasado como rng
+            "time": self.time,
+            "seq": self._seq,
+            "events": array("q", itertools.chain.from_iterable(self._events)),
+            "processes": self.processes.getstate(),
+            "overhead": self.overhead.getstate(),
+            "ready": self.ready.getstate(),
+            "local": [queue.getstate() for queue in self.local],
+            "blocked": array("q", sorted(self.blocked)),
+            "unfinished": self._unfinished,
+            "running": list(self._running),
+            "last_on_core": list(self._last_on_core),
+            "migrations": self.migrations,
+            "steals": self.steals,
+            "boost_pending": self._boost_pending,
+            "ready_sum": self._ready_sum,
+            "ready_count": self._ready_count,
+            "ready_sorted": list(self._ready_sorted),
+            "quantum_times": self.quantum_times,
+            "quantum_values": self.quantum_values,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        # Motor nuevo con la configuración y el estado de getstate
+        rng = None
+        if state["rng"] is not None:
+            rng = random.Random()
+            rng.setstate(_rng_state(state["rng"]))
+        io = None
+        if state["io"] is not None:
+            io = IoModel()
+            io.setstate(state["io"])
+        engine = cls(**state["options"], rng=rng, seed=state["seed"], cores=state["cores"],
+                     queueing=state["queueing"], io=io)
+        engine.setstate(state)
+        return engine
+
+    def setstate(self, state):
+        # Repone el estado dinámico de getstate en un motor con la misma configuración
+        self.streams.setstate({name: _rng_state(value) for name, value in state["streams"].items()})
+        self.time = state["time"]
+        self._seq = state["seq"]
+        events = state["events"]
+        # La lista guardada ya estaba ordenada como montículo
+        self._events = list(zip(events[0::4], events[1::4], events[2::4], events[3::4]))
+        self.processes.setstate(state["processes"])
+        self.overhead.setstate(state["overhead"])
+        self.ready.setstate(state["ready"])
+        for queue, saved in zip(self.local, state["local"]):
+            queue.setstate(saved)
+        self.blocked = set(state["blocked"])
+        self._unfinished = state["unfinished"]
+        self._running = [None if running is None else tuple(running) for running in state["running"]]
+        self._last_on_core = list(state["last_on_core"])
+        self.migrations = state["migrations"]
+        self.steals = state["steals"]
+        self._boost_pending = state["boost_pending"]
+        self._demoted = {index for index, level in enumerate(self.processes.level) if level}
+        self._ready_sum = state["ready_sum"]
+        self._ready_count = state["ready_count"]
+        self._ready_sorted = list(state["ready_sorted"])
+        self.quantum_times = array("q", state["quantum_times"])
+        self.quantum_values = array("q", state["quantum_values"])
+
+    def results(self):
+        # Métricas por proceso en forma de diccionarios
+        table = self.processes
+        results = []
+        for i in range(len(table)):
+            end = None if table.end[i] == NONE else table.end[i]
+            results.append({
+                "id": table.pid[i],
+                "arrival": table.arrival[i],
+                "burst": table.burst[i],
+                "priority": table.priority[i],
+                "start": None if table.start[i] == NONE else table.start[i],
+                "end": end,
+                "turnaround": None if end is None else end - table.arrival[i],
+                "waiting": None if end is None else end - table.arrival[i] - table.burst[i],
+                "max_wait": table.max_wait[i],
+            })
+        return results
+
+
+# Configuración de cada simulador original
+VARIANTS = {
+    # RR2.py: llegadas escalonadas y bloqueo de una unidad de tiempo
+    "rr2": {"block_time": 1},
+    # RR Tllegada.py: el bloqueo sólo salta el turno actual
+    "llegada": {"block_time": 0},
+    # RR prioridad.py: igual que el anterior pero ordenado por prioridad
+    "prioridad": {"block_time": 0, "policy": "priority"},
+    # Misma carga que "llegada", planificada con colas multinivel
+    "mlfq": {"block_time": 0, "policy": "mlfq"},
+}
+
+
+def _rng_state(state):
+    # random.Random.setstate pide tuplas (un estado guardado puede traer listas)
+    version, internal, gauss = state
+    return version, tuple(internal), gauss
+
+
+def make_engine(variant="llegada", **options):
+    # Crea un motor con la configuración de uno de los simuladores
+    config = dict(VARIANTS[variant])
+    config.update(options)
+    return RoundRobinEngine(**config)
+
+
+def build_workload(engine, count, variant, rng=None):
+    # Misma carga que genera el botón "Agregar Proceso" de cada simulador.
+    # Por defecto usa los flujos del motor; rng puede ser otro RandomStreams
+    # o un único random.Random para todo.
+    streams = engine.streams if rng is None else rng
+    if isinstance(streams, RandomStreams):
+        bursts, priorities, io_bursts = streams.bursts, streams.priorities, streams.io_bursts
+    else:
+        bursts = priorities = io_bursts = streams
+    for i in range(count):
+        burst = bursts.randint(5, 15)
+        priority = priorities.randint(1, 5) if variant == "prioridad" else 0
+        # En RR2.py cada proceso llega una unidad después del anterior
+        arrival = i if variant == "rr2" else 0
+        # Con modelo de E/S cada proceso tiene su propia ráfaga media de E/S
+        io_burst = io_bursts.randint(1, 2 * engine.io.io_burst - 1) if engine.io else 0
+        engine.add_process(burst, arrival=arrival, priority=priority, io_burst=io_burst)
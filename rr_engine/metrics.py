@@ -0,0 +1,462 @@
+"""Métricas de una simulación terminada, calculadas en una sola pasada.
+
+Con NumPy instalado se opera sobre las columnas completas (retorno, espera,
+respuesta y percentiles de todos los procesos a la vez); sin NumPy se usa un
+recorrido equivalente en Python puro.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+import math
+from array import array
+
+from .table import NONE
+
+PERCENTILES = (50, 95, 99)
+
+
+def _percentile(ordered, q):
+    # Interpolación lineal, igual que numpy.percentile por defecto
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _stats(values):
+    ordered = sorted(values)
+    return {
+        "mean": sum(ordered) / len(ordered) if ordered else None,
+        "max": ordered[-1] if ordered else None,
+        **{f"p{q}": _percentile(ordered, q) for q in PERCENTILES},
+    }
+
+
+def _stats_np(values):
+    if not len(values):
+        return {"mean": None, "max": None, **{f"p{q}": None for q in PERCENTILES}}
+    points = np.percentile(values, PERCENTILES)
+    return {
+        "mean": float(values.mean()),
+        "max": float(values.max()),
+        **{f"p{q}": float(v) for q, v in zip(PERCENTILES, points)},
+    }
+
+
+def context_switches(log):
+    # Cambios de contexto: turnos consecutivos de procesos distintos en la
+    # misma CPU
+    if np is not None and len(log) > 1:
+        core = np.frombuffer(log.core, dtype=np.int32)
+        pid = np.frombuffer(log.pid, dtype=np.int64)
+        order = np.argsort(core, kind="stable")
+        core, pid = core[order], pid[order]
+        return int(np.count_nonzero((core[1:] == core[:-1]) & (pid[1:] != pid[:-1])))
+    last = {}
+    switches = 0
+    for core, pid in zip(log.core, log.pid):
+        previous = last.get(core)
+        if previous is not None and previous != pid:
+            switches += 1
+        last[core] = pid
+    return switches
+
+
+def core_busy(log, cores):
+    # Tiempo ocupado de cada CPU
+    if np is not None and len(log):
+        durations = (np.frombuffer(log.end, dtype=np.int64)
+                     - np.frombuffer(log.start, dtype=np.int64))
+        core = np.frombuffer(log.core, dtype=np.int32)
+        return np.bincount(core, weights=durations, minlength=cores).astype(np.int64).tolist()
+    busy = [0] * cores
+    for core, start, end in zip(log.core, log.start, log.end):
+        busy[core] += end - start
+    return busy
+
+
+def starvation(table):
+    # Inanición por nivel de prioridad: cantidad de procesos, espera total
+    # media y la espera continua más larga en la cola de listos
+    levels = {}
+    for priority, arrival, burst, end, max_wait in zip(
+            table.priority, table.arrival, table.burst, table.end, table.max_wait):
+        level = levels.get(priority)
+        if level is None:
+            level = levels[priority] = {"processes": 0, "finished": 0, "waiting": 0, "max_wait": 0}
+        level["processes"] += 1
+        if end != NONE:
+            level["finished"] += 1
+            level["waiting"] += end - arrival - burst
+        if max_wait > level["max_wait"]:
+            level["max_wait"] = max_wait
+    return {
+        priority: {
+            "processes": level["processes"],
+            "waiting_mean": level["waiting"] / level["finished"] if level["finished"] else None,
+            "max_wait": level["max_wait"],
+        }
+        for priority, level in sorted(levels.items())
+    }
+
+
+def quantum_report(engine):
+    # Cómo cambió el quantum durante la corrida: valores extremos, cantidad
+    # de cambios, media ponderada por el tiempo que estuvo vigente cada valor
+    # e historial de (desde, quantum)
+    times, values = engine.quantum_times, engine.quantum_values
+    end = max(engine.time, times[-1])
+    weighted = sum(value * (until - since) for since, until, value
+                   in zip(times, list(times[1:]) + [end], values))
+    return {
+        "initial": values[0],
+        "final": values[-1],
+        "min": min(values),
+        "max": max(values),
+        "changes": len(values) - 1,
+        "mean": weighted / (end - times[0]) if end > times[0] else float(values[-1]),
+        "history": list(zip(times, values)),
+    }
+
+
+def device_report(engine):
+    # Por dispositivo de E/S: uso (fracción del tiempo total ocupado),
+    # operaciones atendidas, espera media en su cola y cola más larga
+    if engine.io is None:
+        return []
+    span = engine.time
+    return [{
+        "name": device.name,
+        "utilization": device.busy / span if span else 0.0,
+        "served": device.served,
+        "queue_wait_mean": device.queued_time / device.served if device.served else 0.0,
+        "max_queue": device.max_queue,
+    } for device in engine.io.devices]
+
+
+def summarize(engine):
+    # Devuelve un diccionario con las métricas agregadas de la corrida:
+    # retorno, espera y respuesta (media, máximo y percentiles), uso de CPU
+    # (total y por núcleo), migraciones, inanición por nivel de prioridad,
+    # evolución del quantum, tiempo perdido en cambios de contexto, uso de
+    # los dispositivos de E/S y rendimiento (procesos terminados por unidad de tiempo)
+    table = engine.processes
+    log = engine.timeline
+    if np is not None:
+        summary = _summarize_np(table, log)
+    else:
+        summary = _summarize_py(table, log)
+    span = summary["makespan"]
+    busy = core_busy(log, engine.cores)
+    overhead = sum(core_busy(engine.overhead, engine.cores))
+    summary.update({
+        "cores": engine.cores,
+        "cpu_utilization": summary["busy"] / (span * engine.cores) if span else 0.0,
+        "core_utilization": [b / span if span else 0.0 for b in busy],
+        "overhead": overhead,
+        # Fracción de la capacidad de CPU perdida en despachos y cambios de contexto
+        "overhead_fraction": overhead / (span * engine.cores) if span else 0.0,
+        "migrations": engine.migrations,
+        "steals": engine.steals,
+        "by_priority": starvation(table),
+        "devices": device_report(engine),
+        "quantum": {key: value for key, value in quantum_report(engine).items() if key != "history"},
+    })
+    return summary
+
+
+def _summarize_py(table, log):
+    turnaround, waiting, response = [], [], []
+    first_arrival = min(table.arrival) if len(table) else 0
+    for i in range(len(table)):
+        if table.start[i] != NONE:
+            response.append(table.start[i] - table.arrival[i])
+        if table.end[i] != NONE:
+            turnaround.append(table.end[i] - table.arrival[i])
+            waiting.append(turnaround[-1] - table.burst[i])
+    busy = sum(log.end) - sum(log.start)
+    span = (max(log.end) - first_arrival) if len(log) else 0
+    return {
+        "processes": len(table),
+        "finished": len(turnaround),
+        "makespan": span,
+        "busy": busy,
+        "context_switches": context_switches(log),
+        "throughput": len(turnaround) / span if span else 0.0,
+        "turnaround": _stats(turnaround),
+        "waiting": _stats(waiting),
+        "response": _stats(response),
+    }
+
+
+def _summarize_np(table, log):
+    arrival = np.frombuffer(table.arrival, dtype=np.int64)
+    burst = np.frombuffer(table.burst, dtype=np.int64)
+    start = np.frombuffer(table.start, dtype=np.int64)
+    end = np.frombuffer(table.end, dtype=np.int64)
+    seg_start = np.frombuffer(log.start, dtype=np.int64)
+    seg_end = np.frombuffer(log.end, dtype=np.int64)
+
+    done = end != NONE
+    turnaround = end[done] - arrival[done]
+    waiting = turnaround - burst[done]
+    response = (start - arrival)[start != NONE]
+    busy = int((seg_end - seg_start).sum())
+    span = int(seg_end.max() - arrival.min()) if len(seg_end) else 0
+    return {
+        "processes": len(arrival),
+        "finished": int(done.sum()),
+        "makespan": span,
+        "busy": busy,
+        "context_switches": context_switches(log),
+        "throughput": int(done.sum()) / span if span else 0.0,
+        "turnaround": _stats_np(turnaround),
+        "waiting": _stats_np(waiting),
+        "response": _stats_np(response),
+    }
+
+
+class SegmentProgress:
+    # Versión incremental de segment_progress para vistas que se refrescan
+    # seguido: el registro sólo crece, así que cada actualización procesa
+    # únicamente los segmentos nuevos
+    def __init__(self):
+        self.executed = array("q")  # Ejecutado acumulado al final de cada segmento
+        self._totals = {}
+
+    def update(self, log):
+        totals = self._totals
+        for i in range(len(self.executed), len(log)):
+            pid = log.pid[i]
+            total = totals.get(pid, 0) + log.end[i] - log.start[i]
+            totals[pid] = total
+            self.executed.append(total)
+
+
+def segment_progress(engine):
+    # Para cada segmento del registro devuelve (ejecutado acumulado, retorno
+    # parcial, espera parcial) del proceso al terminar ese segmento.
+    # Reemplaza la suma anidada sobre executions[:i+1] por una suma acumulada.
+    table = engine.processes
+    log = engine.timeline
+    if np is not None and len(log):
+        pid = np.frombuffer(log.pid, dtype=np.int64)
+        seg_start = np.frombuffer(log.start, dtype=np.int64)
+        seg_end = np.frombuffer(log.end, dtype=np.int64)
+        arrival = np.frombuffer(table.arrival, dtype=np.int64)[pid - 1]
+        # Suma acumulada por proceso: se ordena por pid (estable, conserva el
+        # orden cronológico) y se resta lo acumulado antes de cada grupo
+        order = np.argsort(pid, kind="stable")
+        durations = (seg_end - seg_start)[order]
+        running = np.cumsum(durations)
+        group_start = np.r_[True, pid[order][1:] != pid[order][:-1]]
+        offsets = np.maximum.accumulate(np.where(group_start, running - durations, 0))
+        executed = np.empty_like(running)
+        executed[order] = running - offsets
+        partial_turnaround = seg_end - arrival
+        return executed, partial_turnaround, partial_turnaround - executed
+
+    executed_by_pid = {}
+    executed, partial_turnaround, partial_waiting = [], [], []
+    for pid, start, end in zip(log.pid, log.start, log.end):
+        total = executed_by_pid.get(pid, 0) + end - start
+        executed_by_pid[pid] = total
+        turnaround = end - table.arrival[pid - 1]
+        executed.append(total)
+        partial_turnaround.append(turnaround)
+        partial_waiting.append(turnaround - total)
+    return executed, partial_turnaround, partial_waiting
+
+
+class RunningStats:
+    # Media y varianza en línea (Welford), sin guardar los valores
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+class LogHistogram:
+    # Histograma de cubetas logarítmicas, al estilo HDR: cada cubeta abarca un
+    # factor (1 + precision), así el error relativo de un percentil queda
+    # acotado por precision y la memoria crece con log(máximo), no con la
+    # cantidad de valores. Los enteros menores que 1 / precision caen cada
+    # uno en su propia cubeta y se reportan exactos.
+    def __init__(self, precision=0.01):
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self._buckets = {}      # cubeta -> [cantidad, mínimo, máximo]
+        self.count = 0
+
+    def _bucket(self, value):
+        if value <= 0:
+            return -1
+        return int(math.log(value) / self._log_base)
+
+    def add(self, value):
+        key = self._bucket(value)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [1, value, value]
+        else:
+            bucket[0] += 1
+            if value < bucket[1]:
+                bucket[1] = value
+            elif value > bucket[2]:
+                bucket[2] = value
+        self.count += 1
+
+    def percentile(self, q):
+        if not self.count:
+            return None
+        rank = (self.count - 1) * q / 100
+        seen = 0
+        for key in sorted(self._buckets):
+            count, low, high = self._buckets[key]
+            if seen + count > rank:
+                # Dentro de la cubeta se interpola entre el mínimo y el máximo vistos
+                if count == 1:
+                    return low
+                return low + (high - low) * (rank - seen) / (count - 1)
+            seen += count
+        return self._buckets[max(self._buckets)][2]
+
+
+class StreamSummary:
+    # Métricas de summarize() calculadas en línea para el modo streaming:
+    # recibe cada proceso terminado (como sink) y cada segmento, y no guarda
+    # ninguno. Se puede encadenar con otro sink.
+    def __init__(self, cores=1, sink=None, precision=0.01):
+        self.sink = sink
+        self.turnaround = (RunningStats(), LogHistogram(precision))
+        self.waiting = (RunningStats(), LogHistogram(precision))
+        self.response = (RunningStats(), LogHistogram(precision))
+        self.max_wait = RunningStats()
+        self.busy = 0
+        self.overhead = 0
+        self.context_switches = 0
+        self.segments = 0
+        self.first_arrival = None
+        self.last_end = 0
+        self._last_pid = [None] * cores
+        # Historial del quantum resumido (como quantum_report, sin el historial)
+        self.quantum = None             # Valor vigente; None hasta la primera entrada
+        self.quantum_initial = None
+        self.quantum_min = None
+        self.quantum_max = None
+        self.quantum_changes = 0
+        self._quantum_start = 0         # Desde cuándo hay historial
+        self._quantum_since = 0         # Desde cuándo vale el quantum vigente
+        self._quantum_weighted = 0      # Suma de valor * duración de los reemplazados
+        self._quantum_until = None      # Fin de la corrida
+
+    def __call__(self, record):
+        # record: tupla de FINISHED_FIELDS (id, arrival, burst, priority, start, end, max_wait)
+        _, arrival, burst, _, start, end, max_wait = record
+        turnaround = end - arrival
+        for (stats, histogram), value in ((self.turnaround, turnaround),
+                                          (self.waiting, turnaround - burst),
+                                          (self.response, start - arrival)):
+            stats.add(value)
+            histogram.add(value)
+        self.max_wait.add(max_wait)
+        if self.first_arrival is None or arrival < self.first_arrival:
+            self.first_arrival = arrival
+        if self.sink is not None:
+            self.sink(record)
+
+    def add_segments(self, log):
+        # Acumula los segmentos del registro (antes de vaciarlo)
+        last = self._last_pid
+        for pid, start, end, core in zip(log.pid, log.start, log.end, log.core):
+            self.busy += end - start
+            if last[core] is not None and last[core] != pid:
+                self.context_switches += 1
+            last[core] = pid
+            if end > self.last_end:
+                self.last_end = end
+        self.segments += len(log)
+
+    def add_quantum(self, times, values, until=None):
+        # Acumula entradas del historial del quantum (antes de descartarlas);
+        # until es el fin de la corrida, hasta donde vale el último valor
+        for since, value in zip(times, values):
+            if self.quantum is None:
+                self.quantum_initial = self.quantum_min = self.quantum_max = value
+                self._quantum_start = since
+            else:
+                self.quantum_min = min(self.quantum_min, value)
+                self.quantum_max = max(self.quantum_max, value)
+                self.quantum_changes += 1
+                self._quantum_weighted += self.quantum * (since - self._quantum_since)
+            self.quantum, self._quantum_since = value, since
+        if until is not None:
+            self._quantum_until = until
+
+    def _quantum_report(self):
+        end = max(self.last_end if self._quantum_until is None else self._quantum_until,
+                  self._quantum_since)
+        weighted = self._quantum_weighted + self.quantum * (end - self._quantum_since)
+        span = end - self._quantum_start
+        return {
+            "initial": self.quantum_initial,
+            "final": self.quantum,
+            "min": self.quantum_min,
+            "max": self.quantum_max,
+            "changes": self.quantum_changes,
+            "mean": weighted / span if span > 0 else float(self.quantum),
+        }
+
+    def add_overhead(self, log):
+        # Tiempo perdido en despachos y cambios de contexto
+        for start, end in zip(log.start, log.end):
+            self.overhead += end - start
+
+    def summary(self):
+        finished = self.turnaround[0].count
+        span = self.last_end - (self.first_arrival or 0)
+        return {
+            "finished": finished,
+            "makespan": span,
+            "busy": self.busy,
+            "overhead": self.overhead,
+            "segments": self.segments,
+            "context_switches": self.context_switches,
+            "throughput": finished / span if span else 0.0,
+            "cpu_utilization": self.busy / (span * len(self._last_pid)) if span else 0.0,
+            "overhead_fraction": self.overhead / (span * len(self._last_pid)) if span else 0.0,
+            "turnaround": _online_stats(*self.turnaround),
+            "waiting": _online_stats(*self.waiting),
+            "response": _online_stats(*self.response),
+            "max_wait": self.max_wait.max,
+            "quantum": None if self.quantum is None else self._quantum_report(),
+        }
+
+
+def _online_stats(stats, histogram):
+    return {
+        "mean": stats.mean if stats.count else None,
+        "std": math.sqrt(stats.variance),
+        "max": stats.max,
+        **{f"p{q}": histogram.percentile(q) for q in PERCENTILES},
+    }
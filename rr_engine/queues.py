@@ -0,0 +1,200 @@
+"""Colas de listos del motor.
+
+Despachar el siguiente proceso es O(1): ya no se recorre la lista completa
+de procesos saltando los terminados y bloqueados. Las colas guardan índices
+de la tabla de procesos.
+
+Para planificar por prioridad hay dos colas: PriorityRoundQueue reproduce las
+rondas del simulador original y PriorityHeapQueue da prioridad estricta con
+envejecimiento opcional. MlfqQueue es la cola multinivel con realimentación.
+
+Todas tienen getstate/setstate para los puntos de control (checkpoint.py).
+"""
+import heapq
+from array import array
+from collections import deque
+
+
+class FifoReadyQueue:
+    # Cola circular clásica de Round Robin
+    def __init__(self):
+        self._queue = deque()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def push(self, process):
+        # Llegada o desbloqueo: se forma al final
+        self._queue.append(process)
+
+    def requeue(self, process):
+        # Agotó su quantum: vuelve al final de la cola
+        self._queue.append(process)
+
+    def extend(self, processes):
+        # Llegada en lote, en orden
+        self._queue.extend(processes)
+
+    def pop(self):
+        return self._queue.popleft() if self._queue else None
+
+    def steal(self):
+        # Otra CPU se lleva el último de la cola (el que más iba a esperar)
+        return self._queue.pop() if self._queue else None
+
+    def getstate(self):
+        return array("q", self._queue)
+
+    def setstate(self, state):
+        self._queue = deque(state)
+
+
+class PriorityRoundQueue:
+    # Rondas ordenadas por prioridad, como hacía RR prioridad.py al ordenar la
+    # lista por (prioridad, llegada) al inicio de cada ronda: dentro de una
+    # ronda se atiende primero la prioridad más alta (número menor) y cada
+    # proceso corre una vez por ronda.
+    def __init__(self, priorities):
+        self._priorities = priorities  # Columna de prioridades de la tabla
+        self._current = {}   # prioridad -> deque de la ronda en curso
+        self._next = {}      # prioridad -> deque de la ronda siguiente
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _append(self, buckets, process):
+        priority = self._priorities[process]
+        bucket = buckets.get(priority)
+        if bucket is None:
+            bucket = buckets[priority] = deque()
+        bucket.append(process)
+
+    def push(self, process):
+        # Un proceso nuevo entra en la ronda en curso
+        self._append(self._current, process)
+        self._size += 1
+
+    def requeue(self, process):
+        # Ya corrió en esta ronda: espera a la siguiente
+        self._append(self._next, process)
+        self._size += 1
+
+    def pop(self):
+        if not self._size:
+            return None
+        if not self._current:
+            self._current, self._next = self._next, {}
+        # Hay a lo sumo un puñado de niveles de prioridad
+        priority = min(self._current)
+        bucket = self._current[priority]
+        process = bucket.popleft()
+        if not bucket:
+            del self._current[priority]
+        self._size -= 1
+        return process
+
+    def steal(self):
+        # Se roba en el mismo orden de la ronda para no romper las prioridades
+        return self.pop()
+
+    def getstate(self):
+        return ([(priority, array("q", bucket)) for priority, bucket in self._current.items()],
+                [(priority, array("q", bucket)) for priority, bucket in self._next.items()])
+
+    def setstate(self, state):
+        current, following = state
+        self._current = {priority: deque(bucket) for priority, bucket in current}
+        self._next = {priority: deque(bucket) for priority, bucket in following}
+        self._size = sum(len(bucket) for _, bucket in current + following)
+
+
+class MlfqQueue:
+    # Una cola FIFO por nivel; se despacha del nivel más alto con procesos.
+    # El nivel de cada proceso lo decide el motor (columna "level").
+    def __init__(self, levels, count):
+        self._levels = levels          # Columna de niveles de la tabla
+        self._queues = [deque() for _ in range(count)]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, process):
+        self._queues[self._levels[process]].append(process)
+        self._size += 1
+
+    # El motor ya bajó el nivel si agotó el quantum
+    requeue = push
+
+    def pop(self):
+        if not self._size:
+            return None
+        # Hay pocos niveles: recorrerlos es O(1)
+        for queue in self._queues:
+            if queue:
+                self._size -= 1
+                return queue.popleft()
+
+    def steal(self):
+        return self.pop()
+
+    def boost(self):
+        # Todos al nivel más alto, conservando el orden entre niveles
+        top = self._queues[0]
+        for queue in self._queues[1:]:
+            top.extend(queue)
+            queue.clear()
+
+    def getstate(self):
+        return [array("q", queue) for queue in self._queues]
+
+    def setstate(self, state):
+        self._queues = [deque(queue) for queue in state]
+        self._size = sum(len(queue) for queue in self._queues)
+
+
+class PriorityHeapQueue:
+    # Prioridad estricta sobre un montículo: siempre corre el proceso listo de
+    # mejor prioridad (número menor) y, a igual prioridad, el que llegó antes
+    # a la cola. Sin envejecimiento los procesos de baja prioridad pueden
+    # esperar indefinidamente mientras haya trabajo más prioritario.
+    #
+    # Con envejecimiento cada `aging` unidades de espera mejoran un nivel la
+    # prioridad efectiva: prioridad - (ahora - encolado) / aging. Comparar esa
+    # expresión entre dos procesos en el mismo instante equivale a comparar
+    # prioridad * aging + encolado, que no cambia mientras el proceso espera,
+    # así que el montículo nunca se reordena y despachar sigue siendo O(log n).
+    def __init__(self, priorities, clock, aging=0):
+        self._priorities = priorities  # Columna de prioridades de la tabla
+        self._clock = clock            # Función que devuelve el tiempo actual
+        self.aging = aging             # Unidades de espera por nivel (0: sin envejecimiento)
+        self._heap = []                # (clave, secuencia, índice)
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, process):
+        priority = self._priorities[process]
+        key = priority * self.aging + self._clock() if self.aging else priority
+        self._seq += 1
+        heapq.heappush(self._heap, (key, self._seq, process))
+
+    # Sin rondas: agotar el quantum o desbloquearse es volver a la cola
+    requeue = push
+
+    def pop(self):
+        return heapq.heappop(self._heap)[2] if self._heap else None
+
+    def steal(self):
+        # Se roba el de mejor prioridad efectiva, igual que un despacho local
+        return self.pop()
+
+    def getstate(self):
+        # El montículo se guarda tal cual: una lista ya ordenada como montículo
+        return list(self._heap), self._seq
+
+    def setstate(self, state):
+        heap, self._seq = state
+        self._heap = [tuple(entry) for entry in heap]
@@ -0,0 +1,56 @@
+"""Flujos de números aleatorios con semilla, separados por uso.
+
+Cada simulación tiene su propio juego de generadores en lugar de usar el
+módulo random global: llegadas, ráfagas, prioridades, bloqueos, la duración
+de cada operación de E/S y la ráfaga media de E/S de cada proceso sacan
+números de flujos distintos, derivados de una única semilla. Con la misma
+semilla la corrida se repite exactamente, y agregar un proceso o cambiar la
+política no altera la secuencia de los demás flujos.
+
+Las semillas de cada flujo se derivan del texto "semilla-nombre" (random
+siembra con SHA-512 las cadenas), así no dependen de PYTHONHASHSEED ni del
+orden en que se piden.
+"""
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+# io: servicio de los dispositivos durante la corrida; io_bursts: ráfaga
+# media de E/S de cada proceso al generar la carga
+STREAMS = ("arrivals", "bursts", "priorities", "blocking", "io", "io_bursts")
+
+
+def derive_seed(base, *parts):
+    # Semilla determinista de 63 bits a partir de una semilla base y etiquetas
+    return random.Random("-".join(str(p) for p in (base,) + parts)).getrandbits(63)
+
+
+def new_seed():
+    # Semilla nueva para corridas sin semilla; se guarda para poder repetirlas
+    return random.SystemRandom().getrandbits(63)
+
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        self.seed = new_seed() if seed is None else seed
+        for name in STREAMS:
+            setattr(self, name, random.Random(derive_seed(self.seed, name)))
+
+    def numpy(self, name):
+        # Generador de NumPy (PCG64) para generar columnas enteras de una vez;
+        # produce otra secuencia que el flujo de Python del mismo nombre
+        if np is None:
+            raise RuntimeError("Los generadores vectorizados requieren NumPy")
+        return np.random.default_rng(derive_seed(self.seed, name))
+
+    def getstate(self):
+        return {name: getattr(self, name).getstate() for name in STREAMS}
+
+    def setstate(self, state):
+        # Un snapshot anterior a un flujo nuevo lo deja en su semilla inicial
+        for name in STREAMS:
+            if name in state:
+                getattr(self, name).setstate(state[name])
@@ -0,0 +1,141 @@
+"""Barrido de parámetros: política x quantum (fijo o adaptativo) x bloqueo x
+núcleos x carga de trabajo.
+
+Cada combinación es una simulación independiente que corre en un
+ProcessPoolExecutor, así se usan todos los núcleos. Las semillas se derivan
+de la semilla base y de la combinación (no del proceso trabajador que la
+ejecuta), por lo que los resultados son los mismos con cualquier cantidad de
+trabajadores. Todas las políticas ven la misma carga y la misma secuencia de
+bloqueos, así que sus resultados se pueden comparar fila a fila.
+
+    python -m rr_engine.sweep --politica rr mlfq --quantum 2 4 8 16 --adaptativo fijo media --bloqueo 0 0.1 --cpus 1 2 4 \\
+        --carga 100 1000 trazas/produccion.rrt --semilla 7 --salida barrido.csv
+"""
+import argparse
+import csv
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import POLICIES, VARIANTS, make_engine
+from .metrics import summarize
+from .streams import derive_seed
+from .traces import load_trace
+from .workload import load_workload
+
+COLUMNS = (
+    "variant", "policy", "workload", "cores", "quantum", "adaptive", "quantum_mean",
+    "quantum_changes", "block_prob", "seed", "processes",
+    "makespan", "context_switches", "overhead_fraction", "migrations", "cpu_utilization", "throughput",
+    "waiting_mean", "waiting_p99", "turnaround_mean", "turnaround_p99",
+    "response_mean", "response_p99",
+)
+
+
+def run_one(config):
+    # Ejecuta una combinación; debe ser una función de módulo para poder
+    # enviarse a otro proceso
+    variant, policy, workload, cores, quantum, adaptive, block_prob, seed, costs = config
+    options = {"policy": policy} if policy else {}
+    # La semilla no depende de la política: todas ven los mismos bloqueos
+    engine = make_engine(variant, quantum=quantum, block_prob=block_prob, cores=cores,
+                         adaptive=adaptive, **costs, **options,
+                         seed=derive_seed(seed, "sim", workload, cores, quantum, block_prob))
+    if isinstance(workload, int):
+        # La misma carga generada para todas las combinaciones que la comparten
+        load_workload(engine, workload, variant, seed=derive_seed(seed, "workload", workload))
+    else:
+        load_trace(engine, workload)
+    engine.run()
+
+    summary = summarize(engine)
+    return {
+        "variant": variant,
+        "policy": engine.policy,
+        "workload": workload,
+        "cores": cores,
+        "quantum": quantum,
+        "adaptive": adaptive or "",
+        "quantum_mean": summary["quantum"]["mean"],
+        "quantum_changes": summary["quantum"]["changes"],
+        "block_prob": block_prob,
+        "seed": seed,
+        "processes": summary["processes"],
+        "makespan": summary["makespan"],
+        "context_switches": summary["context_switches"],
+        "overhead_fraction": summary["overhead_fraction"],
+        "migrations": summary["migrations"],
+        "cpu_utilization": summary["cpu_utilization"],
+        "throughput": summary["throughput"],
+        "waiting_mean": summary["waiting"]["mean"],
+        "waiting_p99": summary["waiting"]["p99"],
+        "turnaround_mean": summary["turnaround"]["mean"],
+        "turnaround_p99": summary["turnaround"]["p99"],
+        "response_mean": summary["response"]["mean"],
+        "response_p99": summary["response"]["p99"],
+    }
+
+
+def sweep(quantums, block_probs, workloads, variant="llegada", seed=0, workers=None, cores=(1,),
+          policies=(None,), adaptives=(None,), switch_cost=0, dispatch_latency=0):
+    # Devuelve una fila de resultados por combinación, en el orden de la grilla.
+    # Una política None usa la de la variante; un adaptive None deja el
+    # quantum fijo (en ese caso "quantum" es el valor fijo, si no el inicial).
+    # Los costos de cambio de contexto se aplican a todas las combinaciones.
+    costs = {"switch_cost": switch_cost, "dispatch_latency": dispatch_latency}
+    configs = [(variant, policy, workload, n, quantum, adaptive, block_prob, seed, costs)
+               for workload, n, policy, adaptive, quantum, block_prob
+               in itertools.product(workloads, cores, policies, adaptives, quantums, block_probs)]
+    if workers == 1:
+        return [run_one(config) for config in configs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_one, configs))
+
+
+def write_results(rows, out):
+    writer = csv.DictWriter(out, fieldnames=COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def _workload(value):
+    # Un número es una carga generada de ese tamaño; si no, una ruta de traza
+    return int(value) if value.isdigit() else value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de parámetros del simulador Round Robin")
+    parser.add_argument("--quantum", type=int, nargs="+", default=[5])
+    parser.add_argument("--bloqueo", type=float, nargs="+", default=[0.1],
+                        help="Probabilidades de bloqueo por unidad de tiempo")
+    parser.add_argument("--carga", type=_workload, nargs="+", default=[100],
+                        help="Cantidad de procesos a generar o rutas de trazas")
+    parser.add_argument("--cpus", type=int, nargs="+", default=[1], help="Cantidades de núcleos")
+    parser.add_argument("--politica", choices=POLICIES, nargs="+", default=[None],
+                        help="Políticas a comparar (por defecto, la de la variante)")
+    parser.add_argument("--adaptativo", choices=("fijo", "media", "mediana"), nargs="+",
+                        default=["fijo"], help="Quantum fijo o recalculado con la ráfaga restante")
+    parser.add_argument("--cambio-contexto", type=int, default=0, metavar="U",
+                        help="Costo de pasar la CPU de un proceso a otro")
+    parser.add_argument("--latencia", type=int, default=0, metavar="U",
+                        help="Costo de cada despacho del planificador")
+    parser.add_argument("--variante", choices=sorted(VARIANTS), default="llegada")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--trabajadores", type=int, default=os.cpu_count())
+    parser.add_argument("--salida", help="Archivo CSV de resultados (por defecto, la salida estándar)")
+    args = parser.parse_args(argv)
+
+    rows = sweep(args.quantum, args.bloqueo, args.carga, args.variante,
+                 args.semilla, args.trabajadores, args.cpus, args.politica,
+                 [{"fijo": None, "media": "mean", "mediana": "median"}[a] for a in args.adaptativo],
+                 args.cambio_contexto, args.latencia)
+    if args.salida:
+        with open(args.salida, "w", newline="") as f:
+            write_results(rows, f)
+    else:
+        write_results(rows, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+"""Tabla de procesos y registro de segmentos en columnas.
+
+En lugar de un diccionario por proceso y otro por segmento de Gantt, cada
+campo es una columna de `array` (estructura de arreglos). Un proceso se
+identifica por su índice en la tabla (id - 1). Las clases Process y Segment
+son vistas livianas sobre una fila, para que la interfaz siga leyendo
+atributos como antes.
+
+En modo streaming las filas de los procesos terminados se liberan y se
+reutilizan (release), así la tabla no crece con la corrida; por eso el ID de
+cada proceso se guarda en su propia columna en lugar de deducirse del índice.
+
+El registro de segmentos guarda además por qué terminó cada turno (cause) y
+responde consultas por rango de tiempo y por proceso sin recorrerlo entero.
+Con coalesce=True un turno que sigue sin pausa al anterior del mismo
+proceso en la misma CPU extiende ese segmento en lugar de agregar otro.
+
+getstate/setstate devuelven y reponen las columnas (para checkpoint.py);
+setstate las reemplaza en el lugar, así las colas que guardan referencias a
+una columna (prioridad, nivel) siguen viéndolas.
+"""
+import bisect
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+# Estados de un proceso (los mismos textos que muestra la tabla)
+LISTO = "Listo"
+BLOQUEADO = "Bloqueado"
+TERMINADO = "Terminado"
+
+# Códigos de estado guardados en la columna "state"
+READY = 0
+BLOCKED = 1
+DONE = 2
+STATE_NAMES = (LISTO, BLOQUEADO, TERMINADO)
+
+# Códigos de la columna "cause": por qué terminó el segmento
+QUANTUM = 0     # Agotó el quantum y volvió a la cola
+BLOCK = 1       # Se bloqueó (block_time fijo)
+IO = 2          # Pidió una operación de E/S
+FINISH = 3      # Terminó su ráfaga
+DISPATCH = 4    # Registro de overhead: latencia del despacho
+SWITCH = 5      # Registro de overhead: cambio de contexto (y despacho)
+CAUSE_NAMES = ("Quantum", "Bloqueo", "E/S", "Fin", "Despacho", "Cambio de contexto")
+
+NONE = -1  # Valor de start/end cuando todavía no ocurrió
+
+
+class ProcessTable:
+    def __init__(self):
+        self.pid = array("q")           # ID del proceso (índice + 1 si no se reutilizan filas)
+        self.arrival = array("q")
+        self.burst = array("q")
+        self.priority = array("i")
+        self.remaining = array("q")
+        self.start = array("q")
+        self.end = array("q")
+        self.state = array("b")
+        self.last_segment = array("q")  # Último segmento del proceso en el registro
+        self.last_core = array("i")     # CPU donde corrió por última vez
+        self.ready_since = array("q")   # Desde cuándo espera en la cola de listos
+        self.max_wait = array("q")      # Espera continua más larga en la cola de listos
+        self.level = array("b")         # Nivel de MLFQ (0 = quantum más corto)
+        self.io_burst = array("q")      # Ráfaga media de E/S (0: la del modelo de E/S)
+        self.segments = SegmentLog()
+        self._free = []                 # Filas liberadas, para reutilizar
+        self._next_pid = 1
+
+    def _columns(self):
+        # Columnas de cada fila, en el orden de los valores de append
+        return (self.pid, self.arrival, self.burst, self.priority, self.remaining, self.start,
+                self.end, self.state, self.last_segment, self.last_core, self.ready_since,
+                self.max_wait, self.level, self.io_burst)
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("proceso fuera de rango")
+        return Process(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield Process(self, index)
+
+    def append(self, arrival, burst, priority=0, io_burst=0):
+        # Agrega una fila (o reutiliza una liberada) y devuelve su índice
+        values = (self._next_pid, arrival, burst, priority, burst, NONE, NONE, READY,
+                  NONE, NONE, arrival, 0, 0, io_burst)
+        self._next_pid += 1
+        if self._free:
+            index = self._free.pop()
+            for column, value in zip(self._columns(), values):
+                column[index] = value
+            return index
+        for column, value in zip(self._columns(), values):
+            column.append(value)
+        return len(self.arrival) - 1
+
+    def getstate(self):
+        return {
+            "columns": self._columns(),
+            "free": list(self._free),
+            "next_pid": self._next_pid,
+            "segments": self.segments.getstate(),
+        }
+
+    def setstate(self, state):
+        for column, saved in zip(self._columns(), state["columns"]):
+            column[:] = saved
+        self._free = list(state["free"])
+        self._next_pid = state["next_pid"]
+        self.segments.setstate(state["segments"])
+
+    def release(self, index):
+        # La fila de un proceso terminado queda libre para el próximo
+        self._free.append(index)
+
+    @property
+    def live(self):
+        # Filas en uso (procesos no liberados)
+        return len(self) - len(self._free)
+
+    def extend(self, arrival, burst, priority=None, io_burst=None):
+        # Agrega muchas filas a partir de columnas y devuelve el índice de la
+        # primera. Los arreglos NumPy se copian como bloques de bytes, sin
+        # pasar por un objeto de Python por valor.
+        first = len(self)
+        count = len(arrival)
+        if any(column is not None and len(column) != count for column in (burst, priority, io_burst)):
+            raise ValueError("Las columnas de la carga tienen distinto largo")
+        self.pid.extend(array("q", range(self._next_pid, self._next_pid + count)))
+        self._next_pid += count
+        _extend_column(self.arrival, arrival)
+        _extend_column(self.burst, burst)
+        _extend_column(self.remaining, burst)
+        _extend_column(self.ready_since, arrival)
+        if priority is None:
+            self.priority.extend(array("i", [0]) * count)
+        else:
+            _extend_column(self.priority, priority)
+        if io_burst is None:
+            self.io_burst.extend(array("q", [0]) * count)
+        else:
+            _extend_column(self.io_burst, io_burst)
+        for column in (self.start, self.end, self.last_segment):
+            column.extend(array("q", [NONE]) * count)
+        self.last_core.extend(array("i", [NONE]) * count)
+        self.state.extend(array("b", [READY]) * count)
+        self.max_wait.extend(array("q", [0]) * count)
+        self.level.extend(array("b", [0]) * count)
+        return first
+
+    def segment_indices(self, index):
+        # Índices en el registro de los segmentos de un proceso, en orden
+        # cronológico, siguiendo la cadena de "prev" desde el último
+        prev = self.segments.prev
+        chain = []
+        segment = self.last_segment[index]
+        while segment != NONE:
+            chain.append(segment)
+            segment = prev[segment]
+        chain.reverse()
+        return chain
+
+
+def _extend_column(column, values):
+    if np is not None and isinstance(values, np.ndarray):
+        # Los códigos de tipo de array ("q", "i", "b") valen también para NumPy
+        column.frombytes(np.ascontiguousarray(values, dtype=column.typecode).tobytes())
+    else:
+        column.extend(values)
+
+
+class SegmentLog:
+    # Registro de solo-agregado de los turnos de CPU (datos del Gantt)
+    def __init__(self, coalesce=False):
+        self.pid = array("q")
+        self.start = array("q")
+        self.end = array("q")
+        self.state = array("b")
+        self.prev = array("q")  # Segmento anterior del mismo proceso
+        self.core = array("i")  # CPU en la que corrió
+        self.cause = array("b")  # Por qué terminó (QUANTUM, BLOCK, ...)
+        self.coalesce = coalesce  # Une turnos contiguos del mismo proceso
+        self.max_length = 0     # Segmento más largo, para acotar las consultas por rango
+        self._ordered = True    # Si los fines están en orden (se agregan al terminar)
+        self._by_pid = {}       # pid -> índices de sus segmentos, armado al consultar
+        self._indexed = 0       # Segmentos ya incluidos en _by_pid
+
+    def _columns(self):
+        return self.pid, self.start, self.end, self.state, self.prev, self.core, self.cause
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segmento fuera de rango")
+        return Segment(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield Segment(self, index)
+
+    def clear(self):
+        # Descarta todos los segmentos (modo streaming, una vez procesados)
+        for column in self._columns():
+            del column[:]
+        self.max_length = 0
+        self._ordered = True
+        self._by_pid = {}
+        self._indexed = 0
+
+    def getstate(self):
+        return {
+            "columns": self._columns(),
+            "coalesce": self.coalesce,
+            "max_length": self.max_length,
+            "ordered": self._ordered,
+        }
+
+    def setstate(self, state):
+        for column, saved in zip(self._columns(), state["columns"]):
+            column[:] = saved
+        self.coalesce = state["coalesce"]
+        self.max_length = state["max_length"]
+        self._ordered = state["ordered"]
+        self._by_pid = {}
+        self._indexed = 0
+
+    def extend(self, pid, start, end, state, prev, core, cause):
+        # Agrega un bloque de segmentos por columnas (por ejemplo del motor
+        # compilado); no se unen con el último segmento
+        if not len(pid):
+            return
+        last = self.end[-1] if len(self) else None
+        for column, values in zip(self._columns(), (pid, start, end, state, prev, core, cause)):
+            _extend_column(column, values)
+        first = len(self) - len(pid)
+        if np is not None:
+            starts = np.frombuffer(self.start, dtype=np.int64)[first:]
+            ends = np.frombuffer(self.end, dtype=np.int64)[first:]
+            self.max_length = max(self.max_length, int((ends - starts).max()))
+            ordered = bool((ends[1:] >= ends[:-1]).all())
+        else:
+            ends = self.end[first:]
+            self.max_length = max(self.max_length, max(e - s for s, e in zip(self.start[first:], ends)))
+            ordered = all(a <= b for a, b in zip(ends, ends[1:]))
+        self._ordered = self._ordered and ordered and (last is None or last <= self.end[first])
+
+    def append(self, pid, start, end, state, prev, core=0, cause=QUANTUM):
+        # Devuelve el índice del segmento (el del último si se unió con él)
+        count = len(self.pid)
+        if (self.coalesce and count and self.pid[-1] == pid and self.core[-1] == core
+                and self.end[-1] == start):
+            self.end[-1] = end
+            self.state[-1] = state
+            self.cause[-1] = cause
+            self.max_length = max(self.max_length, end - self.start[-1])
+            return count - 1
+        if count and end < self.end[-1]:
+            self._ordered = False
+        self.max_length = max(self.max_length, end - start)
+        self.pid.append(pid)
+        self.start.append(start)
+        self.end.append(end)
+        self.state.append(state)
+        self.prev.append(prev)
+        self.core.append(core)
+        self.cause.append(cause)
+        return count
+
+    def window(self, t0, t1, limit=None):
+        # Índices, en orden, de los segmentos que corrieron en algún momento
+        # de [t0, t1). Con los fines ordenados sólo se miran los que terminan
+        # entre t0 y t1 + el segmento más largo (búsqueda binaria). Con limit
+        # devuelve None si hay más candidatos que eso (vista muy alejada)
+        if self._ordered:
+            if np is not None:
+                ends = np.frombuffer(self.end, dtype=np.int64)
+                low = int(np.searchsorted(ends, t0, "right"))
+                high = int(np.searchsorted(ends, t1 + self.max_length, "left"))
+            else:
+                low = bisect.bisect_right(self.end, t0)
+                high = bisect.bisect_left(self.end, t1 + self.max_length)
+        else:
+            low, high = 0, len(self)
+        if limit is not None and high - low > limit:
+            return None
+        if np is not None:
+            starts = np.frombuffer(self.start, dtype=np.int64)[low:high]
+            ends = np.frombuffer(self.end, dtype=np.int64)[low:high]
+            return (np.flatnonzero((starts < t1) & (ends > t0)) + low).tolist()
+        return [i for i in range(low, high) if self.start[i] < t1 and self.end[i] > t0]
+
+    def of_pid(self, pid):
+        # Índices, en orden, de todos los segmentos de un proceso; el índice
+        # por pid se completa sólo con los segmentos nuevos desde la última consulta
+        by_pid = self._by_pid
+        for i in range(self._indexed, len(self)):
+            indices = by_pid.get(self.pid[i])
+            if indices is None:
+                indices = by_pid[self.pid[i]] = array("q")
+            indices.append(i)
+        self._indexed = len(self)
+        return by_pid.get(pid, array("q")).tolist()
+
+
+class Process:
+    # Vista de una fila de ProcessTable con la interfaz del antiguo diccionario
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __eq__(self, other):
+        return (isinstance(other, Process) and other._table is self._table
+                and other._index == self._index)
+
+    def __hash__(self):
+        return hash((id(self._table), self._index))
+
+    @property
+    def id(self):
+        return self._table.pid[self._index]
+
+    @property
+    def arrival(self):
+        return self._table.arrival[self._index]
+
+    @property
+    def burst(self):
+        return self._table.burst[self._index]
+
+    @property
+    def priority(self):
+        return self._table.priority[self._index]
+
+    @property
+    def remaining(self):
+        return self._table.remaining[self._index]
+
+    @property
+    def start(self):
+        value = self._table.start[self._index]
+        return None if value == NONE else value
+
+    @property
+    def end(self):
+        value = self._table.end[self._index]
+        return None if value == NONE else value
+
+    @property
+    def state(self):
+        return STATE_NAMES[self._table.state[self._index]]
+
+    @property
+    def turnaround(self):
+        # Tiempo total desde la llegada hasta el fin
+        end = self.end
+        if end is None:
+            return None
+        return end - self.arrival
+
+    @property
+    def waiting(self):
+        # Tiempo de espera en cola (retorno menos ráfaga)
+        end = self.end
+        if end is None:
+            return None
+        return end - self.arrival - self.burst
+
+    @property
+    def max_wait(self):
+        # Espera continua más larga en la cola de listos (inanición)
+        return self._table.max_wait[self._index]
+
+    @property
+    def executions(self):
+        # Segmentos del proceso en orden cronológico
+        log = self._table.segments
+        return [Segment(log, i) for i in self._table.segment_indices(self._index)]
+
+    def as_dict(self):
+        # Formato de los diccionarios que usaban los simuladores originales
+        return {
+            "id": self.id,
+            "arrival": self.arrival,
+            "burst": self.burst,
+            "priority": self.priority,
+            "start": self.start,
+            "end": self.end,
+            "turnaround": self.turnaround,
+            "waiting": self.waiting,
+            "remaining": self.remaining,
+            "state": self.state,
+            "executions": [e.interval for e in self.executions],
+        }
+
+
+class Segment:
+    # Vista de una fila de SegmentLog
+    __slots__ = ("_log", "_index")
+
+    def __init__(self, log, index):
+        self._log = log
+        self._index = index
+
+    @property
+    def index(self):
+        # Posición del segmento en el registro
+        return self._index
+
+    @property
+    def id(self):
+        return self._log.pid[self._index]
+
+    @property
+    def core(self):
+        return self._log.core[self._index]
+
+    @property
+    def start(self):
+        return self._log.start[self._index]
+
+    @property
+    def end(self):
+        return self._log.end[self._index]
+
+    @property
+    def state(self):
+        # Estado del proceso al terminar el segmento
+        return STATE_NAMES[self._log.state[self._index]]
+
+    @property
+    def cause(self):
+        # Por qué terminó el segmento
+        return CAUSE_NAMES[self._log.cause[self._index]]
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    @property
+    def interval(self):
+        return f"({self.start}-{self.end})"
@@ -0,0 +1,144 @@
+"""Ocupación agregada del registro de segmentos, para dibujar a cualquier zoom.
+
+Un Gantt de millones de segmentos no se puede dibujar barra por barra. Con
+el zoom alejado alcanza con saber, para cada carril (proceso o CPU) y cada
+tramo de tiempo, qué fracción del tramo estuvo ocupada. OccupancyTiles
+ordena una sola vez los inicios y fines de los segmentos de cada carril (o
+de cada banda de carriles contiguos, cuando hay más carriles que filas en
+pantalla) y guarda sus sumas acumuladas. Con eso el tiempo ocupado hasta
+cualquier instante t es
+
+    ocupado(t) = sum(t - inicio, inicios < t) - sum(t - fin, fines < t)
+
+que sale con dos búsquedas binarias, sin recorrer los segmentos; vale aunque
+los segmentos de una banda se solapen (varias CPUs). Cada tramo se evalúa
+en ``oversample`` subtramos para dar, además de la ocupación media, la
+mínima y la máxima (la envolvente, como al reducir una forma de onda).
+
+Los carriles se numeran como en el Gantt: el pid, o la CPU + 1. Requiere
+NumPy. Cuando el registro crece (la reproducción en vivo) sólo se ordenan
+los segmentos nuevos y se insertan en las tablas de cada agrupamiento; con
+coalesce el último segmento todavía puede alargarse, así que queda fuera de
+las tablas y se suma aparte.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+
+class OccupancyTiles:
+    def __init__(self, log, by_core=False):
+        if np is None:
+            raise RuntimeError("La ocupación agregada requiere NumPy")
+        self.log = log
+        self.by_core = by_core
+        self._prefix = {}   # tamaño de banda -> (largo del registro, tablas)
+
+    def lanes(self):
+        # Carril de cada segmento del registro
+        if self.by_core:
+            return np.frombuffer(self.log.core, dtype=np.int32).astype(np.int64) + 1
+        return np.frombuffer(self.log.pid, dtype=np.int64)
+
+    def _tables(self, group):
+        # Tablas de los segmentos que ya no cambian
+        count = len(self.log) - 1 if self.log.coalesce and len(self.log) else len(self.log)
+        cached = self._prefix.get(group)
+        if cached is not None and cached[0] == count:
+            return cached[1]
+        if cached is not None and cached[0] < count:
+            # Sólo los nuevos: se ordenan y se insertan en su lugar de cada banda
+            tables = _merge(cached[1], *self._sorted(group, cached[0], count))
+        else:
+            # Primera vez, o el registro se achicó (se repuso un estado anterior)
+            keys, starts, ends = self._sorted(group, 0, count)
+            bands, offsets = np.unique(keys, return_index=True)
+            tables = (starts, ends, bands, np.append(offsets, len(keys)),
+                      _sums(starts), _sums(ends))
+        self._prefix[group] = (count, tables)
+        return tables
+
+    def _sorted(self, group, first, last):
+        # Banda, inicios y fines de los segmentos [first, last), ordenados
+        # por banda y, dentro de cada una, por valor
+        start = np.frombuffer(self.log.start, dtype=np.int64)[first:last]
+        end = np.frombuffer(self.log.end, dtype=np.int64)[first:last]
+        band = (self.lanes()[first:last] - 1) // group
+        by_start = np.lexsort((start, band))
+        return band[by_start], start[by_start], end[np.lexsort((end, band))]
+
+    def busy(self, band, edges, group=1):
+        # Tiempo ocupado de la banda desde el principio hasta cada borde
+        starts, ends, bands, offsets, start_sums, end_sums = self._tables(group)
+        position = np.searchsorted(bands, band)
+        if position == len(bands) or bands[position] != band:
+            occupied = np.zeros(len(edges))
+        else:
+            low, high = offsets[position], offsets[position + 1]
+            began = np.searchsorted(starts[low:high], edges, "left")
+            ended = np.searchsorted(ends[low:high], edges, "left")
+            occupied = ((began * edges - (start_sums[low + began] - start_sums[low]))
+                        - (ended * edges - (end_sums[low + ended] - end_sums[low])))
+        if self.log.coalesce and len(self.log):
+            # El último segmento, que todavía puede alargarse
+            last = len(self.log) - 1
+            lane = self.log.core[last] + 1 if self.by_core else self.log.pid[last]
+            if (lane - 1) // group == band:
+                start, end = self.log.start[last], self.log.end[last]
+                occupied = occupied + np.clip(edges - start, 0, end - start)
+        return occupied
+
+    def tiles(self, t0, t1, buckets, first_lane, last_lane, group=1, oversample=4, until=None):
+        # Ocupación (media, mínima, máxima) de cada banda visible en buckets
+        # tramos iguales de [t0, t1). Devuelve (bandas, media, mínima, máxima)
+        # con una fila por banda; 1 es una banda completamente ocupada. Con
+        # until no se cuenta nada posterior a ese instante
+        edges = np.linspace(t0, t1, buckets * oversample + 1)
+        if until is not None:
+            edges = np.minimum(edges, until)
+        width = (t1 - t0) / (buckets * oversample) * group
+        first, last = (first_lane - 1) // group, (last_lane - 1) // group
+        bands = np.arange(first, last + 1)
+        occupancy = np.empty((len(bands), buckets, oversample))
+        for row, band in enumerate(bands):
+            occupancy[row] = (np.diff(self.busy(band, edges, group)) / width).reshape(buckets, oversample)
+        return bands, occupancy.mean(axis=2), occupancy.min(axis=2), occupancy.max(axis=2)
+
+
+
+def _sums(values, sums=None, first=0):
+    # Sumas acumuladas con un 0 adelante; con sums, se copian las de antes
+    # de first y se recalculan sólo las siguientes
+    total = np.empty(len(values) + 1, dtype=np.int64)
+    total[:first + 1] = 0 if sums is None else sums[:first + 1]
+    np.cumsum(values[first:], out=total[first + 1:])
+    total[first + 1:] += total[first]
+    return total
+
+
+def _merge(tables, keys, new_starts, new_ends):
+    # Inserta los segmentos nuevos (ordenados por banda y valor) en las
+    # tablas; una búsqueda por banda tocada
+    starts, ends, bands, offsets, start_sums, end_sums = tables
+    touched, first, added = np.unique(keys, return_index=True, return_counts=True)
+    at = np.searchsorted(bands, touched)
+    known = at < len(bands)
+    known[known] = bands[at[known]] == touched[known]
+    at_start = np.empty(len(keys), dtype=np.int64)
+    at_end = np.empty(len(keys), dtype=np.int64)
+    for position, present, a, b in zip(at, known, first, first + added):
+        low = offsets[position]
+        high = offsets[position + 1] if present else low
+        at_start[a:b] = low + np.searchsorted(starts[low:high], new_starts[a:b], "right")
+        at_end[a:b] = low + np.searchsorted(ends[low:high], new_ends[a:b], "right")
+    # Bandas nuevas con tamaño 0, luego se suman los agregados a cada una
+    sizes = np.insert(np.diff(offsets), at[~known], 0)
+    bands = np.insert(bands, at[~known], touched[~known])
+    sizes[np.searchsorted(bands, touched)] += added
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    starts = np.insert(starts, at_start, new_starts)
+    ends = np.insert(ends, at_end, new_ends)
+    # Las posiciones están en orden: antes de la primera nada cambió
+    return (starts, ends, bands, offsets,
+            _sums(starts, start_sums, at_start[0]), _sums(ends, end_sums, at_end[0]))
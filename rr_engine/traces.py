@@ -0,0 +1,158 @@
+"""Carga y exportación de cargas de trabajo (trazas) en lote.
+
+Formatos soportados, elegidos por la extensión del archivo:
+
+* ``.csv``: encabezado ``arrival,burst[,priority]``.
+* ``.jsonl`` / ``.ndjson``: un objeto ``{"arrival", "burst", "priority"}`` por línea.
+* ``.rrt``: binario compacto, cabecera de 8 bytes ``RRTRACE1`` seguida de
+  registros de tres enteros little-endian de 64 bits (llegada, ráfaga,
+  prioridad). Se lee con ``mmap`` sin copiar el archivo a memoria.
+* ``.npy``: arreglo NumPy de forma (n, 3) y tipo int64, abierto con
+  ``mmap_mode="r"`` (requiere NumPy).
+
+Los lectores son generadores de tuplas ``(arrival, burst, priority)``: las
+filas van directo a la tabla de procesos sin armar listas de diccionarios.
+"""
+import csv
+import json
+import mmap
+import os
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+MAGIC = b"RRTRACE1"
+FIELDS = ("arrival", "burst", "priority")
+
+
+def trace_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    formats = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".rrt": "rrt", ".npy": "npy"}
+    if extension not in formats:
+        raise ValueError(f"Formato de traza desconocido: {extension!r}")
+    return formats[extension]
+
+
+def iter_csv(path):
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader)]
+        arrival = header.index("arrival")
+        burst = header.index("burst")
+        priority = header.index("priority") if "priority" in header else None
+        for row in reader:
+            if not row:
+                continue
+            yield (int(row[arrival]), int(row[burst]),
+                   int(row[priority]) if priority is not None else 0)
+
+
+def iter_jsonl(path):
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield int(record["arrival"]), int(record["burst"]), int(record.get("priority", 0))
+
+
+def iter_rrt(path, chunk=65536):
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} no es una traza .rrt")
+        if os.fstat(f.fileno()).st_size == len(MAGIC):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)[len(MAGIC):]
+            if sys.byteorder == "little":
+                values = view.cast("q")
+                try:
+                    # Se recorre por bloques para no crear un objeto por campo a la vez
+                    for offset in range(0, len(values), 3 * chunk):
+                        block = values[offset:offset + 3 * chunk].tolist()
+                        yield from zip(block[0::3], block[1::3], block[2::3])
+                finally:
+                    values.release()
+                    view.release()
+            else:
+                # El formato es little-endian; en otras plataformas se invierte
+                try:
+                    for offset in range(0, len(view), 24 * chunk):
+                        block = array("q", view[offset:offset + 24 * chunk])
+                        block.byteswap()
+                        yield from zip(block[0::3], block[1::3], block[2::3])
+                finally:
+                    view.release()
+
+
+def iter_npy(path, chunk=65536):
+    if np is None:
+        raise RuntimeError("Leer trazas .npy requiere NumPy")
+    data = np.load(path, mmap_mode="r")
+    if data.ndim != 2 or data.shape[1] not in (2, 3):
+        raise ValueError(f"{path}: se esperaba un arreglo de forma (n, 3)")
+    for offset in range(0, len(data), chunk):
+        block = np.asarray(data[offset:offset + chunk], dtype=np.int64)
+        if block.shape[1] == 2:
+            block = np.column_stack([block, np.zeros(len(block), dtype=np.int64)])
+        yield from map(tuple, block.tolist())
+
+
+READERS = {"csv": iter_csv, "jsonl": iter_jsonl, "rrt": iter_rrt, "npy": iter_npy}
+
+
+def iter_trace(path, fmt=None):
+    # Generador de filas (arrival, burst, priority) de cualquier formato
+    return READERS[fmt or trace_format(path)](path)
+
+
+def load_trace(engine, path, fmt=None):
+    # Agrega todos los procesos de la traza al motor; devuelve cuántos cargó
+    return engine.add_processes(iter_trace(path, fmt))
+
+
+def _rows(table):
+    return zip(table.arrival, table.burst, table.priority)
+
+
+def export_trace(table, path, fmt=None):
+    # Escribe la carga de trabajo de una tabla de procesos en el formato pedido
+    fmt = fmt or trace_format(path)
+    if fmt == "csv":
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            writer.writerows(_rows(table))
+    elif fmt == "jsonl":
+        with open(path, "w") as f:
+            for arrival, burst, priority in _rows(table):
+                f.write(f'{{"arrival": {arrival}, "burst": {burst}, "priority": {priority}}}\n')
+    elif fmt == "rrt":
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            records = array("q")
+            for row in _rows(table):
+                records.extend(row)
+                if len(records) >= 3 * 65536:
+                    _write_le(f, records)
+                    records = array("q")
+            _write_le(f, records)
+    elif fmt == "npy":
+        if np is None:
+            raise RuntimeError("Exportar trazas .npy requiere NumPy")
+        columns = [np.frombuffer(table.arrival, dtype=np.int64),
+                   np.frombuffer(table.burst, dtype=np.int64),
+                   np.frombuffer(table.priority, dtype=np.int32).astype(np.int64)]
+        np.save(path, np.column_stack(columns))
+    else:
+        raise ValueError(f"Formato de traza desconocido: {fmt!r}")
+
+
+def _write_le(f, records):
+    if sys.byteorder != "little":
+        records.byteswap()
+    records.tofile(f)
@@ -0,0 +1,208 @@
+"""Generador de cargas de trabajo sintéticas.
+
+Un Workload describe cómo llegan los procesos y cuánto duran sus ráfagas:
+
+* Llegadas: ``"simultaneous"`` (todos en el instante inicial, como RR
+  Tllegada.py), ``"staggered"`` (una unidad después del anterior, como
+  RR2.py), ``"poisson"`` (tiempos entre llegadas exponenciales con media
+  1 / rate) y ``"bursty"`` (grupos de en promedio ``group`` procesos que
+  llegan juntos; los grupos llegan como un proceso de Poisson con la misma
+  tasa media de procesos).
+* Ráfagas: ``"uniform"`` (enteros en burst_range, 5-15 como el botón de la
+  interfaz), ``"exponential"`` y ``"lognormal"`` (con media burst_mean) y
+  ``"bimodal"`` (mezcla de ráfagas cortas interactivas y largas de lote).
+
+Las columnas se generan por lotes con NumPy (una llamada por columna) y
+engine.add_columns las copia a la tabla de procesos como bloques de bytes,
+así millones de procesos se cargan en segundos. batches() es perezoso: la
+carga completa nunca está en memoria fuera de la tabla del motor. Sin NumPy
+se usa un recorrido equivalente con los flujos de Python (otra secuencia,
+igual de repetible). Cada columna usa su propio flujo de la semilla.
+"""
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+from .streams import RandomStreams
+
+ARRIVALS = ("simultaneous", "staggered", "poisson", "bursty")
+BURSTS = ("uniform", "exponential", "lognormal", "bimodal")
+BATCH = 65536
+
+
+class Workload:
+    def __init__(self, arrivals="simultaneous", bursts="uniform", rate=0.1, group=8,
+                 burst_range=(5, 15), burst_mean=10, sigma=1.0, bimodal=(3, 40, 0.8),
+                 priorities=None, io_burst=0, seed=None):
+        if arrivals not in ARRIVALS:
+            raise ValueError(f"Proceso de llegadas desconocido: {arrivals!r}")
+        if bursts not in BURSTS:
+            raise ValueError(f"Distribución de ráfagas desconocida: {bursts!r}")
+        self.arrivals = arrivals
+        self.bursts = bursts
+        self.rate = rate                # Procesos por unidad de tiempo (poisson, bursty)
+        self.group = group              # Tamaño medio de los grupos (bursty)
+        self.burst_range = burst_range  # Mínimo y máximo (uniform)
+        self.burst_mean = burst_mean    # Media (exponential, lognormal)
+        self.sigma = sigma              # Desvío del logaritmo (lognormal)
+        self.bimodal = bimodal          # (media corta, media larga, fracción de cortas)
+        self.priorities = priorities    # (mínima, máxima) o None para prioridad 0
+        self.io_burst = io_burst        # Media de la ráfaga media de E/S; 0 sin E/S
+        self.streams = seed if isinstance(seed, RandomStreams) else RandomStreams(seed)
+        if np is not None:
+            # Un generador por columna, que avanza de lote en lote
+            self._rng = {name: self.streams.numpy(name)
+                         for name in ("arrivals", "bursts", "priorities", "io_bursts")}
+        self.clock = 0.0                # Tiempo de la última llegada generada
+        self.generated = 0              # Procesos generados hasta ahora
+
+    def batch(self, count, start=None):
+        # Genera los próximos count procesos como diccionario de columnas
+        # (arrival, burst, priority, io_burst); start reinicia el reloj de
+        # llegadas, por ejemplo al tiempo actual del motor
+        if start is not None:
+            self.clock = float(start)
+        if np is not None:
+            columns = self._batch_np(count)
+        else:
+            columns = self._batch_py(count)
+        self.generated += count
+        return columns
+
+    def batches(self, count=None, size=BATCH):
+        # Lotes perezosos hasta completar count procesos (sin fin si es None)
+        while count is None or count > 0:
+            n = size if count is None else min(size, count)
+            yield self.batch(n)
+            if count is not None:
+                count -= n
+
+    def rows(self, count=None, size=BATCH):
+        # Las mismas filas como tuplas (arrival, burst, priority), por ejemplo
+        # para engine.add_processes
+        for columns in self.batches(count, size):
+            # tolist() da enteros de Python tanto para arrays como para NumPy
+            yield from zip(columns["arrival"].tolist(), columns["burst"].tolist(),
+                           columns["priority"].tolist())
+
+    def _batch_np(self, count):
+        rng = self._rng
+        if self.arrivals == "simultaneous":
+            arrival = np.full(count, int(self.clock), dtype=np.int64)
+        elif self.arrivals == "staggered":
+            arrival = np.arange(count, dtype=np.int64) + int(self.clock)
+            self.clock += count
+        else:
+            gaps = rng["arrivals"].exponential(1.0 / self.rate, count)
+            if self.arrivals == "bursty":
+                # Sólo el primero de cada grupo espera; el resto llega con él
+                leaders = rng["arrivals"].random(count) < 1.0 / self.group
+                gaps = np.where(leaders, gaps * self.group, 0.0)
+            times = self.clock + np.cumsum(gaps)
+            arrival = np.floor(times).astype(np.int64)
+            if count:
+                self.clock = float(times[-1])
+
+        if self.bursts == "uniform":
+            low, high = self.burst_range
+            burst = rng["bursts"].integers(low, high + 1, count, dtype=np.int64)
+        else:
+            if self.bursts == "exponential":
+                values = rng["bursts"].exponential(self.burst_mean, count)
+            elif self.bursts == "lognormal":
+                values = rng["bursts"].lognormal(self._mu(), self.sigma, count)
+            else:
+                short, long, fraction = self.bimodal
+                is_short = rng["bursts"].random(count) < fraction
+                values = rng["bursts"].exponential(np.where(is_short, short, long))
+            burst = np.maximum(np.ceil(values), 1).astype(np.int64)
+
+        if self.priorities is None:
+            priority = np.zeros(count, dtype=np.int32)
+        else:
+            low, high = self.priorities
+            priority = rng["priorities"].integers(low, high + 1, count, dtype=np.int32)
+        columns = {"arrival": arrival, "burst": burst, "priority": priority}
+        if self.io_burst:
+            columns["io_burst"] = rng["io_bursts"].integers(1, 2 * self.io_burst, count, dtype=np.int64)
+        return columns
+
+    def _batch_py(self, count):
+        streams = self.streams
+        if self.arrivals == "simultaneous":
+            arrival = array("q", [int(self.clock)]) * count
+        elif self.arrivals == "staggered":
+            arrival = array("q", range(int(self.clock), int(self.clock) + count))
+            self.clock += count
+        else:
+            arrival = array("q")
+            draw = streams.arrivals
+            for _ in range(count):
+                gap = draw.expovariate(self.rate)
+                if self.arrivals == "bursty":
+                    leader = draw.random() < 1.0 / self.group
+                    gap = gap * self.group if leader else 0.0
+                self.clock += gap
+                arrival.append(math.floor(self.clock))
+
+        draw = streams.bursts
+        if self.bursts == "uniform":
+            low, high = self.burst_range
+            burst = array("q", (draw.randint(low, high) for _ in range(count)))
+        else:
+            if self.bursts == "exponential":
+                values = (draw.expovariate(1.0 / self.burst_mean) for _ in range(count))
+            elif self.bursts == "lognormal":
+                mu = self._mu()
+                values = (draw.lognormvariate(mu, self.sigma) for _ in range(count))
+            else:
+                short, long, fraction = self.bimodal
+                values = (draw.expovariate(1.0 / (short if draw.random() < fraction else long))
+                          for _ in range(count))
+            burst = array("q", (max(math.ceil(value), 1) for value in values))
+
+        if self.priorities is None:
+            priority = array("i", [0]) * count
+        else:
+            low, high = self.priorities
+            priority = array("i", (streams.priorities.randint(low, high) for _ in range(count)))
+        columns = {"arrival": arrival, "burst": burst, "priority": priority}
+        if self.io_burst:
+            columns["io_burst"] = array("q", (streams.io_bursts.randint(1, 2 * self.io_burst - 1)
+                                              for _ in range(count)))
+        return columns
+
+    def _mu(self):
+        # Parámetro de la lognormal para que la media sea burst_mean
+        return math.log(self.burst_mean) - self.sigma ** 2 / 2
+
+
+def variant_workload(variant="llegada", seed=None, io_burst=0, **options):
+    # La carga que genera el botón "Agregar Proceso" de cada simulador; las
+    # opciones reemplazan llegadas o ráfagas
+    config = {
+        "arrivals": "staggered" if variant == "rr2" else "simultaneous",
+        "priorities": (1, 5) if variant == "prioridad" else None,
+        "io_burst": io_burst,
+        "seed": seed,
+    }
+    config.update(options)
+    return Workload(**config)
+
+
+def generate_workload(count, variant="llegada", seed=None, io_burst=0):
+    # Devuelve las columnas (arrival, burst, priority, io_burst) de una carga
+    # completa con la misma distribución que build_workload
+    return variant_workload(variant, seed, io_burst).batch(count)
+
+
+def load_workload(engine, count, variant="llegada", seed=None, batch=BATCH, **options):
+    # Genera una carga por lotes y la agrega al motor; por defecto con la
+    # semilla del motor. Devuelve cuántos procesos agregó.
+    io_burst = engine.io.io_burst if engine.io else 0
+    workload = variant_workload(variant, engine.streams if seed is None else seed, io_burst, **options)
+    return sum(engine.add_columns(**columns) for columns in workload.batches(count, batch))
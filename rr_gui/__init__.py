@@ -0,0 +1,6 @@
+"""Vistas de Tkinter y matplotlib compartidas por los simuladores."""
+from .lod import LodGanttView
+from .player import PlaybackRows, Player, PlayerControls
+from .table import VirtualTree
+
+__all__ = ["LodGanttView", "PlaybackRows", "Player", "PlayerControls", "VirtualTree"]
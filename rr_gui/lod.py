@@ -0,0 +1,284 @@
+"""Diagrama de Gantt con zoom, desplazamiento y nivel de detalle.
+
+Agregar cada segmento como una barra no escala: con miles de segmentos el
+dibujo se vuelve una mancha lenta. Esta vista dibuja sólo lo que entra en
+los límites actuales del eje:
+
+* Si en la ventana visible hay pocos segmentos (DETAIL), se dibujan uno por
+  uno, con los del registro de cambios de contexto en gris. La consulta es
+  SegmentLog.window (búsqueda binaria), no un recorrido del registro.
+* Si no, se dibuja la ocupación agregada de OccupancyTiles: por carril y por
+  tramo de tiempo (unos pocos píxeles de ancho), una barra cuya altura es la
+  ocupación media y una envolvente clara hasta la máxima. Con más carriles
+  visibles que MAX_LANES los carriles se agrupan en bandas.
+
+La rueda del mouse acerca o aleja alrededor del cursor (con Ctrl, en el eje
+de los carriles), arrastrar con el botón izquierdo desplaza la vista y el
+doble clic vuelve a mostrar todo y a seguir la simulación. Mientras se
+sigue la simulación el eje del tiempo crece al doble cada vez que se llena.
+
+Con by_core=True hay un carril por CPU y cada proceso tiene su color. Con
+update(..., until=t) sólo se dibuja lo ocurrido hasta t, cortando las barras
+en curso: así el reproductor (player.py) puede mostrar cualquier instante de
+una simulación ya calculada, también hacia atrás.
+"""
+import math
+
+from matplotlib.collections import PolyCollection
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+from rr_engine.tiles import OccupancyTiles
+
+BAR_HEIGHT = 0.8
+OVERHEAD_COLOR = "lightgray"
+# Colores por proceso cuando cada carril es una CPU
+PALETTE = ("tab:purple", "tab:blue", "tab:orange", "tab:green", "tab:red",
+           "tab:brown", "tab:pink", "tab:olive", "tab:cyan", "tab:gray")
+DETAIL = 4000       # Segmentos visibles como máximo para dibujarlos uno por uno
+MAX_LANES = 64      # Carriles visibles antes de agruparlos en bandas
+TILE_PIXELS = 3     # Ancho en píxeles de cada tramo agregado
+ZOOM = 1.25         # Factor de cada paso de la rueda
+
+
+class LodGanttView:
+    def __init__(self, ax, canvas, color="tab:purple", grid_color="gray", by_core=False):
+        self.ax = ax
+        self.canvas = canvas
+        self.color = color
+        self.by_core = by_core
+        self.follow = True      # Los límites siguen a la simulación hasta que se hace zoom
+        self._timeline = None
+        self._overhead = None
+        self._tiles = None
+        self._drawn = (0, 0)    # Largo de los registros en el último dibujo
+        self._lanes = 0         # Carril más alto visto
+        self._scanned = 0       # Segmentos ya revisados para _lanes
+        self._xmax = 0
+        self._until = None      # Último instante a dibujar (None: todo)
+        self._drag = None
+        self._setting = False   # Límites cambiados por la vista, no por el usuario
+        self._envelope = PolyCollection([], facecolors=color, alpha=0.35, edgecolors="none")
+        self._bars = PolyCollection([], facecolors=color)
+        self._costs = PolyCollection([], facecolors=OVERHEAD_COLOR)
+        for collection in (self._envelope, self._bars, self._costs):
+            ax.add_collection(collection, autolim=False)
+        ax.grid(axis="both", linestyle="--", linewidth=0.5, color=grid_color, alpha=0.7)
+        ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.yaxis.set_major_formatter(FuncFormatter(self._lane_label))
+        ax.set_ylim(0, 1)
+        ax.set_xlim(0, 1)
+        ax.callbacks.connect("xlim_changed", self._on_limits)
+        ax.callbacks.connect("ylim_changed", self._on_limits)
+        canvas.mpl_connect("scroll_event", self._on_scroll)
+        canvas.mpl_connect("button_press_event", self._on_press)
+        canvas.mpl_connect("motion_notify_event", self._on_motion)
+        canvas.mpl_connect("button_release_event", self._on_release)
+
+    def _lane_label(self, value, _):
+        lane = int(value)
+        if lane < 1 or lane > self._lanes:
+            return ""
+        return f"CPU {lane - 1}" if self.by_core else f"Proceso {lane}"
+
+    def set_by_core(self, by_core):
+        if by_core != self.by_core:
+            self.by_core = by_core
+            self.reset()
+
+    def reset(self):
+        self._tiles = None
+        self._drawn = (0, 0)
+        self._lanes = 0
+        self._scanned = 0
+        self._xmax = 0
+        self.follow = True
+        for collection in (self._envelope, self._bars, self._costs):
+            collection.set_verts([])
+        self.canvas.draw_idle()
+
+    def update(self, timeline, overhead=None, until=None):
+        # Registra los segmentos nuevos y vuelve a dibujar si cambió algo visible
+        if timeline is not self._timeline:
+            self._timeline = timeline
+            self.reset()
+        self._overhead = overhead
+        sizes = (len(timeline), len(overhead) if overhead is not None else 0)
+        previous, self._until = self._until, until
+        if sizes == self._drawn and until == previous:
+            return
+        lanes = timeline.core if self.by_core else timeline.pid
+        for i in range(self._scanned, len(timeline)):
+            self._lanes = max(self._lanes, lanes[i] + 1 if self.by_core else lanes[i])
+        self._scanned = len(timeline)
+        if len(timeline):
+            self._xmax = max(self._xmax, timeline.end[-1])
+        if overhead is not None and len(overhead):
+            self._xmax = max(self._xmax, overhead.end[-1])
+        limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        if self.follow:
+            # El eje crece al doble para cambiar pocas veces
+            xmax, shown = limits[0][1], self._shown_xmax()
+            self._set_limits((0, max(shown, 2 * xmax) if shown > xmax else xmax),
+                             (0, self._lanes + 1))
+        t0, t1 = self.ax.get_xlim()
+        changed = False
+        if until != previous:
+            # Lo que aparece o desaparece entre un instante y otro, si es visible
+            low, high = sorted(math.inf if x is None else x for x in (until, previous))
+            changed = low < t1 and high > t0
+        t1 = min(t1, until) if until is not None else t1
+        if (changed or limits != (self.ax.get_xlim(), self.ax.get_ylim())
+                or self._touches(timeline, self._drawn[0], t0, t1)
+                or (overhead is not None and self._touches(overhead, self._drawn[1], t0, t1))):
+            self.render()
+        self._drawn = sizes
+
+    def _shown_xmax(self):
+        return min(self._xmax, self._until) if self._until is not None else self._xmax
+
+    def _touches(self, log, drawn, t0, t1):
+        # Si alguno de los segmentos nuevos cae en la ventana visible
+        return any(log.start[i] < t1 and log.end[i] > t0 for i in range(drawn, len(log)))
+
+    def render(self):
+        # Dibuja la ventana visible con el nivel de detalle que corresponda
+        if self._timeline is None:
+            return
+        t0, t1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        first = max(1, math.ceil(min(y0, y1) - 0.5))
+        last = min(self._lanes, math.floor(max(y0, y1) + 0.5))
+        segments = None
+        if last - first < MAX_LANES or np is None:
+            segments = self._timeline.window(t0, self._clip(t1), limit=None if np is None else DETAIL)
+        if segments is not None or last < first:
+            self._draw_detail(segments or [], first, last, t0, t1)
+        else:
+            self._draw_tiles(first, last, t0, t1)
+        self.canvas.draw_idle()
+
+    def _clip(self, t):
+        # Instante t sin pasar de until
+        return min(t, self._until) if self._until is not None else t
+
+    def _lane_column(self, log):
+        return log.core if self.by_core else log.pid
+
+    def _bar(self, lane, x, width, height=BAR_HEIGHT):
+        y = lane - height / 2
+        return [(x, y), (x, y + height), (x + width, y + height), (x + width, y)]
+
+    def _draw_detail(self, segments, first, last, t0, t1):
+        log = self._timeline
+        lanes = self._lane_column(log)
+        offset = 1 if self.by_core else 0
+        verts, colors = [], []
+        for i in segments:
+            lane = lanes[i] + offset
+            if first <= lane <= last:
+                verts.append(self._bar(lane, log.start[i], self._clip(log.end[i]) - log.start[i]))
+                colors.append(PALETTE[log.pid[i] % len(PALETTE)] if self.by_core else self.color)
+        self._bars.set_verts(verts)
+        self._bars.set_facecolors(colors or self.color)
+        self._bars.set_alpha(None)
+        self._envelope.set_verts([])
+        costs = []
+        overhead = self._overhead
+        if overhead is not None and len(overhead):
+            lanes = self._lane_column(overhead)
+            for i in overhead.window(t0, self._clip(t1), limit=DETAIL) or ():
+                lane = lanes[i] + offset
+                if first <= lane <= last:
+                    costs.append(self._bar(lane, overhead.start[i],
+                                           self._clip(overhead.end[i]) - overhead.start[i]))
+        self._costs.set_verts(costs)
+
+    def _draw_tiles(self, first, last, t0, t1):
+        if self._tiles is None or self._tiles.by_core != self.by_core:
+            self._tiles = OccupancyTiles(self._timeline, self.by_core)
+        group = 1
+        while (last - first + 1) / group > MAX_LANES:
+            group *= 2
+        width = self.ax.get_window_extent().width or 800
+        buckets = max(1, int(width / TILE_PIXELS))
+        bands, mean, _, high = self._tiles.tiles(t0, t1, buckets, first, last, group,
+                                                 until=self._until)
+        step = (t1 - t0) / buckets
+        rows, columns = np.nonzero(high > 0)
+        # Centro de cada banda en el eje de carriles; la altura es la ocupación
+        centers = bands[rows] * group + (group + 1) / 2
+        x = t0 + step * columns
+        scale = group * BAR_HEIGHT
+        self._bars.set_verts(_rects(centers, x, step, scale * mean[rows, columns]))
+        self._bars.set_facecolors(self.color)
+        self._envelope.set_verts(_rects(centers, x, step, scale * high[rows, columns]))
+        self._costs.set_verts([])
+
+    def _set_limits(self, xlim, ylim):
+        self._setting = True
+        try:
+            self.ax.set_xlim(*xlim)
+            self.ax.set_ylim(*ylim)
+        finally:
+            self._setting = False
+
+    def _on_limits(self, _):
+        # Límites cambiados desde afuera (por ejemplo la barra de matplotlib)
+        if not self._setting:
+            self.follow = False
+            self.render()
+
+    def _on_scroll(self, event):
+        if event.inaxes is not self.ax:
+            return
+        factor = 1 / ZOOM if event.button == "up" else ZOOM
+        (x0, x1), (y0, y1) = self.ax.get_xlim(), self.ax.get_ylim()
+        if event.key == "control":
+            y = event.ydata
+            ylim = (y - (y - y0) * factor, y + (y1 - y) * factor)
+            xlim = (x0, x1)
+        else:
+            x = event.xdata
+            xlim = (x - (x - x0) * factor, x + (x1 - x) * factor)
+            ylim = (y0, y1)
+        self.follow = False
+        self._set_limits(xlim, ylim)
+        self.render()
+
+    def _on_press(self, event):
+        if event.inaxes is not self.ax or event.button != 1:
+            return
+        if event.dblclick:
+            # Vuelve a mostrar todo y a seguir la simulación
+            self.follow = True
+            self._set_limits((0, max(self._shown_xmax(), 1)), (0, self._lanes + 1))
+            self.render()
+            return
+        self._drag = (event.x, event.y, self.ax.get_xlim(), self.ax.get_ylim())
+
+    def _on_motion(self, event):
+        if self._drag is None or event.x is None:
+            return
+        x, y, (x0, x1), (y0, y1) = self._drag
+        box = self.ax.get_window_extent()
+        dx = (event.x - x) / box.width * (x1 - x0)
+        dy = (event.y - y) / box.height * (y1 - y0)
+        self.follow = False
+        self._set_limits((x0 - dx, x1 - dx), (y0 - dy, y1 - dy))
+        self.render()
+
+    def _on_release(self, _):
+        self._drag = None
+
+
+def _rects(centers, x, width, heights):
+    # Rectángulos (N, 4, 2) centrados en cada carril, de una vez con NumPy
+    bottom, top = centers - heights / 2, centers + heights / 2
+    right = x + width
+    return np.stack([np.column_stack(corner) for corner in
+                     ((x, bottom), (x, top), (right, top), (right, bottom))], axis=1)
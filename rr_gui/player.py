@@ -0,0 +1,370 @@
+"""Reproductor de la simulación manejado por after(), sin hilos ni esperas.
+
+El motor no duerme ni sabe de la animación: calcula por adelantado y la
+ventana reproduce lo ya calculado. En cada cuadro (FRAME_MS) el reproductor
+
+1. hace avanzar el motor, con un presupuesto de BUDGET_MS de tiempo real,
+   hasta un poco más allá de lo que se va a mostrar (LOOKAHEAD segundos de
+   reproducción a la velocidad actual);
+2. mueve la posición de reproducción según el tiempo real transcurrido y la
+   velocidad, en unidades simuladas por segundo (de 1 a 10000, o FASTEST:
+   tan rápido como el motor calcule);
+3. llama a on_frame(t) para que la ventana muestre el estado en el instante
+   t. Los registros del motor sólo crecen, así que el estado en t sale de
+   filtrar por tiempo (process_at, segments_of, running). PlaybackRows da
+   las filas de la tabla en t sin recorrer todos los procesos en cada cuadro.
+
+Tk nunca se bloquea: no hay time.sleep ni root.update. Los controles son
+play, pause, step (hasta el próximo fin de turno) y seek (hacia atrás sin
+recalcular nada; hacia adelante el motor calcula lo que falte en los cuadros
+siguientes). Los procesos que se agregan mientras tanto llegan en el tiempo
+del motor, que puede ir algo adelantado respecto de lo que se muestra.
+
+Cálculo y dibujo comparten el hilo de Tk, con el cálculo acotado a BUDGET_MS
+por cuadro. Así el motor no necesita un hilo propio que le pase cambios a la
+ventana por una cola: ningún widget se toca fuera del hilo principal y los
+segmentos calculados entre dos cuadros se dibujan juntos en un solo
+repintado.
+"""
+import bisect
+import math
+import time
+import tkinter as tk
+from array import array
+from tkinter import ttk
+
+from rr_engine.table import NONE, STATE_NAMES, TERMINADO
+
+FRAME_MS = 33       # ~30 cuadros por segundo
+BUDGET_MS = 20      # Tiempo de cálculo del motor por cuadro
+LOOKAHEAD = 0.5     # Segundos de reproducción que se calculan por adelantado
+FASTEST = math.inf  # Velocidad "tan rápido como se pueda"
+SPEEDS = (1, 10, 100, 1000, 10000, FASTEST)
+
+
+class Player:
+    def __init__(self, root, engine, on_frame, speed=1, frame_ms=FRAME_MS, budget_ms=BUDGET_MS):
+        self.root = root
+        self.engine = engine
+        self.on_frame = on_frame        # on_frame(t) con el instante a mostrar
+        self.speed = speed
+        self.frame_ms = frame_ms
+        self.budget = budget_ms / 1000
+        self.position = 0               # Instante de reproducción pedido
+        self.playing = False
+        self.done = False               # El motor ya no tiene eventos
+        self._clock = time.perf_counter()
+        self._timer = None
+        self._shown = None              # Lo que mostró el último on_frame
+
+    @property
+    def frontier(self):
+        # Hasta dónde calculó el motor
+        return self.engine.time
+
+    @property
+    def time(self):
+        # Instante que se muestra: el pedido, si ya está calculado
+        return min(self.position, self.engine.time)
+
+    def play(self):
+        if self.playing:
+            return
+        if self.done and self.position >= self.engine.time:
+            # Terminada la reproducción, empieza otra vez desde el principio
+            self.position = 0
+        self.playing = True
+        self._clock = time.perf_counter()
+        self._schedule()
+
+    def pause(self):
+        self.playing = False
+
+    def toggle(self):
+        if self.playing:
+            self.pause()
+        else:
+            self.play()
+
+    def set_speed(self, speed):
+        self.speed = speed
+
+    def step(self):
+        # Pausa y avanza hasta el próximo fin de turno, calculándolo si hace falta
+        self.pause()
+        ends = self.engine.timeline.end
+        following = bisect.bisect_right(ends, self.time)
+        while following >= len(ends) and not self.done:
+            if self.engine.step() is None:
+                self.done = True
+        if following < len(ends):
+            self.position = ends[following]
+        self.refresh()
+
+    def seek(self, t):
+        self.position = max(0, t)
+        self._clock = time.perf_counter()
+        self.refresh()
+        self._schedule()
+
+    def add_process(self, *args, **kwargs):
+        # Agregar procesos desde la interfaz: el motor vuelve a tener trabajo
+        index = self.engine.add_process(*args, **kwargs)
+        self.done = False
+        self._schedule()
+        return index
+
+    def add_columns(self, **columns):
+        # Lo mismo para un lote de procesos generado por un Workload
+        count = self.engine.add_columns(**columns)
+        self.done = False
+        self._schedule()
+        return count
+
+    def refresh(self):
+        # Vuelve a mostrar el instante actual aunque no haya cambiado
+        self._shown = None
+        self._show()
+
+    def _wanted(self):
+        # Hasta dónde conviene tener calculado el motor
+        if not self.playing:
+            return self.position
+        if self.speed == FASTEST:
+            return math.inf
+        return self.position + self.speed * LOOKAHEAD
+
+    def _compute(self, deadline):
+        engine = self.engine
+        wanted = self._wanted()
+        while not self.done and engine.time < wanted:
+            if engine.step() is None:
+                self.done = True
+            elif time.perf_counter() > deadline:
+                break
+
+    def _schedule(self):
+        if self._timer is None:
+            self._timer = self.root.after(self.frame_ms, self._tick)
+
+    def _tick(self):
+        self._timer = None
+        now = time.perf_counter()
+        elapsed, self._clock = now - self._clock, now
+        self._compute(now + self.budget)
+        if self.playing:
+            if self.speed == FASTEST:
+                self.position = self.engine.time
+            else:
+                self.position = min(self.position + self.speed * elapsed, self.engine.time)
+            if self.done and self.position >= self.engine.time:
+                self.playing = False
+        self._show()
+        if self.playing or (not self.done and self.engine.time < self.position):
+            self._schedule()
+
+    def _show(self):
+        shown = (self.time, len(self.engine.timeline), len(self.engine.processes))
+        if shown != self._shown:
+            self._shown = shown
+            self.on_frame(shown[0])
+
+    # Estado del motor en el instante que se muestra
+
+    def segments_of(self, index):
+        # Segmentos del proceso que ya terminaron
+        t = self.time
+        ends = self.engine.timeline.end
+        return [segment for segment in self.engine.processes.segment_indices(index)
+                if ends[segment] <= t]
+
+    def process_at(self, index):
+        # (comienzo, fin, retorno, espera, estado) del proceso en el instante
+        # mostrado, con None lo que todavía no ocurrió. Entre turnos queda el
+        # estado con que terminó el último (bloqueado hasta su siguiente turno)
+        t = self.time
+        table = self.engine.processes
+        start = table.start[index]
+        start = start if start != NONE and start <= t else None
+        end = table.end[index]
+        if end != NONE and end <= t:
+            arrival = table.arrival[index]
+            return start, end, end - arrival, end - arrival - table.burst[index], TERMINADO
+        segments = self.segments_of(index)
+        state = self.engine.timeline.state[segments[-1]] if segments else 0
+        return start, None, None, None, STATE_NAMES[state]
+
+    def running(self):
+        # Segmentos en curso en el instante mostrado (uno por CPU ocupada)
+        t = self.time
+        log = self.engine.timeline
+        return [i for i in log.window(t, t + 1) if log.start[i] <= t]
+
+
+class PlaybackRows:
+    # Filas de la tabla en el instante que muestra el reproductor, para
+    # VirtualTree.refresh_count: los procesos que ya llegaron, en orden de
+    # llegada, y con segments=True una sub-fila por cada turno ya terminado
+    # (claves "p<id>" y "s<segmento>"; sin sub-filas la clave es el índice).
+    #
+    # Los procesos se ordenan por llegada sólo cuando se agregan y los que
+    # llegaron se cuentan con una búsqueda binaria. Las filas de cada proceso
+    # (1 + turnos terminados) se suman en un árbol de Fenwick que se corrige
+    # sólo con los segmentos que terminaron, o dejaron de verse, desde el
+    # cuadro anterior. Supone filas sin reutilizar (sin streaming), así el
+    # índice de un proceso es su pid - 1.
+    def __init__(self, player, segments=False):
+        self.player = player
+        self.segments = segments
+        self.count = 0
+        self._order = []            # Índices de la tabla ordenados por llegada
+        self._arrivals = []         # Llegada de cada uno, en ese orden
+        self._position = array("q")  # Índice de la tabla -> posición en _order
+        self._finished = array("q")  # Turnos terminados contados, por índice
+        self._counted = 0           # Segmentos del registro ya contados
+        self._rows = None           # Fenwick de 1 + turnos, en orden de llegada
+
+    def update(self):
+        # Se sincroniza con el instante mostrado y devuelve la cantidad de filas
+        engine = self.player.engine
+        table = engine.processes
+        if len(self._order) != len(table):
+            self._sort(table)
+        t = self.player.time
+        arrived = bisect.bisect_right(self._arrivals, t)
+        if self.segments:
+            self._count_segments(engine.timeline, t)
+            self.count = self._rows.prefix(arrived)
+        else:
+            self.count = arrived
+        return self.count
+
+    def key(self, position):
+        if not self.segments:
+            return self._order[position]
+        process, offset = self._rows.find(position)
+        index = self._order[process]
+        if offset == 0:
+            return f"p{index + 1}"
+        return f"s{self.player.engine.processes.segment_indices(index)[offset - 1]}"
+
+    def _sort(self, table):
+        # Procesos nuevos: se vuelve a ordenar (los agrega la interfaz, pocas veces)
+        arrival = table.arrival
+        self._order = sorted(range(len(table)), key=arrival.__getitem__)
+        self._arrivals = [arrival[index] for index in self._order]
+        self._position = array("q", bytes(8 * len(table)))
+        for position, index in enumerate(self._order):
+            self._position[index] = position
+        self._finished.extend(array("q", bytes(8 * (len(table) - len(self._finished)))))
+        if self.segments:
+            self._rows = _Fenwick([1 + self._finished[index] for index in self._order])
+
+    def _count_segments(self, log, t):
+        # Los fines del registro están en orden: los turnos terminados en t son un prefijo
+        shown = bisect.bisect_right(log.end, t)
+        if abs(shown - self._counted) > len(self._order):
+            # Salto grande (búsqueda lejana): se cuenta todo de nuevo
+            self._finished = array("q", bytes(8 * len(self._order)))
+            for pid in log.pid[:shown]:
+                self._finished[pid - 1] += 1
+            self._rows = _Fenwick([1 + self._finished[index] for index in self._order])
+        elif shown > self._counted:
+            for pid in log.pid[self._counted:shown]:
+                self._finished[pid - 1] += 1
+                self._rows.add(self._position[pid - 1], 1)
+        else:
+            for pid in log.pid[shown:self._counted]:
+                self._finished[pid - 1] -= 1
+                self._rows.add(self._position[pid - 1], -1)
+        self._counted = shown
+
+
+class _Fenwick:
+    # Sumas de prefijos con actualización puntual, ambas en O(log n)
+    def __init__(self, values):
+        self._tree = [0] + values
+        size = len(values)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                self._tree[parent] += self._tree[i]
+
+    def add(self, position, delta):
+        i = position + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix(self, count):
+        # Suma de los primeros count valores
+        total = 0
+        while count:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def find(self, row):
+        # (posición, desplazamiento) del valor que contiene la fila row
+        position, step = 0, 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            following = position + step
+            if following < len(self._tree) and self._tree[following] <= row:
+                position = following
+                row -= self._tree[following]
+            step >>= 1
+        return position, row
+
+
+class PlayerControls(tk.Frame):
+    # Botones de reproducción, velocidad, barra de posición y tiempo mostrado
+    def __init__(self, parent, player, bg="lightgray"):
+        super().__init__(parent, bg=bg)
+        self.player = player
+        self._dragging = False
+        self.pause_button = tk.Button(self, text="Pausa", command=self.toggle)
+        self.pause_button.pack(side=tk.LEFT, padx=5)
+        tk.Button(self, text="Paso", command=player.step).pack(side=tk.LEFT, padx=5)
+        tk.Label(self, text="Velocidad:", bg=bg).pack(side=tk.LEFT)
+        self.speed_box = ttk.Combobox(self, values=[_speed_label(s) for s in SPEEDS],
+                                      width=7, state="readonly")
+        self.speed_box.set(_speed_label(player.speed))
+        self.speed_box.bind("<<ComboboxSelected>>", self._on_speed)
+        self.speed_box.pack(side=tk.LEFT, padx=5)
+        # Arrastrar la barra busca ese instante; el comando de Scale no se usa
+        # porque también se dispara cuando la posición cambia sola
+        self.scale = tk.Scale(self, from_=0, to=1, orient=tk.HORIZONTAL, showvalue=False,
+                              length=200, bg=bg, highlightthickness=0)
+        self.scale.bind("<ButtonPress-1>", self._on_press)
+        self.scale.bind("<ButtonRelease-1>", self._on_release)
+        self.scale.bind("<B1-Motion>", lambda event: self.player.seek(self.scale.get()))
+        self.scale.pack(side=tk.LEFT, padx=5)
+        self.time_label = tk.Label(self, text="t = 0", bg=bg, width=18, anchor=tk.W)
+        self.time_label.pack(side=tk.LEFT)
+
+    def toggle(self):
+        self.player.toggle()
+        self.update_controls()
+
+    def _on_speed(self, _):
+        self.player.set_speed(SPEEDS[self.speed_box.current()])
+
+    def _on_press(self, _):
+        self._dragging = True
+
+    def _on_release(self, _):
+        self._dragging = False
+        self.player.seek(self.scale.get())
+
+    def update_controls(self):
+        # Llamar en cada on_frame
+        player = self.player
+        self.pause_button.config(text="Pausa" if player.playing else "Reproducir")
+        if not self._dragging:
+            self.scale.config(to=max(player.frontier, 1))
+            self.scale.set(player.time)
+        self.time_label.config(text=f"t = {player.time:g} / {player.frontier:g}")
+
+
+def _speed_label(speed):
+    return "Máx" if speed == FASTEST else f"{speed}x"
@@ -0,0 +1,98 @@
+"""Tabla de procesos virtualizada para ttk.Treeview.
+
+Antes cada actualización borraba todas las filas y volvía a insertarlas.
+VirtualTree mantiene un identificador estable por fila (proceso o segmento),
+sólo toca las filas cuyo contenido cambió y únicamente crea ítems para las
+filas visibles: la barra de desplazamiento se maneja a mano y mueve una
+ventana sobre la lista completa de claves. Con refresh_count ni siquiera hace
+falta esa lista: alcanza con la cantidad de filas y una función que da la
+clave de cada posición, que sólo se llama para las visibles.
+"""
+from tkinter import ttk
+
+
+class VirtualTree:
+    def __init__(self, tree, scrollbar=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self._count = 0
+        self._key_at = None
+        self._row = None
+        self._offset = 0
+        self._shown = {}        # iid -> (valores, etiquetas) mostrados
+        if scrollbar is not None:
+            scrollbar.config(command=self._on_scroll)
+        tree.bind("<MouseWheel>", self._on_wheel)
+        tree.bind("<Button-4>", lambda event: self.scroll(-3))
+        tree.bind("<Button-5>", lambda event: self.scroll(3))
+        tree.bind("<Configure>", lambda event: self._render())
+
+    def visible_rows(self):
+        # Filas que caben en el widget (descontando el encabezado)
+        rowheight = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        fitted = self.tree.winfo_height() // rowheight - 1
+        return max(int(self.tree.cget("height")), fitted)
+
+    def refresh(self, keys, row):
+        # keys: secuencia con la clave de cada fila, en orden.
+        # row(clave) -> (valores, etiquetas) de esa fila; sólo se llama para
+        # las filas visibles.
+        self.refresh_count(len(keys), keys.__getitem__, row)
+
+    def refresh_count(self, count, key_at, row):
+        # count filas; key_at(posición) -> clave de esa fila. Las dos
+        # funciones sólo se llaman para las filas visibles.
+        self._count = count
+        self._key_at = key_at
+        self._row = row
+        self._render()
+
+    def scroll(self, rows):
+        self._offset += rows
+        self._render()
+
+    def _render(self):
+        if self._row is None:
+            return
+        total = self._count
+        height = self.visible_rows()
+        self._offset = max(0, min(self._offset, total - height))
+        window = [self._key_at(position)
+                  for position in range(self._offset, min(self._offset + height, total))]
+        wanted = {str(key): key for key in window}
+
+        # Filas que salieron de la ventana
+        for iid in [iid for iid in self._shown if iid not in wanted]:
+            self.tree.delete(iid)
+            del self._shown[iid]
+
+        for position, (iid, key) in enumerate(wanted.items()):
+            values, tags = self._row(key)
+            shown = self._shown.get(iid)
+            if shown is None:
+                self.tree.insert("", position, iid=iid, values=values, tags=tags)
+            else:
+                if shown != (values, tags):
+                    self.tree.item(iid, values=values, tags=tags)
+                if self.tree.index(iid) != position:
+                    self.tree.move(iid, "", position)
+            self._shown[iid] = (values, tags)
+
+        if self.scrollbar is not None:
+            if total:
+                self.scrollbar.set(self._offset / total, (self._offset + len(window)) / total)
+            else:
+                self.scrollbar.set(0, 1)
+
+    def _on_scroll(self, action, amount, unit=None):
+        total = self._count
+        if action == "moveto":
+            self._offset = int(float(amount) * total)
+        elif unit == "pages":
+            self._offset += int(amount) * self.visible_rows()
+        else:
+            self._offset += int(amount)
+        self._render()
+
+    def _on_wheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)
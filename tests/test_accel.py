@@ -0,0 +1,35 @@
+"""El núcleo de accel (sin compilar) contra RoundRobinEngine.run()."""
+import pytest
+
+from rr_engine import accel
+from rr_engine.engine import VARIANTS, build_workload, make_engine
+
+pytest.importorskip("numpy")
+
+COSTS = [{}, {"switch_cost": 2, "dispatch_latency": 1}]
+
+
+def _engine(variant, **options):
+    engine = make_engine(variant, seed=11, quantum=4, block_prob=0.2, **options)
+    build_workload(engine, 60, variant)
+    return engine
+
+
+def _result(engine):
+    # Todo lo que deja una corrida: tabla, segmentos, costos, reloj y generador
+    return (engine.time,
+            [list(column) for column in engine.processes._columns()],
+            [list(column) for column in engine.timeline._columns()],
+            [list(column) for column in engine.overhead._columns()],
+            engine.rng.getstate())
+
+
+@pytest.mark.parametrize("costs", COSTS)
+@pytest.mark.parametrize("variant", sorted(VARIANTS))
+def test_kernel_matches_engine(variant, costs):
+    expected = _engine(variant, **costs).run()
+    engine = _engine(variant, **costs)
+    if variant in ("rr2", "llegada"):
+        assert accel.unsupported(engine) is None
+    # chunk chico: el núcleo pausa y retoma muchas veces
+    assert _result(accel.run(engine, chunk=7, force=True)) == _result(expected)
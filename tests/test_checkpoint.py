@@ -0,0 +1,74 @@
+"""Reanudar desde un punto de control da la misma corrida que sin cortes."""
+import pytest
+
+from rr_engine.checkpoint import Checkpoints
+from rr_engine.devices import IoModel
+from rr_engine.engine import make_engine
+from rr_engine.workload import load_workload
+
+CONFIGS = {
+    "cores": ("llegada", {"cores": 3}),
+    "percore": ("llegada", {"cores": 3, "queueing": "percore"}),
+    "mlfq": ("mlfq", {"boost": 40}),
+    "heap-aging": ("prioridad", {"priority_queue": "heap", "aging": 10}),
+    "adaptive": ("llegada", {"adaptive": "median", "max_quantum": 12}),
+    "io": ("rr2", {"devices": 2, "block_prob": 0.3}),
+    "coalesce": ("llegada", {"coalesce": True, "switch_cost": 1}),
+}
+
+
+def _engine(name):
+    variant, options = CONFIGS[name]
+    options = dict(options)
+    # Cada motor con sus propios dispositivos
+    if "devices" in options:
+        options["io"] = IoModel(options.pop("devices"), 4)
+    engine = make_engine(variant, seed=5, **options)
+    load_workload(engine, 80, variant)
+    return engine
+
+
+def _result(engine):
+    return (engine.time, engine.results(),
+            [list(column) for column in engine.timeline._columns()],
+            [list(column) for column in engine.overhead._columns()],
+            engine.streams.getstate())
+
+
+@pytest.mark.parametrize("name", sorted(CONFIGS))
+def test_resume_and_seek_match_uninterrupted_run(name, tmp_path):
+    expected = _result(_engine(name).run())
+    checkpoints = Checkpoints(every=50)
+    on_disk = Checkpoints(every=50, directory=tmp_path)
+    engine = _engine(name)
+    engine.run(checkpoints=checkpoints)
+    _engine(name).run(checkpoints=on_disk)
+    assert _result(engine) == expected
+    assert len(checkpoints) > 2
+    end = engine.time
+    for t in (0, 75, end // 2, end):
+        assert _result(checkpoints.resume(t).run()) == expected
+        assert _result(checkpoints.seek(t).run()) == expected
+        assert _result(on_disk.resume(t).run()) == expected
+
+
+def test_directory_reload_keeps_cadence(tmp_path):
+    expected = Checkpoints(every=70)
+    _engine("cores").run(checkpoints=expected)
+    first = Checkpoints(every=70, directory=tmp_path)
+    _engine("cores").run(until=300, checkpoints=first)
+    # Otra sesión retoma desde el directorio y sigue con los mismos instantes
+    again = Checkpoints(every=70, directory=tmp_path)
+    again.resume().run(checkpoints=again)
+    assert list(again.times) == list(expected.times)
+
+
+def test_directory_rejects_another_run(tmp_path):
+    _engine("cores").run(until=300, checkpoints=Checkpoints(every=70, directory=tmp_path))
+    other = make_engine("llegada", seed=6, cores=3)
+    load_workload(other, 80)
+    with pytest.raises(ValueError):
+        other.run(checkpoints=Checkpoints(every=70, directory=tmp_path))
+    (tmp_path / "run.json").unlink()
+    with pytest.raises(ValueError):
+        Checkpoints(every=70, directory=tmp_path)
@@ -0,0 +1,49 @@
+"""Métricas de la corrida: con y sin NumPy dan lo mismo."""
+import pytest
+
+from rr_engine import metrics
+from rr_engine.engine import make_engine
+from rr_engine.metrics import SegmentProgress, segment_progress, summarize
+from rr_engine.workload import load_workload
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def finished():
+    engine = make_engine("prioridad", seed=8, cores=2, switch_cost=1)
+    load_workload(engine, 150, "prioridad")
+    return engine.run()
+
+
+def test_summarize_without_numpy(finished, monkeypatch):
+    expected = summarize(finished)
+    monkeypatch.setattr(metrics, "np", None)
+    summary = summarize(finished)
+    # Los percentiles pueden diferir en el último bit al interpolar
+    for key in ("turnaround", "waiting", "response"):
+        assert summary.pop(key) == pytest.approx(expected.pop(key))
+    assert summary == expected
+
+
+def test_summarize_counts(finished):
+    summary = summarize(finished)
+    assert summary["processes"] == summary["finished"] == 150
+    assert summary["busy"] == sum(finished.processes.burst)
+    assert summary["turnaround"]["mean"] >= summary["waiting"]["mean"]
+
+
+def test_segment_progress(finished, monkeypatch):
+    log = finished.timeline
+    executed = {}
+    expected = []
+    for pid, start, end in zip(log.pid, log.start, log.end):
+        executed[pid] = executed.get(pid, 0) + end - start
+        arrival = finished.processes.arrival[pid - 1]
+        expected.append((executed[pid], end - arrival, end - arrival - executed[pid]))
+    assert [tuple(map(int, row)) for row in zip(*segment_progress(finished))] == expected
+    progress = SegmentProgress()
+    progress.update(log)
+    assert list(progress.executed) == [row[0] for row in expected]
+    monkeypatch.setattr(metrics, "np", None)
+    assert list(zip(*segment_progress(finished))) == expected
@@ -0,0 +1,32 @@
+"""MLFQ: baja de nivel al agotar el quantum, se queda arriba al bloquearse
+y el reinicio periódico devuelve todos al nivel más alto."""
+from rr_engine.engine import make_engine
+
+
+def _slices(block_prob=0.0, boost=0, burst=60):
+    engine = make_engine("mlfq", quantum=2, levels=3, block_prob=block_prob, boost=boost)
+    engine.add_process(burst)
+    engine.run()
+    return [end - start for start, end in zip(engine.timeline.start, engine.timeline.end)], engine
+
+
+def test_demotion_doubles_quantum():
+    slices, engine = _slices()
+    # Niveles 0, 1 y 2: quantum 2, 4 y 8; el último nivel no baja más
+    assert slices[:5] == [2, 4, 8, 8, 8]
+    assert engine.processes.level[0] == 2
+
+
+def test_blocking_process_stays_on_top():
+    slices, engine = _slices(block_prob=1.0, burst=10)
+    assert slices == [1] * 10
+    assert engine.processes.level[0] == 0
+
+
+def test_boost_resets_demoted():
+    without, _ = _slices()
+    slices, _ = _slices(boost=20)
+    # El reinicio en t = 20 lo sube al nivel 0 durante un turno de 8; al
+    # agotarlo baja al nivel 1 y el turno siguiente es de 4
+    assert (8, 4) not in zip(without, without[1:])
+    assert (8, 4) in zip(slices, slices[1:])
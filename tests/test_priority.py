@@ -0,0 +1,42 @@
+"""Prioridad estricta sobre el montículo, con y sin envejecimiento."""
+from array import array
+
+from rr_engine.engine import make_engine
+from rr_engine.metrics import starvation
+from rr_engine.queues import PriorityHeapQueue
+
+
+def test_heap_order():
+    queue = PriorityHeapQueue(array("i", [3, 1, 3, 2]), lambda: 0)
+    for index in range(4):
+        queue.push(index)
+    # Mejor prioridad primero y, a igual prioridad, el que se encoló antes
+    assert [queue.pop() for _ in range(4)] == [1, 3, 0, 2]
+    assert queue.pop() is None
+
+
+def test_aging_lifts_waiting_process():
+    # Con aging=10, 30 unidades de espera valen 3 niveles: el de prioridad 5
+    # encolado en 0 le gana al de prioridad 1 que llega en 50, no al de 30
+    for arrival, first in ((30, 1), (50, 0)):
+        now = [0]
+        queue = PriorityHeapQueue(array("i", [5, 1]), lambda: now[0], aging=10)
+        queue.push(0)
+        now[0] = arrival
+        queue.push(1)
+        assert queue.pop() == first
+
+
+def _max_wait_of_low_priority(aging):
+    # Un proceso de prioridad 5 contra un flujo continuo de prioridad 1
+    engine = make_engine("prioridad", block_prob=0, quantum=3, priority_queue="heap", aging=aging)
+    engine.add_process(10, arrival=0, priority=5)
+    for i in range(100):
+        engine.add_process(3, arrival=3 * i, priority=1)
+    engine.run()
+    return starvation(engine.processes)[5]["max_wait"]
+
+
+def test_aging_bounds_starvation():
+    assert _max_wait_of_low_priority(0) >= 290
+    assert _max_wait_of_low_priority(20) <= 100
@@ -0,0 +1,81 @@
+"""Consultas del registro de segmentos y unión de turnos contiguos."""
+import pytest
+
+from rr_engine import table as table_module
+from rr_engine.engine import VARIANTS, make_engine
+from rr_engine.table import SegmentLog
+from rr_engine.workload import load_workload
+
+
+@pytest.fixture(scope="module")
+def log():
+    engine = make_engine("llegada", seed=17, cores=3, block_prob=0.3)
+    load_workload(engine, 120)
+    return engine.run().timeline
+
+
+def _brute_window(log, t0, t1):
+    return [i for i in range(len(log)) if log.start[i] < t1 and log.end[i] > t0]
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_window(log, numpy, monkeypatch):
+    if not numpy:
+        monkeypatch.setattr(table_module, "np", None)
+    end = log.end[-1]
+    for t0 in range(0, end, end // 17):
+        for width in (1, 7, end // 5, end):
+            assert log.window(t0, t0 + width) == _brute_window(log, t0, t0 + width)
+    assert log.window(0, end, limit=10) is None
+
+
+def test_window_unordered():
+    log = SegmentLog()
+    for pid, start, end in ((1, 0, 10), (2, 12, 14), (3, 2, 11), (1, 20, 30)):
+        log.append(pid, start, end, 0, -1)
+    assert log.window(10, 13) == [1, 2]
+    assert log.window(14, 20) == []
+
+
+def test_of_pid(log):
+    # Sobre una copia, para agregarle segmentos sin tocar el registro compartido
+    copy = SegmentLog()
+    copy.extend(*log._columns())
+    log = copy
+    pids = sorted(set(log.pid))
+    for pid in pids[:10]:
+        assert log.of_pid(pid) == [i for i, p in enumerate(log.pid) if p == pid]
+    # El índice por pid se completa con los segmentos agregados después
+    log.append(pids[0], log.end[-1], log.end[-1] + 1, 0, -1)
+    assert log.of_pid(pids[0])[-1] == len(log) - 1
+    assert log.of_pid(10 ** 9) == []
+
+
+def test_coalesce_append():
+    log = SegmentLog(coalesce=True)
+    log.append(1, 0, 5, 0, -1)
+    assert log.append(1, 5, 9, 0, -1) == 0          # Contiguo: se une
+    assert log.append(1, 9, 12, 0, -1, core=1) == 1  # Otra CPU
+    assert log.append(1, 13, 15, 0, -1, core=1) == 2  # Con pausa
+    assert log.append(2, 15, 16, 0, -1, core=1) == 3  # Otro proceso
+    assert list(log.end) == [9, 12, 15, 16]
+    assert log.max_length == 9
+
+
+@pytest.mark.parametrize("variant", sorted(VARIANTS))
+def test_coalesce_keeps_results(variant):
+    runs = []
+    for coalesce in (False, True):
+        # Pocos procesos largos para dos CPUs: muchos turnos siguen al anterior
+        engine = make_engine(variant, seed=2, cores=2, coalesce=coalesce)
+        for burst, arrival, priority in ((40, 0, 2), (12, 3, 1), (30, 20, 1), (25, 90, 3)):
+            engine.add_process(burst, arrival=arrival, priority=priority)
+        runs.append(engine.run())
+    plain, joined = runs
+    assert joined.results() == plain.results()
+    assert len(joined.timeline) < len(plain.timeline)
+    # Cada proceso ocupó la CPU el mismo tiempo, en menos segmentos
+    for pid in set(plain.timeline.pid):
+        assert (sum(plain.timeline.end[i] - plain.timeline.start[i] for i in plain.timeline.of_pid(pid))
+                == sum(joined.timeline.end[i] - joined.timeline.start[i]
+                       for i in joined.timeline.of_pid(pid)))
@@ -0,0 +1,40 @@
+"""El modo streaming da las mismas métricas que la corrida en memoria."""
+import pytest
+
+from rr_engine.engine import FINISHED_FIELDS, VARIANTS, make_engine
+from rr_engine.metrics import summarize
+from rr_engine.streaming import run_stream
+from rr_engine.workload import load_workload, variant_workload
+
+EXACT = ("finished", "makespan", "busy", "overhead", "context_switches", "throughput",
+         "cpu_utilization", "overhead_fraction", "quantum")
+
+
+@pytest.mark.parametrize("cores", [1, 2])
+@pytest.mark.parametrize("variant", sorted(VARIANTS))
+def test_streaming_matches_memory(variant, cores):
+    options = {"seed": 13, "cores": cores, "switch_cost": 1, "adaptive": "median"}
+    memory = make_engine(variant, **options)
+    load_workload(memory, 400, variant)
+    memory.run()
+    expected = summarize(memory)
+
+    engine = make_engine(variant, **options)
+    finished = []
+    # flush chico: el registro y el historial del quantum se vacían muchas veces
+    summary = run_stream(engine, variant_workload(variant, engine.streams).rows(400),
+                         finished.append, flush=16).summary()
+    for key in EXACT:
+        assert summary[key] == expected[key], key
+    assert summary["segments"] == len(memory.timeline)
+    for key in ("turnaround", "waiting", "response"):
+        assert summary[key]["mean"] == pytest.approx(expected[key]["mean"])
+        assert summary[key]["max"] == expected[key]["max"]
+        # Percentiles del histograma: error relativo acotado por su precisión
+        assert summary[key]["p95"] == pytest.approx(expected[key]["p95"], rel=0.02, abs=1)
+
+    # Cada proceso terminado sale por el sink con los mismos valores
+    rows = {record[0]: dict(zip(FINISHED_FIELDS, record)) for record in finished}
+    assert len(rows) == len(memory.processes)
+    for result in memory.results():
+        assert rows[result["id"]] == {field: result[field] for field in FINISHED_FIELDS}
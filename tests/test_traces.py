@@ -0,0 +1,40 @@
+"""Exportar una carga y volver a cargarla la deja igual, en cada formato."""
+import pytest
+
+from rr_engine.engine import make_engine
+from rr_engine.traces import export_trace, iter_rrt, iter_trace, load_trace
+from rr_engine.workload import load_workload
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional
+    numpy = None
+
+FORMATS = ["csv", "jsonl", "rrt",
+           pytest.param("npy", marks=pytest.mark.skipif(numpy is None, reason="requiere NumPy"))]
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_round_trip(fmt, tmp_path):
+    original = make_engine("prioridad", seed=21)
+    load_workload(original, 200, "prioridad")
+    rows = list(zip(original.processes.arrival, original.processes.burst,
+                    original.processes.priority))
+    path = str(tmp_path / f"carga.{fmt}")
+    export_trace(original.processes, path)
+    assert list(iter_trace(path)) == rows
+
+    # La misma carga corre igual cargada desde la traza
+    loaded = make_engine("prioridad", seed=21)
+    assert load_trace(loaded, path) == len(rows)
+    assert loaded.run().results() == original.run().results()
+
+
+def test_rrt_blocks(tmp_path):
+    engine = make_engine("llegada", seed=3)
+    load_workload(engine, 50)
+    path = str(tmp_path / "carga.rrt")
+    export_trace(engine.processes, path)
+    # Bloques más chicos que la traza: las filas no se cortan entre bloques
+    assert list(iter_rrt(path, chunk=7)) == list(iter_trace(path))
+    assert len(list(iter_rrt(path, chunk=7))) == 50